@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+'''Compare finding the frames of 1000 animated sprites with an Animation each against one AnimationPlayer'''
+
+import os, time
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+from pygame_tools import *
+
+SPRITES = 1000
+FRAMES = 300
+FRAME_DATA = [100, 80, 120, 60, 100, 90, 110, 70]
+
+def main():
+    pygame.init()
+    surfaces = [pygame.Surface((16, 16)) for _ in FRAME_DATA]
+
+    animations = []
+    for i in range(SPRITES):
+        animation = Animation(None, FRAME_DATA)
+        animation.set_frames(surfaces, FRAME_DATA)
+        animation.seek(i * 37)
+        animations.append(animation)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        for animation in animations:
+            animation.update(16.7)
+            animation.get_surface()
+    print(f'{"Animation":>15} {(time.perf_counter() - start) / FRAMES * 1000:.3f} ms/frame')
+
+    player = AnimationPlayer(animations[0])
+    starts = [player.start(i * 37) for i in range(SPRITES)]
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        player.update(16.7)
+        for sprite_start in starts:
+            player.get_surface(sprite_start)
+    print(f'{"AnimationPlayer":>15} {(time.perf_counter() - start) / FRAMES * 1000:.3f} ms/frame')
+
+    starts = np.array(starts)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        player.update(16.7)
+        frames = player.frames
+        [frames[i] for i in player.get_frame_indices(starts)]
+    print(f'{"vectorized":>15} {(time.perf_counter() - start) / FRAMES * 1000:.3f} ms/frame')
+
+if __name__ == '__main__':
+    main()
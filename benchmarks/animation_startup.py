@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+'''Compare the startup time of a scene with 200 Animations over 20 frame sets, the original loading against the AssetCache and sprite sheets'''
+
+import os, math, time, tempfile
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+from pygame_tools import *
+
+SETS = 20
+FRAMES = 30
+INSTANCES = 200
+BLITS = 50
+
+def make_frames(directory: str) -> tuple[list[str], list[str]]:
+    '''save {SETS} animations of {FRAMES} 64x64 frames, as files and as sprite sheets, return their glob paths and sheet paths'''
+    glob_paths = []
+    sheet_paths = []
+    for s in range(SETS):
+        os.mkdir(os.path.join(directory, str(s)))
+        sheet = pygame.Surface((64 * 10, 64 * math.ceil(FRAMES / 10)), SRCALPHA)
+        for f in range(FRAMES):
+            surface = pygame.Surface((64, 64), SRCALPHA)
+            pygame.draw.circle(surface, (s * 12, f * 8, 200, 255), (32, 32), 10 + f % 20)
+            pygame.image.save(surface, os.path.join(directory, str(s), f'{f:02}.png'))
+            sheet.blit(surface, (f % 10 * 64, f // 10 * 64))
+        glob_paths.append(os.path.join(directory, str(s), '*.png'))
+        sheet_paths.append(os.path.join(directory, f'{s}.png'))
+        pygame.image.save(sheet, sheet_paths[-1])
+    return glob_paths, sheet_paths
+
+class OriginalAnimation(Animation):
+    '''the original Animation.load'''
+    def load(self, glob_path: str, frame_data: list[int]):
+        file_names = glob(glob_path)
+        self.frames = [(pygame.image.load(file_name), frame_data[i]) for i, file_name in enumerate(file_names)]
+        self.frame_count = len(self.frames)
+        self.frame_index = 0
+        self.frames_until_next = self.frames[0][1]
+
+def time_blits(screen: pygame.Surface, animations: list[Animation]) -> float:
+    start = time.perf_counter()
+    for _ in range(BLITS):
+        for animation in animations:
+            screen.blit(animation.get_surface(), (0, 0))
+    return (time.perf_counter() - start) / BLITS * 1000
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((640, 480))
+    with tempfile.TemporaryDirectory() as directory:
+        glob_paths, sheet_paths = make_frames(directory)
+        frame_data = [3] * FRAMES
+        start = time.perf_counter()
+        animations = [OriginalAnimation(glob_paths[i % SETS], frame_data) for i in range(INSTANCES)]
+        print(f'{"original":>9} startup {(time.perf_counter() - start) * 1000:8.1f} ms  blit {time_blits(screen, animations):.3f} ms/frame')
+
+        cache = AssetCache()
+        start = time.perf_counter()
+        animations = [Animation(glob_paths[i % SETS], frame_data, cache = cache) for i in range(INSTANCES)]
+        print(f'{"cached":>9} startup {(time.perf_counter() - start) * 1000:8.1f} ms  blit {time_blits(screen, animations):.3f} ms/frame')
+
+        cache = AssetCache()
+        start = time.perf_counter()
+        cache.preload([file_name for glob_path in glob_paths for file_name in glob(glob_path)])
+        while cache.get_progress() < 1: # a loading screen would draw here
+            time.sleep(0.001)
+        animations = [Animation(glob_paths[i % SETS], frame_data, cache = cache) for i in range(INSTANCES)]
+        print(f'{"preloaded":>9} startup {(time.perf_counter() - start) * 1000:8.1f} ms')
+
+        cache = AssetCache()
+        start = time.perf_counter()
+        animations = [Animation.from_sprite_sheet(sheet_paths[i % SETS], (64, 64), frame_data, cache = cache) for i in range(INSTANCES)]
+        print(f'{"sheet":>9} startup {(time.perf_counter() - start) * 1000:8.1f} ms  blit {time_blits(screen, animations):.3f} ms/frame')
+
+if __name__ == '__main__':
+    main()
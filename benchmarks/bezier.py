@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+
+'''Compare evaluating a quadratic bezier curve point by point against the cached basis'''
+
+import timeit
+from pygame_tools import *
+
+NUMBER = 2_000
+
+def reference(p0: Point, p1: Point, p2: Point, density: int) -> list[Point]:
+    '''the original per point loop'''
+    result = []
+    for i in range(density + 1):
+        t = i / density
+        result.append(Point(
+            (1 - t) ** 2 * p0.x + 2 * (1 - t) * t * p1.x + t ** 2 * p2.x,
+            (1 - t) ** 2 * p0.y + 2 * (1 - t) * t * p1.y + t ** 2 * p2.y
+        ))
+    return result
+
+def main():
+    p0, p1, p2 = Point(0, 300), Point(0, 0), Point(150, 75)
+    cases = [
+        ('loop', lambda: reference(p0, p1, p2, 100)),
+        ('basis, list', lambda: get_bezier_curve_points(p0, p1, p2, 100)),
+        ('basis, array', lambda: get_bezier_curve_points(p0, p1, p2, 100, True)),
+        ('flatten, array', lambda: flatten_bezier((p0, p1, p2), 0.5, as_array = True)),
+    ]
+    print(f'{"density 100":>15} {"us/call":>8}')
+    for name, function in cases:
+        seconds = min(timeit.repeat(function, number = NUMBER, repeat = 3))
+        print(f'{name:>15} {seconds / NUMBER * 1e6:>8.1f}')
+    print(f'flatten picked density {get_bezier_density((p0, p1, p2))}')
+
+if __name__ == '__main__':
+    main()
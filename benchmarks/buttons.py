@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+
+'''Compare drawing a menu of 30 buttons the original way against the cached surfaces'''
+
+import os, time
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+from pygame_tools import *
+
+FRAMES = 200
+
+def old_button_draw(button: Button, screen: pygame.Surface, override_highlight: bool = None):
+    '''the original Button.draw'''
+    pygame.draw.rect(screen, button.clicked_color if button.clicked else button.highlight_color if (override_highlight == None and button.highlight) or override_highlight else button.rect_color, button.rect, button.rect_line_width, button.border_radius)
+    if button.border_size > 0:
+        pygame.draw.rect(screen, button.border_color, button.rect, button.border_size, button.border_radius)
+    text_obj = button.font.render(button.text, button.antialias, button.font_color)
+    text_size = text_obj.get_size()
+    screen.blit(text_obj, (button.rect.centerx - text_size[0] / 2, button.rect.centery - text_size[1] / 2))
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((600, 800))
+    font = pygame.font.Font(None, 24)
+    for style, kwargs in (('square', {}), ('rounded', {'border_radius': 6, 'border_size': 2})):
+        buttons = [
+            Button(None, f'Menu option number {i}', Rect(20, 10 + i * 26, 560, 24), font, **kwargs)
+            for i in range(30)
+        ]
+        for name, draw in (('original', old_button_draw), ('cached', Button.draw)):
+            start = time.perf_counter()
+            for frame in range(FRAMES):
+                for i, button in enumerate(buttons):
+                    draw(button, screen, True if i == frame % 30 else None)
+            print(f'{style:>8} {name:>8} {(time.perf_counter() - start) / FRAMES * 1000:.3f} ms/frame')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+
+'''Compare a loop of Circle.draw calls against CircleRenderer'''
+
+import os, time
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+from pygame_tools import *
+from random import randint, seed
+
+FRAMES = 30
+
+def time_frames(draw: callable) -> float:
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        draw()
+    return (time.perf_counter() - start) / FRAMES
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((600, 600))
+    seed(0)
+    print(f'{"n":>8} {"Circle.draw ms":>15} {"renderer ms":>12} {"speedup":>8}')
+    for n in (1_000, 10_000, 100_000):
+        circles = [
+            Particle((randint(0, 600), randint(0, 600)), randint(2, 8), (randint(150, 255),) * 3, (0, 0))
+            for _ in range(n)
+        ]
+        renderer = CircleRenderer()
+        def draw_loop():
+            for circle in circles:
+                circle.draw(screen)
+        loop_time = time_frames(draw_loop)
+        renderer_time = time_frames(lambda: renderer.draw(screen, circles))
+        print(f'{n:>8} {loop_time * 1000:>15.2f} {renderer_time * 1000:>12.2f} {loop_time / renderer_time:>7.1f}x')
+
+if __name__ == '__main__':
+    main()
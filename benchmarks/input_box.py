@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+'''Per keystroke latency of typing 2000 characters into an InputBox, with and without incremental layout'''
+
+import os, time
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+from pygame_tools import *
+
+CHARACTERS = 2000
+
+TEXT = 'the quick brown fox jumps over the lazy dog '
+
+class FullReflowInputBox(InputBox):
+    '''wraps and renders every line again after every keystroke'''
+    def get_layout(self) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        return TextBox.get_layout(self)
+
+def type_text(input_box: InputBox, screen: pygame.Surface) -> list[float]:
+    latencies = []
+    for i in range(CHARACTERS):
+        event = pygame.event.Event(KEYDOWN, unicode = TEXT[i % len(TEXT)], key = 0, mod = 0)
+        start = time.perf_counter()
+        input_box.update(event)
+        input_box.draw(screen)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+def percentile(values: list[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * p / 100), len(values) - 1)]
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((800, 800))
+    print(f'{"layout":>12} {"p50 ms":>8} {"p99 ms":>8} {"last 100 mean ms":>17}')
+    for name, cls in (('full reflow', FullReflowInputBox), ('incremental', InputBox)):
+        latencies = type_text(cls(Rect(10, 10, 780, 780)), screen)
+        last = latencies[-100:]
+        print(f'{name:>12} {percentile(latencies, 50) * 1000:>8.3f} {percentile(latencies, 99) * 1000:>8.3f} {sum(last) / len(last) * 1000:>17.3f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+'''Compare calling a method through the original ManyOf against the cached methods and the tuple results mode'''
+
+import os, time
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+from pygame_tools import *
+
+CALLS = 2000
+
+class OriginalManyOf:
+    '''the original ManyOf'''
+    def __init__(self, cls: type, *obj_list):
+        self.obj_list = obj_list
+        for method in filter(lambda x: x != '__class__', dir(cls)):
+            if not callable(getattr(cls, method)):
+                continue
+            def func(*args, __method_name__=method, **kwargs):
+                results = [getattr(obj, __method_name__)(*args, **kwargs) for obj in obj_list]
+                return OriginalManyOf(type(results[0]), *results)
+            func.__name__ = method
+            setattr(self, method, func)
+
+def main():
+    pygame.init()
+    screen = pygame.Surface((300, 300))
+    font = pygame.font.Font(None, 16)
+    boxes = [TextBox(['some text', 'more text'], Rect(0, i * 30, 300, 30), 'gray', font = font) for i in range(3)]
+    for name, many in (
+            ('original', OriginalManyOf(TextBox, *boxes)),
+            ('cached', ManyOf(TextBox, *boxes)),
+            ('tuple', ManyOf(TextBox, *boxes, results = 'tuple')),
+        ):
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            many.draw(screen)
+        print(f'{name:>9} {(time.perf_counter() - start) / CALLS * 1000:.4f} ms/call')
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        for box in boxes:
+            box.draw(screen)
+    print(f'{"loop":>9} {(time.perf_counter() - start) / CALLS * 1000:.4f} ms/call')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+'''Compare the memory and update time of 100k slotted Particles against the original Particle with a __dict__ and a TrueEvery'''
+
+import os, time, tracemalloc, random
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+from pygame_tools import *
+
+COUNT = 100_000
+UPDATES = 5
+
+class OriginalTrueEvery:
+    '''TrueEvery with a __dict__, as it was'''
+    def __init__(self, count: int):
+        self.count = self.initial_count = count
+        self.once = False
+        self.calls = self.start_value = 0
+        self.first_call = True
+
+    def __call__(self) -> bool:
+        self.calls -= 1
+        if self.calls <= 0:
+            self.calls = self.initial_count if self.first_call else self.count
+            self.first_call = False
+            return True
+
+class OriginalParticle:
+    '''the original Circle and Particle, with a __dict__ and a TrueEvery each'''
+    def __init__(self, center: Point, radius: int, color: Color, velocity: Point, lifetime: int = None, radius_decrement: int = None, frames_between_decrement: int = 1):
+        self._center = Point._make(center)
+        self._radius = radius
+        self.diameter = radius * 2
+        self.color = color
+        self.width = 0
+        self.rect = Rect(0, 0, self.diameter, self.diameter)
+        self.rect.center = self._center
+        self._spatial_hash = None
+        self.velocity = Point._make(velocity)
+        self.lifetime = lifetime
+        self.radius_decrement = radius_decrement
+        self.radius_decrement_timer = OriginalTrueEvery(frames_between_decrement)
+        self.alive = True
+
+    center = Circle.center
+    radius = Circle.radius
+
+    def update(self):
+        if self.alive:
+            self.center += self.velocity
+            if self.lifetime != None:
+                self.lifetime -= 1
+                if self.lifetime <= 0:
+                    self.alive = False
+            if self.radius_decrement != None and self.radius_decrement_timer():
+                self.radius -= self.radius_decrement
+                if self.radius <= 0:
+                    self.alive = False
+
+def create(cls: type) -> list:
+    random.seed(1)
+    return [
+        cls((random.randint(0, 800), random.randint(0, 600)), 40, 'white', (random.random(), random.random()), 1000, 1, 5)
+        for _ in range(COUNT)
+    ]
+
+def measure(cls: type):
+    tracemalloc.start()
+    particles = create(cls)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del particles
+    start = time.perf_counter()
+    particles = create(cls)
+    created = time.perf_counter()
+    for _ in range(UPDATES):
+        for particle in particles:
+            particle.update()
+    end = time.perf_counter()
+    print(f'{cls.__name__:>16} {memory / COUNT:6.1f} bytes/particle  create {(created - start) * 1000:6.1f} ms  update {(end - created) / UPDATES * 1000:6.1f} ms/frame')
+
+def main():
+    pygame.init()
+    measure(OriginalParticle)
+    measure(Particle)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+'''Compare a steady emitter creating a Particle a frame and removing dead ones with list.remove against a ParticlePool'''
+
+import os, gc, time, random, tracemalloc
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame, pygame_tools
+from pygame_tools import *
+
+FRAMES = 3000
+EMIT = 20 # particles a frame, each lives 100 frames, so 2000 are alive at once
+
+def emit_args() -> dict:
+    return dict(center = (300, 300), radius = 4, color = (200, 200, 200), velocity = (random.random() - 0.5, random.random() - 0.5), lifetime = 100)
+
+def original(frame: int, particles: list):
+    i = 0
+    while i < len(particles):
+        if not particles[i].alive:
+            particles.remove(particles[i])
+        else:
+            particles[i].update()
+            i += 1
+    for _ in range(EMIT):
+        particles.append(Particle(**emit_args()))
+
+def pooled(frame: int, pool: ParticlePool):
+    pool.update()
+    for _ in range(EMIT):
+        pool.acquire(**emit_args())
+
+def run(name: str, step: Callable, particles: any):
+    random.seed(1)
+    for frame in range(FRAMES // 10): # fill up to the steady state
+        step(frame, particles)
+    collections = [0]
+    callback = lambda phase, info: collections.__setitem__(0, collections[0] + (phase == 'start'))
+    gc.callbacks.append(callback)
+    times = []
+    for frame in range(FRAMES):
+        start = time.perf_counter()
+        step(frame, particles)
+        times.append((time.perf_counter() - start) * 1000)
+    gc.callbacks.remove(callback)
+    stats = percentile_stats(times)
+    print(f'{name:>9} p50 {stats["p50"]:.3f} ms  p99 {stats["p99"]:.3f} ms  max {stats["max"]:.3f} ms  gc collections {collections[0]}')
+    # objects pygame_tools allocated during the steady state frames that are still alive at the end
+    # a pool that reuses its particles in place keeps the ones it allocated before tracing started
+    tracemalloc.start()
+    for frame in range(FRAMES // 10):
+        step(frame, particles)
+    snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(True, pygame_tools.__file__)])
+    tracemalloc.stop()
+    stats = snapshot.statistics('filename')
+    print(f'{"":>9} tracemalloc: {sum(stat.count for stat in stats)} blocks, {sum(stat.size for stat in stats)} bytes allocated by pygame_tools in {FRAMES // 10} frames and still alive')
+
+def main():
+    pygame.init()
+    run('original', original, [])
+    pool = ParticlePool(EMIT * 101)
+    run('pool', pooled, pool)
+    print(pool.get_stats())
+
+if __name__ == '__main__':
+    main()
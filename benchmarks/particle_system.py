@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+'''Compare updating and drawing Particle objects against a ParticleSystem'''
+
+import os, time
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+from pygame_tools import *
+
+FRAMES = 60
+
+def bench_particles(n: int, screen: pygame.Surface) -> tuple[float, float]:
+    particles = [
+        Particle((300, 300), 4, 'white', (x % 7 - 3, x % 5 - 2), None, 1, 50)
+        for x in range(n)
+    ]
+    update_time = draw_time = 0
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        for particle in particles:
+            particle.update()
+            particle.velocity.y += 9.8 / 50
+        update_time += time.perf_counter() - start
+        start = time.perf_counter()
+        for particle in particles:
+            particle.draw(screen)
+        draw_time += time.perf_counter() - start
+    return update_time / FRAMES, draw_time / FRAMES
+
+def bench_system(n: int, screen: pygame.Surface) -> tuple[float, float]:
+    system = ParticleSystem(n, gravity = (0, 9.8 / 50))
+    x = np.arange(n)
+    system.emit(n, (300, 300), 4, 'white', np.stack([x % 7 - 3, x % 5 - 2], axis = 1), None, 1, 50)
+    update_time = draw_time = 0
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        system.update()
+        update_time += time.perf_counter() - start
+        start = time.perf_counter()
+        system.draw(screen)
+        draw_time += time.perf_counter() - start
+    return update_time / FRAMES, draw_time / FRAMES
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((600, 600))
+    print(f'{"n":>8} {"impl":>15} {"update ms":>10} {"draw ms":>10}')
+    for n in (1_000, 10_000, 100_000):
+        for name, bench in (('Particle', bench_particles), ('ParticleSystem', bench_system)):
+            update_time, draw_time = bench(n, screen)
+            print(f'{n:>8} {name:>15} {update_time * 1000:>10.2f} {draw_time * 1000:>10.2f}')
+
+if __name__ == '__main__':
+    main()
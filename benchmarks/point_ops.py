@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+'''Time every Point operator against Point, tuple and scalar operands, and the in-place versions'''
+
+import timeit
+from pygame_tools import *
+
+NUMBER = 200_000
+
+# operands of 1 keep the in-place operations from growing p over millions of repetitions
+SETUP = 'from pygame_tools import Point; p = Point(3, 4); q = Point(1, 1); t = (1, 1); s = 1'
+
+CASES = [
+    ('-p', '-p'),
+    ('p + q', 'p + q'),
+    ('p + t', 'p + t'),
+    ('p + s', 'p + s'),
+    ('t + p', 't + p'),
+    ('p - q', 'p - q'),
+    ('p - t', 'p - t'),
+    ('p - s', 'p - s'),
+    ('t - p', 't - p'),
+    ('p * q', 'p * q'),
+    ('p * s', 'p * s'),
+    ('p / q', 'p / q'),
+    ('p / s', 'p / s'),
+    ('s / p', 's / p'),
+    ('p // q', 'p // q'),
+    ('p == q', 'p == q'),
+    ('p += q', 'p += q'),
+    ('p += t', 'p += t'),
+    ('p += s', 'p += s'),
+    ('p -= q', 'p -= q'),
+    ('p *= q', 'p *= q'),
+    ('p /= s', 'p /= s'),
+    ('p = p + q', 'p = p + q'),
+    ('p.x += q.x; p.y += q.y', 'p.x += q.x; p.y += q.y'),
+    ('p.rotate(0.1)', 'p.rotate(0.1)'),
+    ('p.dist(q)', 'p.dist(q)'),
+]
+
+def main():
+    print(f'{"operation":>25} {"ns/op":>8}')
+    for name, statement in CASES:
+        seconds = min(timeit.repeat(statement, SETUP, number = NUMBER, repeat = 3))
+        print(f'{name:>25} {seconds / NUMBER * 1e9:>8.1f}')
+
+if __name__ == '__main__':
+    main()
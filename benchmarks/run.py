@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+'''
+Run the example screens in tests/ headless and print their frame timings as JSON
+:example:
+
+    ./benchmarks/run.py --frames 600 particles text_box > results.json
+    ./benchmarks/run.py --record session.jsonl visual_novel # play it in a window, events are saved
+    ./benchmarks/run.py --replay session.jsonl --per-frame visual_novel > results.json # the same session headless
+'''
+
+import os, sys, json, argparse, importlib.util
+WINDOWED = 'SDL_VIDEODRIVER' in os.environ
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1') # keep stdout valid JSON
+import pygame
+from pygame_tools import *
+
+TESTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tests')
+
+def load_screen_class(file_name: str, class_name: str) -> type:
+    '''import a class from a script in tests/ by path, the scripts are not a package'''
+    spec = importlib.util.spec_from_file_location(f'scenario_{class_name}', os.path.join(TESTS_DIR, file_name))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, class_name)
+
+def key(unicode: str, key: int = 0) -> pygame.event.Event:
+    return pygame.event.Event(KEYDOWN, unicode = unicode, key = key, mod = 0)
+
+def every(frames: int, *events: pygame.event.Event) -> Callable[[int], list[pygame.event.Event]]:
+    '''the same events once every {frames} frames'''
+    return lambda frame: events if frame % frames == frames - 1 else ()
+
+def typing(text: str) -> Callable[[int], list[pygame.event.Event]]:
+    '''press i to open the input box, then type one character of text per frame'''
+    def events(frame: int) -> list[pygame.event.Event]:
+        if frame == 0:
+            return [key('i')]
+        return [key(text[(frame - 1) % len(text)])]
+    return events
+
+# name: (file in tests/, class, events)
+SCENARIOS = {
+    'particles': ('particle_test.py', 'ParticleTest', None),
+    'particle_system': ('particle_system.py', 'ParticleSystemTest', None),
+    'bezier': ('bezier.py', 'BezierTest', None),
+    'rotate': ('rotate.py', 'RotateTest', every(15, key('a'))),
+    'text_box': ('text_box.py', 'TextBoxTest', None),
+    'input_box': ('input_box.py', 'InputBoxTest', typing('the quick brown fox jumps over the lazy dog ')),
+    'visual_novel': ('visual_novel.py', 'VisualNovelTest', every(30, key('\r', K_RETURN))),
+}
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.strip().splitlines()[0])
+    parser.add_argument('scenarios', nargs = '*', help = f'scenarios to run, all of them by default. one of: {", ".join(SCENARIOS)}')
+    parser.add_argument('--frames', type = int, help = 'frames to time, 300 by default or the whole recording with --replay')
+    parser.add_argument('--warmup', type = int, default = 10)
+    parser.add_argument('--output', help = 'write the JSON here instead of stdout')
+    parser.add_argument('--record', metavar = 'FILE', help = 'play one scenario in a window and save its events')
+    parser.add_argument('--replay', metavar = 'FILE', help = 'run one scenario with the events and frame times saved by --record')
+    parser.add_argument('--per-frame', action = 'store_true', help = 'include the time of every frame')
+    args = parser.parse_args()
+    for name in args.scenarios:
+        if name not in SCENARIOS:
+            parser.error(f'unknown scenario {name}')
+    if (args.record or args.replay) and len(args.scenarios) != 1:
+        parser.error('--record and --replay need exactly one scenario')
+    if args.record:
+        if not WINDOWED:
+            del os.environ['SDL_VIDEODRIVER']
+        file_name, class_name, _ = SCENARIOS[args.scenarios[0]]
+        screen = load_screen_class(file_name, class_name)()
+        with EventRecorder(args.record) as recorder:
+            screen.event_recorder = recorder
+            try:
+                screen.run()
+            except SystemExit:
+                pass
+        print(f'recorded {recorder.frames} frames to {args.record}', file = sys.stderr)
+        return
+    results = {}
+    for name in args.scenarios or SCENARIOS:
+        file_name, class_name, events = SCENARIOS[name]
+        screen = load_screen_class(file_name, class_name)()
+        frames, warmup, frame_time = args.frames or 300, args.warmup, None
+        if args.replay:
+            events = EventReplayer(args.replay)
+            frames, warmup, frame_time = args.frames or len(events), 0, events.get_frame_time
+        results[name] = benchmark_screen(screen, frames, events, warmup, frame_time, args.per_frame)
+        print(f'{name}: p50 {results[name]["frame"]["p50"]:.3f} ms', file = sys.stderr)
+    output = json.dumps({'pygame': pygame.version.ver, 'frames': frames, 'replay': args.replay, 'scenarios': results}, indent = 2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+    else:
+        print(output)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+'''Frame time of presenting a scaled GameScreen the original way against the preallocated and direct paths'''
+
+import os, time
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+from pygame_tools import *
+
+FRAMES = 100
+
+RESOLUTIONS = [
+    ((1280, 720), (640, 360)),
+    ((1920, 1080), (960, 540)),
+    ((1920, 1080), (320, 180)),
+    ((1366, 768), (800, 600)),
+]
+
+def original_present(screen: GameScreen):
+    '''the original present, allocating a new scaled surface every frame'''
+    screen.real_screen.blit(pygame.transform.scale(screen.screen, screen.real_window_size), (0, 0))
+    pygame.display.update()
+
+def time_frames(present: callable, screen: GameScreen) -> float:
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        present(screen)
+    return (time.perf_counter() - start) / FRAMES
+
+def main():
+    pygame.init()
+    print(f'{"window":>10} {"game":>9} {"original ms":>12} {"buffer ms":>10} {"direct ms":>10}')
+    for real_size, size in RESOLUTIONS:
+        display = pygame.display.set_mode(real_size)
+        times = [
+            time_frames(original_present, GameScreen(display, real_size, size)),
+            time_frames(GameScreen.present, GameScreen(display, real_size, size, scale_into_display = False)),
+            time_frames(GameScreen.present, GameScreen(display, real_size, size)),
+        ]
+        print(f'{"%dx%d" % real_size:>10} {"%dx%d" % size:>9}' + ''.join(f'{t * 1000:>{w}.3f}' for t, w in zip(times, (13, 11, 11))))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+'''Compare the original per frame wrapping of TextBox.draw_text against the cached layout'''
+
+import os, time
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+from pygame_tools import *
+
+FRAMES = 60
+
+PARAGRAPH = (
+    'Lorem ipsum dolor sit amet, consetetur sadipscing elitr, sed diam nonumy eirmod tempor invidunt ut labore '
+    'et dolore magna aliquyam erat, sed diam voluptua. At vero eos et accusam et justo duo dolores et ea rebum. '
+    'Stet clita kasd gubergren, no sea takimata sanctus est Lorem ipsum dolor sit amet.'
+)
+
+def reference_draw_text(text_box: TextBox, screen: pygame.Surface):
+    '''the original draw_text, wrapping and rendering every frame'''
+    y = 0
+    text = text_box.text[text_box.text_index]
+    while text:
+        text_len = len(text)
+        i = 1
+        while text_box.font.size(text[:i])[0] < text_box.rect.w - text_box.padding.x * 2 and i < text_len and text[i] != '\n':
+            i += 1
+        if i < text_len and text[i] != '\n':
+            new_i = text.rfind(' ', 0, i) + 1
+            if new_i:
+                i = new_i
+        elif i < text_len and text[i] == '\n':
+            text = text.replace('\n', '', 1)
+        size = Point(*text_box.font.size(text[:i]))
+        screen.blit(
+            text_box.font.render(text[:i], True, text_box.text_color),
+            (
+                text_box.center.x - size.x // 2 if text_box.center_text else text_box.rect.x + text_box.padding.x,
+                text_box.rect.y + text_box.padding.y + y
+            )
+        )
+        text = text[i:]
+        y += text_box.font_height
+
+def time_frames(draw: callable) -> float:
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        draw()
+    return (time.perf_counter() - start) / FRAMES
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((800, 800))
+    print(f'{"paragraphs":>10} {"original ms":>12} {"first draw ms":>14} {"cached ms":>10}')
+    for paragraphs in (1, 4, 16):
+        text_box = TextBox(['\n'.join([PARAGRAPH] * paragraphs)], Rect(10, 10, 780, 780))
+        original = time_frames(lambda: reference_draw_text(text_box, screen))
+        start = time.perf_counter()
+        text_box.draw_text(screen)
+        first = time.perf_counter() - start
+        cached = time_frames(lambda: text_box.draw_text(screen))
+        print(f'{paragraphs:>10} {original * 1000:>12.2f} {first * 1000:>14.2f} {cached * 1000:>10.3f}')
+
+if __name__ == '__main__':
+    main()
@@ -14,7 +14,7 @@ setup(
     long_description=long_description,
     py_modules=['pygame_tools'],
     package_dir={'': 'src'},
-    install_requires=['pygame', 'recordclass'],
+    install_requires=['pygame', 'recordclass', 'numpy'],
     keywords='pygame 2d-game video-game',
     url="https://github.com/shanemcdo/pygame_tools",
     license='MIT',
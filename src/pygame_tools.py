@@ -1,9 +1,18 @@
 '''Basic classes for creating a pygame application'''
 
-import pygame, math, sys
+import pygame, math, sys, os, json, asyncio, threading, weakref
+import numpy as np
 from string import printable as _printable
-from typing import Type, TypeVar, Optional
+from time import perf_counter as _perf_counter
+from typing import Callable, Coroutine, TextIO, Type, TypeVar, Optional
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import nullcontext as _nullcontext
+from functools import lru_cache
 from glob import glob
+from numbers import Integral as _Integral
+from itertools import accumulate, islice, repeat
 from pygame.locals import *
 from recordclass import RecordClass
 
@@ -14,29 +23,56 @@ T = TypeVar('T', bound='ManyOf')
 class ManyOf:
     '''
     A class that can be used to group objects and call them at the same time
-    reads methods from a given class and creates those methods in this class
-    by looping over each provided object and calling that method on it
+    calling a method of the given class on this calls it on each provided object
+    the methods are made the first time they are used and shared by every ManyOf of the same class
     '''
-    def __init__(self, cls: Type[T], *obj_list: tuple[T]):
+    _classes = {} # (ManyOf class, cls) -> the class that holds the methods for cls
+
+    def __new__(cls, target: Type[T], *obj_list: tuple[T], results: str = 'many', executor: Executor = None):
+        key = (cls, target)
+        many_of_class = ManyOf._classes.get(key)
+        if many_of_class is None:
+            many_of_class = ManyOf._classes[key] = type(f'{cls.__name__}[{target.__name__}]', (cls,), {'_target': target})
+        return super().__new__(many_of_class)
+
+    def __init__(self, cls: Type[T], *obj_list: tuple[T], results: str = 'many', executor: Executor = None):
         '''
         initialize the ManyOf class
         :cls: the type or class of the objects in obj_list
         :obj_list: the list of objects that the methods will be called on
+        :results: Optional. defaults to 'many'. what a method returns
+            'many' for a ManyOf of the results, or 'tuple' for a plain tuple of them
+        :executor: Optional. defaults to None. a concurrent.futures executor to call the method on every object at once,
+            e.g.: a ThreadPoolExecutor for methods that wait on files or the network. objects are called in order if None
         '''
         if len(obj_list) < 1:
             raise ValueError('Must pass at least one object in obj_list')
+        if results not in ('many', 'tuple'):
+            raise ValueError(f"results must be 'many' or 'tuple', not {results!r}")
         self.obj_list = obj_list
-        for method in filter(lambda x: x != '__class__', dir(cls)):
-            if not callable(getattr(cls, method)): # if the method is not a function
-                continue # move on to the next method
-            def func(*args, __method_name__=method, **kwargs): # create new function
-                results = [getattr(obj, __method_name__)(*args, **kwargs) for obj in obj_list]
-                return ManyOf(type(results[0]), *results)
-            func.__name__ = method # rename function
-            setattr(self, method, func) # save function as method
+        self._results = results # underscored so they do not hide methods of cls with the same names
+        self._executor = executor
+
+    def __getattr__(self, name: str) -> Callable:
+        '''make the method that calls {name} on every object, save it on the class, and return it bound to this'''
+        cls = type(self)
+        if name.startswith('__') or not callable(getattr(cls.__dict__.get('_target'), name, None)):
+            raise AttributeError(f"'{cls.__name__}' object has no attribute '{name}'")
+        def method(self, *args, **kwargs):
+            if self._executor is None:
+                results = tuple([getattr(obj, name)(*args, **kwargs) for obj in self.obj_list])
+            else:
+                results = tuple(self._executor.map(lambda obj: getattr(obj, name)(*args, **kwargs), self.obj_list))
+            if self._results == 'tuple':
+                return results
+            return ManyOf(type(results[0]), *results, executor = self._executor)
+        method.__name__ = name
+        setattr(cls, name, method)
+        return getattr(self, name)
 
 class TrueEvery:
     '''This is a functor that creates a function that returns true once every {self.count} calls'''
+    __slots__ = ('count', 'initial_count', 'once', 'calls', 'start_value', 'first_call')
 
     def __init__(self, count: int, initial_count: int = None, once: bool = False, start_value: int = 0):
         '''
@@ -88,6 +124,12 @@ class TrueEvery:
 class Point: #forward declaration
     pass
 
+class PointArray: #forward declaration
+    pass
+
+class Rotation: #forward declaration
+    pass
+
 class Point(RecordClass):
     x: int | float
     y: int | float
@@ -100,59 +142,143 @@ class Point(RecordClass):
 
     def __add__(self, other: int | float | Point) -> Point:
         '''add two points'''
+        if isinstance(other, Point):
+            return Point(self.x + other.x, self.y + other.y)
         if isinstance(other, int | float):
             return Point(self.x + other, self.y + other)
-        if not isinstance(other, Point):
-            try:
-                other = Point._make(other)
-            except TypeError:
-                return NotImplemented
+        if isinstance(other, PointArray):
+            return NotImplemented
+        try:
+            other = Point._make(other)
+        except TypeError:
+            return NotImplemented
         return Point(self.x + other.x, self.y + other.y)
 
     def __radd__(self, other: int | float | Point) -> Point:
         '''add two points'''
         return self + other
 
+    def __iadd__(self, other: int | float | Point) -> Point:
+        '''add other to this point in place'''
+        if isinstance(other, Point):
+            self.x += other.x
+            self.y += other.y
+            return self
+        if isinstance(other, int | float):
+            self.x += other
+            self.y += other
+            return self
+        if isinstance(other, PointArray):
+            return NotImplemented
+        try:
+            other = Point._make(other)
+        except TypeError:
+            return NotImplemented
+        self.x += other.x
+        self.y += other.y
+        return self
+
     def __sub__(self, other: int | float | Point) -> Point:
-        '''subtract self from other'''
-        if not isinstance(other, int | float) and not isinstance(other, Point):
+        '''subtract other from self'''
+        if isinstance(other, Point):
+            return Point(self.x - other.x, self.y - other.y)
+        if isinstance(other, int | float):
+            return Point(self.x - other, self.y - other)
+        if isinstance(other, PointArray):
+            return NotImplemented
+        try:
             other = Point._make(other)
-        return self + (-other)
+        except TypeError:
+            return NotImplemented
+        return Point(self.x - other.x, self.y - other.y)
 
     def __rsub__(self, other: int | float | Point) -> Point:
         '''subtract self from other'''
-        return -self + other
-
-    def __mul__(self, other: int | float | Point) -> Point:
-        '''Multiply x and y by other'''
         if isinstance(other, int | float):
-            return Point(self.x * other, self.y * other)
+            return Point(other - self.x, other - self.y)
         if not isinstance(other, Point):
             try:
                 other = Point._make(other)
             except TypeError:
                 return NotImplemented
+        return Point(other.x - self.x, other.y - self.y)
+
+    def __isub__(self, other: int | float | Point) -> Point:
+        '''subtract other from this point in place'''
+        if isinstance(other, Point):
+            self.x -= other.x
+            self.y -= other.y
+            return self
+        if isinstance(other, int | float):
+            self.x -= other
+            self.y -= other
+            return self
+        if isinstance(other, PointArray):
+            return NotImplemented
+        try:
+            other = Point._make(other)
+        except TypeError:
+            return NotImplemented
+        self.x -= other.x
+        self.y -= other.y
+        return self
+
+    def __mul__(self, other: int | float | Point) -> Point:
+        '''Multiply x and y by other'''
+        if isinstance(other, Point):
+            return Point(self.x * other.x, self.y * other.y)
+        if isinstance(other, int | float):
+            return Point(self.x * other, self.y * other)
+        if isinstance(other, PointArray):
+            return NotImplemented
+        try:
+            other = Point._make(other)
+        except TypeError:
+            return NotImplemented
         return Point(self.x * other.x, self.y * other.y)
 
     def __rmul__(self, other: int | float | Point) -> Point:
         '''Multiply x and y by other'''
         return self * other
 
+    def __imul__(self, other: int | float | Point) -> Point:
+        '''Multiply x and y by other in place'''
+        if isinstance(other, Point):
+            self.x *= other.x
+            self.y *= other.y
+            return self
+        if isinstance(other, int | float):
+            self.x *= other
+            self.y *= other
+            return self
+        if isinstance(other, PointArray):
+            return NotImplemented
+        try:
+            other = Point._make(other)
+        except TypeError:
+            return NotImplemented
+        self.x *= other.x
+        self.y *= other.y
+        return self
+
     def __truediv__(self, other: int | float | Point) -> Point:
         '''Divide x and y by other'''
+        if isinstance(other, Point):
+            return Point(self.x / other.x, self.y / other.y)
         if isinstance(other, int | float):
             return Point(self.x / other, self.y / other)
-        if not isinstance(other, Point):
-            try:
-                other = Point._make(other)
-            except TypeError:
-                return NotImplemented
+        if isinstance(other, PointArray):
+            return NotImplemented
+        try:
+            other = Point._make(other)
+        except TypeError:
+            return NotImplemented
         return Point(self.x / other.x, self.y / other.y)
 
     def __rtruediv__(self, other: int | float | Point) -> Point:
         '''Divide other by x and y'''
         if isinstance(other, int | float):
-            return Point(other / self.x , other / self.y)
+            return Point(other / self.x, other / self.y)
         if not isinstance(other, Point):
             try:
                 other = Point._make(other)
@@ -160,21 +286,44 @@ class Point(RecordClass):
                 return NotImplemented
         return Point(other.x / self.x, other.y / self.y)
 
+    def __itruediv__(self, other: int | float | Point) -> Point:
+        '''Divide x and y by other in place'''
+        if isinstance(other, Point):
+            self.x /= other.x
+            self.y /= other.y
+            return self
+        if isinstance(other, int | float):
+            self.x /= other
+            self.y /= other
+            return self
+        if isinstance(other, PointArray):
+            return NotImplemented
+        try:
+            other = Point._make(other)
+        except TypeError:
+            return NotImplemented
+        self.x /= other.x
+        self.y /= other.y
+        return self
+
     def __floordiv__(self, other: int | float | Point) -> Point:
         '''Divide x and y by other and round down'''
+        if isinstance(other, Point):
+            return Point(self.x // other.x, self.y // other.y)
         if isinstance(other, int | float):
             return Point(self.x // other, self.y // other)
-        if not isinstance(other, Point):
-            try:
-                other = Point._make(other)
-            except TypeError:
-                return NotImplemented
+        if isinstance(other, PointArray):
+            return NotImplemented
+        try:
+            other = Point._make(other)
+        except TypeError:
+            return NotImplemented
         return Point(self.x // other.x, self.y // other.y)
 
     def __rfloordiv__(self, other: int | float | Point) -> Point:
         '''Divide other by x and y and round down'''
         if isinstance(other, int | float):
-            return Point(other // self.x , other // self.y)
+            return Point(other // self.x, other // self.y)
         if not isinstance(other, Point):
             try:
                 other = Point._make(other)
@@ -192,11 +341,14 @@ class Point(RecordClass):
 
     def __eq__(self, pos: Point) -> bool:
         '''check if two poits are equal'''
-        if not isinstance(pos, Point):
-            try:
-                pos = Point._make(pos)
-            except TypeError:
-                return NotImplemented
+        if isinstance(pos, Point):
+            return self.x == pos.x and self.y == pos.y
+        if isinstance(pos, PointArray):
+            return NotImplemented
+        try:
+            pos = Point._make(pos)
+        except TypeError:
+            return NotImplemented
         return self.x == pos.x and self.y == pos.y
 
     def __abs__(self) -> Point:
@@ -209,15 +361,15 @@ class Point(RecordClass):
         :angle: angle which to rotate, radians
         :center: the point to rotate around
         '''
+        cos = math.cos(angle)
+        sin = math.sin(angle)
         if center is None:
-            center = Point(0, 0)
-        elif not isinstance(center, Point):
+            return Point(self.x * cos - self.y * sin, self.y * cos + self.x * sin)
+        if not isinstance(center, Point):
             center = Point._make(center)
-        pos = self - center
-        return center + Point(
-            pos.x * math.cos(angle) - pos.y * math.sin(angle),
-            pos.y * math.cos(angle) + pos.x * math.sin(angle)
-        )
+        x = self.x - center.x
+        y = self.y - center.y
+        return Point(center.x + x * cos - y * sin, center.y + y * cos + x * sin)
     rotate_cw = rotate
 
     def rotate_ccw(self, angle: float, center: Optional[Point] = None) -> Point:
@@ -281,35 +433,486 @@ class Point(RecordClass):
         except ZeroDivisionError:
             return Point.distance(start, point)
 
+class PointArray:
+    '''
+    An N by 2 array of points backed by a float64 numpy array
+    supports the same operators and methods as Point but applies them to every point in one vectorized call
+    the underlying array is {self.array} and is never copied when it is already float64
+    it can be passed straight to pygame.draw.lines and pygame.draw.polygon
+    :example:
+
+        outline = PointArray([(0, 0), (10, 0), (10, 10)])
+        outline = (outline * 2 + (5, 5)).rotate(math.pi / 4, (15, 15))
+        pygame.draw.polygon(screen, 'white', outline)
+    '''
+    # make numpy defer to the reflected operators below instead of broadcasting over this object
+    __array_ufunc__ = None
+
+    def __init__(self, points: list[Point] | np.ndarray):
+        '''
+        :points: a sequence of points or an array of shape (N, 2)
+        '''
+        if isinstance(points, PointArray):
+            points = points.array
+        self.array = np.asarray(points, dtype = np.float64).reshape(-1, 2)
+
+    @staticmethod
+    def _coerce(other: int | float | Point | PointArray | np.ndarray) -> float | np.ndarray:
+        '''convert an operand to something numpy can broadcast against an (N, 2) array'''
+        if isinstance(other, int | float):
+            return other
+        if isinstance(other, PointArray):
+            return other.array
+        if isinstance(other, Point):
+            return np.array((other.x, other.y), dtype = np.float64)
+        return np.asarray(other, dtype = np.float64)
+
+    @property
+    def x(self) -> np.ndarray:
+        '''a view of the x coordinates'''
+        return self.array[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        '''a view of the y coordinates'''
+        return self.array[:, 1]
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __getitem__(self, index: int | slice) -> Point | PointArray:
+        '''get a single Point or a PointArray view of a slice'''
+        if isinstance(index, _Integral): # numpy integers too, like the ones np.argmin returns
+            x, y = self.array[index].tolist()
+            return Point(x, y)
+        return PointArray(self.array[index])
+
+    def __setitem__(self, index: int | slice, value: Point | PointArray):
+        self.array[index] = PointArray._coerce(value)
+
+    def __iter__(self):
+        return (Point(x, y) for x, y in self.array.tolist())
+
+    def __array__(self, dtype = None, copy = None) -> np.ndarray:
+        if dtype is None or dtype == self.array.dtype:
+            return self.array
+        return self.array.astype(dtype)
+
+    def __repr__(self) -> str:
+        return f'PointArray({self.array.tolist()})'
+
+    def tolist(self) -> list[Point]:
+        '''convert to a list of Point'''
+        return list(self)
+
+    def __neg__(self) -> PointArray:
+        '''take the negative of every point'''
+        return PointArray(-self.array)
+
+    def __add__(self, other: int | float | Point | PointArray) -> PointArray:
+        '''add other to every point'''
+        return PointArray(self.array + PointArray._coerce(other))
+
+    def __radd__(self, other: int | float | Point | PointArray) -> PointArray:
+        '''add other to every point'''
+        return PointArray(PointArray._coerce(other) + self.array)
+
+    def __sub__(self, other: int | float | Point | PointArray) -> PointArray:
+        '''subtract other from every point'''
+        return PointArray(self.array - PointArray._coerce(other))
+
+    def __rsub__(self, other: int | float | Point | PointArray) -> PointArray:
+        '''subtract every point from other'''
+        return PointArray(PointArray._coerce(other) - self.array)
+
+    def __mul__(self, other: int | float | Point | PointArray) -> PointArray:
+        '''Multiply x and y of every point by other'''
+        return PointArray(self.array * PointArray._coerce(other))
+
+    def __rmul__(self, other: int | float | Point | PointArray) -> PointArray:
+        '''Multiply x and y of every point by other'''
+        return PointArray(PointArray._coerce(other) * self.array)
+
+    def __truediv__(self, other: int | float | Point | PointArray) -> PointArray:
+        '''Divide x and y of every point by other'''
+        return PointArray(self.array / PointArray._coerce(other))
+
+    def __rtruediv__(self, other: int | float | Point | PointArray) -> PointArray:
+        '''Divide other by x and y of every point'''
+        return PointArray(PointArray._coerce(other) / self.array)
+
+    def __floordiv__(self, other: int | float | Point | PointArray) -> PointArray:
+        '''Divide x and y of every point by other and round down'''
+        return PointArray(self.array // PointArray._coerce(other))
+
+    def __rfloordiv__(self, other: int | float | Point | PointArray) -> PointArray:
+        '''Divide other by x and y of every point and round down'''
+        return PointArray(PointArray._coerce(other) // self.array)
+
+    def __floor__(self) -> PointArray:
+        '''round down on x and y'''
+        return PointArray(np.floor(self.array))
+
+    def __ceil__(self) -> PointArray:
+        '''round up on x and y'''
+        return PointArray(np.ceil(self.array))
+
+    def __abs__(self) -> PointArray:
+        '''Returns a PointArray with absolute value on x and y'''
+        return PointArray(np.abs(self.array))
+
+    def __eq__(self, other: int | float | Point | PointArray) -> bool:
+        '''check if every point is equal, a single Point or number is compared with every point like the operators do'''
+        try:
+            other = np.asarray(PointArray._coerce(other), dtype = np.float64)
+        except (TypeError, ValueError):
+            return NotImplemented
+        try:
+            if np.broadcast_shapes(self.array.shape, other.shape) != self.array.shape:
+                return False
+        except ValueError: # the shapes can not be broadcast together
+            return False
+        return bool(np.all(self.array == other))
+
+    __hash__ = None
+
+    def rotate(self, angle: float, center: Optional[Point] = None) -> PointArray:
+        '''
+        rotates every point clockwise around center
+        :angle: angle which to rotate, radians
+        :center: the point to rotate around
+        '''
+        return Rotation(angle, center).apply_many(self)
+    rotate_cw = rotate
+
+    def rotate_ccw(self, angle: float, center: Optional[Point] = None) -> PointArray:
+        '''
+        rotates every point counter-clockwise around center
+        :angle: angle which to rotate, radians
+        :center: the point to rotate around
+        '''
+        return self.rotate(-angle, center)
+
+    def dist(self, pos: Point | PointArray) -> np.ndarray:
+        '''
+        calculate distance between every point and pos
+        :pos: position to calculate distance from, or a PointArray to measure point by point
+        :returns: an array of distances
+        '''
+        delta = self.array - PointArray._coerce(pos)
+        return np.hypot(delta[:, 0], delta[:, 1])
+
+    def dist_from_line(self, start: Point, end: Point) -> np.ndarray:
+        '''
+        returns distance between every point and a line
+        :start: the start of the line
+        :end: the end of the line
+        :returns: an array of distances between the line and every point
+        '''
+        start = PointArray._coerce(start)
+        end = PointArray._coerce(end)
+        line = end - start
+        length = math.hypot(*line)
+        if length == 0:
+            return self.dist(start)
+        offset = start - self.array
+        return np.abs(line[0] * offset[:, 1] - offset[:, 0] * line[1]) / length
+
+class Rotation:
+    '''
+    A clockwise rotation around a center, stored as a 2x3 affine transform
+    the sine and cosine are computed once so the same rotation can be applied to many points
+    :example:
+
+        rotation = Rotation(math.pi / 4, center)
+        outline = rotation.apply_many(outline) # same as [point.rotate(math.pi / 4, center) for point in outline]
+    '''
+
+    def __init__(self, angle: float, center: Optional[Point] = None):
+        '''
+        :angle: angle which to rotate, radians
+        :center: Optional. defaults to (0, 0). the point to rotate around
+        '''
+        self.angle = angle
+        self.center = Point(0, 0) if center is None else Point._make(center)
+        cos = math.cos(angle)
+        sin = math.sin(angle)
+        cx, cy = self.center
+        self.matrix = (
+            (cos, -sin, cx - cos * cx + sin * cy),
+            (sin, cos, cy - sin * cx - cos * cy),
+        )
+
+    def inverse(self) -> Rotation:
+        '''the counter-clockwise rotation that undoes this one'''
+        return Rotation(-self.angle, self.center)
+
+    def as_array(self) -> np.ndarray:
+        '''the transform as a 2x3 numpy array'''
+        return np.array(self.matrix)
+
+    def __call__(self, point: Point) -> Point:
+        '''rotate a single point'''
+        (a, b, c), (d, e, f) = self.matrix
+        x, y = point
+        return Point(a * x + b * y + c, d * x + e * y + f)
+
+    def apply_many(self, points: list[Point] | PointArray | np.ndarray) -> list[Point] | PointArray:
+        '''
+        rotate every point in one pass
+        :points: a sequence of points, a PointArray, or an array of shape (N, 2)
+        :returns: a PointArray if given a PointArray or numpy array, otherwise a list of Point
+        '''
+        if isinstance(points, PointArray | np.ndarray):
+            matrix = self.as_array()
+            return PointArray(PointArray(points).array @ matrix[:, :2].T + matrix[:, 2])
+        (a, b, c), (d, e, f) = self.matrix
+        return [Point(a * x + b * y + c, d * x + e * y + f) for x, y in points]
+
+def rotate_many(points: list[Point] | PointArray | np.ndarray, angle: float, center: Optional[Point] = None) -> list[Point] | PointArray:
+    '''
+    rotates every point clockwise around center, computing the rotation once
+    :points: a sequence of points, a PointArray, or an array of shape (N, 2)
+    :angle: angle which to rotate, radians
+    :center: the point to rotate around
+    :returns: a PointArray if given a PointArray or numpy array, otherwise a list of Point
+    '''
+    return Rotation(angle, center).apply_many(points)
+
 def clip_surface(surface: pygame.Surface, rect: Rect) -> pygame.Surface:
-    '''Copy part of a pygame.Surface'''
+    '''Copy part of a pygame.Surface, use clip_subsurface to avoid the copy'''
     cropped = pygame.Surface(rect.size)
     cropped.blit(surface, (0, 0), rect)
     return cropped
 
-def get_bezier_curve_points(p0: Point, p1: Point, p2: Point, density: int) -> list[Point]:
+def clip_subsurface(surface: pygame.Surface, rect: Rect) -> pygame.Surface:
+    '''
+    Get part of a pygame.Surface without copying it
+    the result shares pixels with surface, so drawing on one changes the other
+    :surface: the surface
+    :rect: the part to get, clipped to the surface
+    :returns: the subsurface
+    '''
+    return surface.subsurface(Rect(rect).clip(surface.get_rect()))
+
+@lru_cache(maxsize = 64)
+def _bernstein_basis(degree: int, density: int) -> np.ndarray:
+    '''
+    the Bernstein basis of a bezier curve sampled at density + 1 evenly spaced values of t
+    :degree: the degree of the curve, one less than the number of control points
+    :density: the number of segments the curve is split into
+    :returns: a read only array of shape (density + 1, degree + 1)
+    '''
+    t = np.arange(density + 1)[:, None] / density
+    k = np.arange(degree + 1)
+    coefficients = np.array([math.comb(degree, i) for i in k])
+    basis = coefficients * t ** k * (1 - t) ** (degree - k)
+    basis.flags.writeable = False
+    return basis
+
+def get_bezier_points(control_points: list[Point], density: int, as_array: bool = False) -> list[Point] | PointArray:
+    '''
+    calculates the points for a bezier curve of any degree
+    the basis for each (degree, density) is cached so every call is a single matrix product
+    :control_points: the control points of the curve, the first and last are the ends of the curve
+    :density: number of segments, the result has density + 1 points
+    :as_array: Optional. defaults to False. return a PointArray instead of a list of Point
+    :returns: the points for the bezier curve
+    '''
+    if density < 1:
+        raise ValueError('density must be at least 1')
+    control_points = PointArray(control_points).array
+    if len(control_points) < 2:
+        raise ValueError('Must pass at least two control points')
+    points = PointArray(_bernstein_basis(len(control_points) - 1, density) @ control_points)
+    return points if as_array else points.tolist()
+
+def get_bezier_curve_points(p0: Point, p1: Point, p2: Point, density: int, as_array: bool = False) -> list[Point] | PointArray:
     '''
     calculates the points for a quadratic bezier curve
     :p0: the first point in the bezier curve
     :p1: the point in the curves direction
     :p2: the last point in the bezier curve
-    :density: number of Points in the returned list
+    :density: number of segments, the result has density + 1 points
+    :as_array: Optional. defaults to False. return a PointArray instead of a list of Point
     :returns: a list of points for the bezier curve
     '''
-    if not isinstance(p0, Point):
-        p0 = Point._make(p0)
-    if not isinstance(p1, Point):
-        p1 = Point._make(p1)
-    if not isinstance(p2, Point):
-        p2 = Point._make(p2)
-    result = []
-    for i in range(density+1):
-        t = i / density
-        result.append(Point(
-            (1 - t) ** 2 * p0.x + 2 * (1 - t) * t * p1.x + t ** 2 * p2.x,
-            (1 - t) ** 2 * p0.y + 2 * (1 - t) * t * p1.y + t ** 2 * p2.y
-            ))
-    return result
+    return get_bezier_points((p0, p1, p2), density, as_array)
+
+def get_cubic_bezier_curve_points(p0: Point, p1: Point, p2: Point, p3: Point, density: int, as_array: bool = False) -> list[Point] | PointArray:
+    '''
+    calculates the points for a cubic bezier curve
+    :p0: the first point in the bezier curve
+    :p1: the control point leaving p0
+    :p2: the control point entering p3
+    :p3: the last point in the bezier curve
+    :density: number of segments, the result has density + 1 points
+    :as_array: Optional. defaults to False. return a PointArray instead of a list of Point
+    :returns: a list of points for the bezier curve
+    '''
+    return get_bezier_points((p0, p1, p2, p3), density, as_array)
+
+def get_bezier_density(control_points: list[Point], tolerance: float = 0.5, max_density: int = 1000) -> int:
+    '''
+    the number of segments needed so a flattened bezier curve is never farther than tolerance from the real curve
+    uses Wang's formula, based on the largest second difference of the control points
+    :control_points: the control points of the curve
+    :tolerance: Optional. defaults to 0.5. the largest allowed distance in pixels
+    :max_density: Optional. defaults to 1000. the most segments that will be returned
+    :returns: the number of segments, at least 1
+    '''
+    control_points = PointArray(control_points).array
+    degree = len(control_points) - 1
+    if degree < 2:
+        return 1
+    second_differences = control_points[2:] - 2 * control_points[1:-1] + control_points[:-2]
+    curvature = np.hypot(second_differences[:, 0], second_differences[:, 1]).max()
+    density = math.ceil(math.sqrt(degree * (degree - 1) * curvature / (8 * tolerance)))
+    return min(max(density, 1), max_density)
+
+def flatten_bezier(control_points: list[Point], tolerance: float = 0.5, max_density: int = 1000, as_array: bool = False) -> list[Point] | PointArray:
+    '''
+    calculates the points for a bezier curve using only as many as are needed for the curve to look smooth
+    :control_points: the control points of the curve, the first and last are the ends of the curve
+    :tolerance: Optional. defaults to 0.5. the largest allowed distance in pixels between the result and the real curve
+    :max_density: Optional. defaults to 1000. the most segments that will be used
+    :as_array: Optional. defaults to False. return a PointArray instead of a list of Point
+    :returns: the points for the bezier curve
+    '''
+    return get_bezier_points(control_points, get_bezier_density(control_points, tolerance, max_density), as_array)
+
+class AssetCache:
+    '''
+    Loads images once and shares them by path
+    every acquire needs a matching release, images nothing holds are kept in least recently used order
+    until they take more than {self.max_bytes} and then dropped
+    images loaded before pygame.display.set_mode is called are not converted to the display's format
+    :example:
+
+        cache = AssetCache()
+        cache.preload(glob('assets/**/*.png', recursive = True)) # decode in the background
+        while cache.get_progress() < 1: # show a loading screen
+            ...
+        image = cache.acquire('assets/player.png')
+        ...
+        cache.release('assets/player.png')
+    '''
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, workers: int = 4):
+        '''
+        :max_bytes: Optional. defaults to 64MiB. how many bytes of images that nothing holds to keep
+        :workers: Optional. defaults to 4. threads used to decode images passed to {self.preload}
+        '''
+        self.max_bytes = max_bytes
+        self.workers = workers
+        self.images = {}
+        self.ref_counts = {}
+        self.unused = OrderedDict() # path -> bytes, oldest first
+        self.unused_bytes = 0
+        self.pending = {} # path -> Future of the decoded, not yet converted, image
+        self.preload_count = 0 # images passed to preload since nothing was pending
+        self._executor = None
+
+    @staticmethod
+    def get_size_in_bytes(image: pygame.Surface) -> int:
+        return image.get_pitch() * image.get_height()
+
+    @staticmethod
+    def convert(image: pygame.Surface) -> pygame.Surface:
+        '''convert an image to the display's pixel format so blitting it does not convert it every time'''
+        if pygame.display.get_surface() is None: # converting needs a display
+            return image
+        return image.convert_alpha()
+
+    def preload(self, paths: list[str]) -> list[Future]:
+        '''
+        start decoding images on a thread pool, they are converted on the main thread when first used or collected
+        :paths: the file paths, ones already loaded or loading are skipped
+        :returns: the futures of the images that started loading
+        '''
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.workers, 'AssetCache')
+        futures = []
+        for path in paths:
+            if path not in self.images and path not in self.pending:
+                self.pending[path] = future = self._executor.submit(pygame.image.load, path)
+                futures.append(future)
+        self.preload_count += len(futures)
+        return futures
+
+    def collect(self):
+        '''convert and store every image that finished loading in the background, call once a frame from a loading screen'''
+        for path, future in list(self.pending.items()):
+            if future.done():
+                del self.pending[path]
+                self._store(path, self.convert(future.result()))
+
+    def get_progress(self) -> float:
+        '''
+        collect finished images
+        :returns: the fraction of preloaded images that are ready, 1 when nothing is loading
+        '''
+        self.collect()
+        if not self.pending:
+            self.preload_count = 0
+            return 1
+        return 1 - len(self.pending) / self.preload_count
+
+    def _store(self, path: str, image: pygame.Surface):
+        self.images[path] = image
+        self.ref_counts[path] = 0
+        self.unused[path] = self.get_size_in_bytes(image)
+        self.unused_bytes += self.unused[path]
+        self._evict()
+
+    def _evict(self):
+        while self.unused_bytes > self.max_bytes and self.unused:
+            path, size = self.unused.popitem(last = False)
+            self.unused_bytes -= size
+            del self.images[path]
+            del self.ref_counts[path]
+
+    def acquire(self, path: str) -> pygame.Surface:
+        '''
+        get an image, loading it if it is not cached, and hold it until {self.release} is called
+        :path: the file path
+        :returns: the converted image, shared with everything else that acquired the same path
+        '''
+        if path not in self.images:
+            future = self.pending.pop(path, None)
+            self.images[path] = self.convert(future.result() if future else pygame.image.load(path))
+            self.ref_counts[path] = 0
+        elif self.ref_counts[path] == 0:
+            self.unused_bytes -= self.unused.pop(path)
+        self.ref_counts[path] += 1
+        return self.images[path]
+
+    def release(self, path: str):
+        '''
+        stop holding an image, it stays cached until it is pushed out by the memory cap
+        :path: the file path passed to {self.acquire}
+        :raises ValueError: if the path is not held
+        '''
+        if not self.ref_counts.get(path):
+            raise ValueError(f'{path} is not held')
+        self.ref_counts[path] -= 1
+        if self.ref_counts[path] == 0:
+            self.unused[path] = self.get_size_in_bytes(self.images[path])
+            self.unused_bytes += self.unused[path]
+            self._evict()
+
+    def clear(self):
+        '''drop every image that nothing holds'''
+        max_bytes, self.max_bytes = self.max_bytes, -1
+        self._evict()
+        self.max_bytes = max_bytes
+
+asset_cache = AssetCache()
+
+def _release_assets(cache: AssetCache, paths: tuple[str]):
+    '''release paths from a cache, kept outside Animation so a finalizer does not keep the animation alive'''
+    for path in paths:
+        cache.release(path)
 
 class Animation:
     '''
@@ -332,30 +935,130 @@ class Animation:
                 a.update()
 
         Example().run()
+
+    frame_data can also be in milliseconds, so playback speed does not depend on the frame rate,
+    by passing the time since the last frame to update, e.g.: a.update(self.frame_time * 1000)
     '''
-    def __init__(self, glob_path: str, frame_data: list[int], repititions: int = None):
+    __slots__ = (
+        'cache',
+        'file_names',
+        'glob_path',
+        'frame_data',
+        'repititions',
+        'finished',
+        'frames',
+        'frame_ends',
+        'frame_count',
+        'frame_index',
+        'frames_until_next',
+        '_finalizer',
+        '__weakref__',
+    )
+
+    def __init__(self, glob_path: Optional[str], frame_data: list[int], repititions: int = None, cache: AssetCache = None):
         '''
         :glob_path: the path that glob is called on.
             e.g.: 'assets/animations/*' to get every file in assets/animations
+            if None, nothing is loaded until {self.load} or {self.set_frames} is called
         :frame_data: how long a frame of the animation should be displayed in game frames
             e.g.: [7, 8, 9] first image found in glob_path lasts 7, the next lasts 8, and the third lasts 9
             this must be the same length as the number of items from glob_path
         :repititions: Optional. defaults to None. if repititions is none, it repeats forever.
             if this number is an int, it decrements every time update is called until it is zero
+        :cache: Optional. defaults to None. the AssetCache the frames are loaded from, the shared asset_cache if None
         '''
+        self.cache = asset_cache if cache is None else cache
+        self.file_names = []
+        self._finalizer = None
         self.glob_path = glob_path
         self.frame_data = frame_data
         self.repititions = repititions
         self.finished = True if self.repititions == 0 else False
-        self.load(glob_path, frame_data)
+        if glob_path is not None:
+            self.load(glob_path, frame_data)
+
+    @classmethod
+    def from_sprite_sheet(
+            cls,
+            path: str,
+            frame_size: Point,
+            frame_data: list[int],
+            repititions: int = None,
+            spacing: int = 0,
+            margin: int = 0,
+            cache: AssetCache = None
+        ) -> 'Animation':
+        '''
+        Create an animation from one image with the frames in a grid, read left to right then top to bottom
+        the frames are subsurfaces of the image, so it is loaded and converted once
+        :path: the image's path
+        :frame_size: the width and height of a frame
+        :frame_data: how long each frame is displayed, there are as many frames as items in this
+        :repititions: Optional. defaults to None. same as Animation
+        :spacing: Optional. defaults to 0. pixels between frames
+        :margin: Optional. defaults to 0. pixels around the grid
+        :cache: Optional. defaults to None. same as Animation
+        :raises ValueError: if the image has fewer frames than frame_data
+        '''
+        animation = cls(None, frame_data, repititions, cache)
+        sheet = animation.cache.acquire(path)
+        width, height = frame_size
+        columns = (sheet.get_width() - 2 * margin + spacing) // (width + spacing)
+        rows = (sheet.get_height() - 2 * margin + spacing) // (height + spacing)
+        if columns * rows < len(frame_data):
+            animation.cache.release(path)
+            raise ValueError(f'{path} has {columns * rows} frames, but frame_data has {len(frame_data)}')
+        frames = [
+            sheet.subsurface(Rect(margin + i % columns * (width + spacing), margin + i // columns * (height + spacing), width, height))
+            for i in range(len(frame_data))
+        ]
+        try:
+            animation.set_frames(frames, frame_data, [path])
+        finally:
+            animation.cache.release(path) # set_frames holds it now
+        return animation
 
-    def update(self):
+    @classmethod
+    def from_atlas(cls, manifest_path: str, frame_data: list[int] = None, repititions: int = None, cache: AssetCache = None) -> 'Animation':
+        '''
+        Create an animation from a texture atlas, an image and a JSON manifest of where each frame is in it
+        the manifest looks like {"image": "hero.png", "frames": [{"x": 0, "y": 0, "w": 32, "h": 32, "duration": 5}, ...]}
+        the JSON that Aseprite and TexturePacker export, with {"frame": {"x": ...}} and the image in "meta", also works
+        :manifest_path: the manifest's path, the image's path is relative to it
+        :frame_data: Optional. defaults to None. how long each frame is displayed, read from each frame's "duration" if None
+        :repititions: Optional. defaults to None. same as Animation
+        :cache: Optional. defaults to None. same as Animation
+        :raises ValueError: if frame_data is None and a frame has no duration
+        '''
+        with open(manifest_path) as file:
+            manifest = json.load(file)
+        frames = manifest['frames']
+        if isinstance(frames, dict):
+            frames = list(frames.values())
+        if frame_data is None:
+            if not all('duration' in frame for frame in frames):
+                raise ValueError(f'every frame in {manifest_path} needs a duration, or frame_data must be passed')
+            frame_data = [frame['duration'] for frame in frames]
+        image = manifest['image'] if 'image' in manifest else manifest['meta']['image']
+        path = os.path.join(os.path.dirname(manifest_path), image)
+        animation = cls(None, frame_data, repititions, cache)
+        atlas = animation.cache.acquire(path)
+        rects = [frame.get('frame', frame) for frame in frames]
+        try:
+            animation.set_frames([atlas.subsurface(Rect(rect['x'], rect['y'], rect['w'], rect['h'])) for rect in rects], frame_data, [path])
+        finally:
+            animation.cache.release(path)
+        return animation
+
+    def update(self, elapsed: float = 1):
         '''
-        Indicate a frame has passed
+        Indicate time has passed
+        :elapsed: Optional. defaults to 1. how much time passed, in the same unit as frame_data
+            1 when frame_data is in game frames, or milliseconds since the last update when it is in milliseconds
         '''
         if not self.finished:
-            self.frames_until_next -= 1
-            if self.frames_until_next == 0:
+            self.frames_until_next -= elapsed
+            while self.frames_until_next <= 0 and not self.finished:
                 self.frame_index = (self.frame_index + 1) % self.frame_count
                 self.frames_until_next += self.frames[self.frame_index][1]
                 if self.frame_index == 0 and self.repititions != None:
@@ -372,6 +1075,15 @@ class Animation:
         self.frame_index = 0
         self.frames_until_next = self.frames[0][1]
 
+    def seek(self, time: float):
+        '''
+        Jump to a time in the loop
+        :time: the time from the start of the loop, in the same unit as frame_data, wraps around the loop's length
+        '''
+        time %= self.frame_ends[-1]
+        self.frame_index = bisect_right(self.frame_ends, time)
+        self.frames_until_next = self.frame_ends[self.frame_index] - time
+
     def load(self, glob_path: str, frame_data: list[int]):
         '''
         Load animations from a glob path
@@ -384,12 +1096,135 @@ class Animation:
         file_names = glob(glob_path)
         if len(file_names) != len(frame_data):
             raise ValueError('Length of frame_data and the number of files must be the same')
-        self.frames = [(pygame.image.load(file_name), frame_data[i]) for i, file_name in enumerate(file_names)]
+        self.glob_path = glob_path
+        frames = []
+        try:
+            for file_name in file_names:
+                frames.append(self.cache.acquire(file_name))
+            self.set_frames(frames, frame_data, file_names)
+        finally:
+            for file_name in file_names[:len(frames)]:
+                self.cache.release(file_name) # set_frames holds them now
+
+    def set_frames(self, frames: list[pygame.Surface], frame_data: list[int], file_names: list[str] = ()):
+        '''
+        Use surfaces that are already loaded as the frames
+        :frames: the surfaces
+        :frame_data: how long each frame should be displayed, this must be the same length as frames
+        :file_names: Optional. defaults to (). paths in {self.cache} the frames come from, they are held until {self.release}
+        '''
+        if len(frames) != len(frame_data):
+            raise ValueError('Length of frame_data and the number of frames must be the same')
+        if sum(frame_data) <= 0:
+            raise ValueError('frame_data must add up to more than 0')
+        for file_name in file_names:
+            self.cache.acquire(file_name)
+        self.release()
+        self.file_names = list(file_names)
+        # released when the animation is garbage collected, if release is not called first
+        self._finalizer = weakref.finalize(self, _release_assets, self.cache, tuple(file_names))
+        self.frame_data = frame_data
+        self.frames = list(zip(frames, frame_data))
+        self.frame_ends = list(accumulate(frame_data))
         self.frame_count = len(self.frames)
         self.frame_index = 0
         self.frames_until_next = self.frames[0][1]
 
+    def release(self):
+        '''
+        let the cache drop the frames once no other Animation uses them, the animation can not be drawn until it is loaded again
+        this happens on its own when the animation is garbage collected
+        '''
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self.file_names = []
+
+class AnimationPlayer:
+    '''
+    Plays an Animation for any number of sprites from one shared clock
+    a sprite only keeps the time it started, returned by {self.start}, instead of its own Animation
+    and {self.update} is called once per frame instead of once per sprite
+    :example:
+
+        walk = AnimationPlayer(Animation.from_sprite_sheet('walk.png', (16, 16), [100] * 8)) # milliseconds
+        enemies = [Enemy(start = walk.start(offset = i * 37)) for i in range(1000)]
+        # every frame
+        walk.update(self.frame_time * 1000)
+        for enemy in enemies:
+            self.screen.blit(walk.get_surface(enemy.start), enemy.position)
+    '''
+
+    def __init__(self, animation: Animation, repititions: int = None):
+        '''
+        :animation: the loaded animation, its frames are shared and not copied
+        :repititions: Optional. defaults to None. how many times each sprite plays the loop, forever if None,
+            a sprite that is finished shows the last frame
+        '''
+        self.animation = animation
+        self.frames = tuple(surface for surface, _ in animation.frames)
+        self.frame_ends = tuple(animation.frame_ends)
+        self.duration = self.frame_ends[-1]
+        self.repititions = repititions
+        self.time = 0
+
+    def update(self, elapsed: float = 1):
+        '''
+        Advance the shared clock
+        :elapsed: Optional. defaults to 1. how much time passed, in the same unit as the animation's frame_data
+        '''
+        self.time += elapsed
+
+    def start(self, offset: float = 0) -> float:
+        '''
+        Start playing for a sprite
+        :offset: Optional. defaults to 0. how far into the loop to start, so sprites do not all move together
+        :returns: the start time to keep and pass to the other methods
+        '''
+        return self.time - offset
+
+    def is_finished(self, start: float) -> bool:
+        '''
+        :start: the time from {self.start}
+        :returns: True if the sprite has played every repitition
+        '''
+        return self.repititions is not None and self.time - start >= self.duration * self.repititions
+
+    def get_frame_index(self, start: float) -> int:
+        '''
+        Find the frame a sprite is on with a binary search of the frame end times
+        :start: the time from {self.start}
+        :returns: the index of the frame
+        '''
+        elapsed = self.time - start
+        if self.repititions is not None and elapsed >= self.duration * self.repititions:
+            return len(self.frames) - 1
+        return bisect_right(self.frame_ends, elapsed % self.duration)
+
+    def get_surface(self, start: float) -> pygame.Surface:
+        '''
+        :start: the time from {self.start}
+        :returns: the frame a sprite is on
+        '''
+        elapsed = self.time - start
+        if self.repititions is not None and elapsed >= self.duration * self.repititions:
+            return self.frames[-1]
+        return self.frames[bisect_right(self.frame_ends, elapsed % self.duration)]
+
+    def get_frame_indices(self, starts: np.ndarray) -> np.ndarray:
+        '''
+        Find the frame of many sprites at once
+        :starts: the times from {self.start}
+        :returns: the index of each sprite's frame
+        '''
+        elapsed = self.time - np.asarray(starts, dtype = np.float64)
+        indices = np.searchsorted(self.frame_ends, elapsed % self.duration, 'right')
+        if self.repititions is not None:
+            indices[elapsed >= self.duration * self.repititions] = len(self.frames) - 1
+        return indices
+
 class Circle:
+    __slots__ = ('_center', '_radius', 'diameter', 'color', 'width', 'rect', '_spatial_hash')
 
     def __init__(self, center: Point, radius: int, color: Color, width: int = 0):
         self._center = Point._make(center)
@@ -399,6 +1234,7 @@ class Circle:
         self.width = width
         self.rect = Rect(0, 0, self.diameter, self.diameter)
         self.rect.center = self.center
+        self._spatial_hash = None
 
     @property
     def radius(self) -> int:
@@ -411,20 +1247,46 @@ class Circle:
         self.rect.w = self.diameter
         self.rect.h = self.diameter
         self.rect.center = self.center
+        if self._spatial_hash is not None:
+            self._spatial_hash.update(self)
 
     @property
     def center(self) -> Point:
+        '''
+        the circle's own Point, it is moved in place by Particle.update and reset
+        copy it with Point._make to keep a previous position
+        '''
         return self._center
 
     @center.setter
     def center(self, center: Point):
-        self._center = center
-        if not isinstance(self._center, Point):
-            self._center = Point._make(self._center)
-        self.rect.center = self.center
+        self._center = Point._make(center) # always a copy, so moving the circle never moves the caller's Point
+        self.rect.center = self._center
+        if self._spatial_hash is not None:
+            self._spatial_hash.update(self)
 
-    def draw(self, screen: pygame.Surface):
-        pygame.draw.rect(screen, self.color, self.rect, self.width, self.radius)
+    def reset(self, center: Point, radius: int, color: Color, width: int = 0):
+        '''
+        set up the circle again with new values, writing into its own Point and Rect instead of allocating new ones
+        takes the same arguments as the constructor
+        '''
+        self._center.x, self._center.y = center # only the values are taken, so the caller's Point is never written to
+        self._radius = radius
+        self.diameter = radius * 2
+        self.color = color
+        self.width = width
+        self.rect.size = self.diameter, self.diameter
+        self.rect.center = self._center
+        if self._spatial_hash is not None:
+            self._spatial_hash.update(self)
+
+    def draw(self, screen: pygame.Surface) -> Rect:
+        '''
+        draw the circle to the screen
+        :screen: the screen to draw to
+        :returns: the area drawn to
+        '''
+        return pygame.draw.rect(screen, self.color, self.rect, self.width, self.radius)
 
     def collide_point(self, point: Point, only_border: bool = False) -> bool:
         if not isinstance(point, Point):
@@ -433,31 +1295,712 @@ class Circle:
         return only_border and dist <= self.radius and dist >= self.radius - self.width + 1 or (not only_border and dist <= self.radius)
 
 class Particle(Circle):
+    __slots__ = ('_velocity', 'lifetime', 'radius_decrement', 'frames_between_decrement', 'decrement_counter', 'alive')
 
     def __init__(self, center: Point, radius: int, color: Color, velocity: Point, lifetime: int = None, radius_decrement: int = None, frames_between_decrement: int = 1):
         super().__init__(center, radius, color)
-        self.velocity = velocity
-        if not isinstance(self.velocity, Point):
-            self.velocity = Point._make(self.velocity)
+        self._velocity = Point._make(velocity)
+        self.lifetime = lifetime
+        self.radius_decrement = radius_decrement
+        self.frames_between_decrement = frames_between_decrement
+        self.decrement_counter = 0 # the radius shrinks on the first update and then every {self.frames_between_decrement} updates
+        self.alive = True
+
+    @property
+    def velocity(self) -> Point:
+        '''the particle's own Point, it can be changed in place, e.g.: particle.velocity.y += gravity'''
+        return self._velocity
+
+    @velocity.setter
+    def velocity(self, velocity: Point):
+        self._velocity = Point._make(velocity) # always a copy, so reset never writes to the caller's Point
+
+    def reset(self, center: Point, radius: int, color: Color, velocity: Point, lifetime: int = None, radius_decrement: int = None, frames_between_decrement: int = 1):
+        '''
+        set up the particle again with new values, writing into its own Points and Rect instead of allocating new ones
+        takes the same arguments as the constructor
+        '''
+        super().reset(center, radius, color)
+        self._velocity.x, self._velocity.y = velocity
         self.lifetime = lifetime
         self.radius_decrement = radius_decrement
-        self.radius_decrement_timer = TrueEvery(frames_between_decrement)
+        self.frames_between_decrement = frames_between_decrement
+        self.decrement_counter = 0
         self.alive = True
 
     def update(self):
         if self.alive:
-            self.center = self.center.x + self.velocity.x, self.center.y + self.velocity.y
+            self._center += self._velocity # in place, the Point is the particle's own so nothing else moves
+            self.rect.center = self._center
+            if self._spatial_hash is not None:
+                self._spatial_hash.update(self)
             if self.lifetime != None:
                 self.lifetime -= 1
                 if self.lifetime <= 0:
                     self.alive = False
-            if self.radius_decrement != None and self.radius_decrement_timer():
-                self.radius -= self.radius_decrement
-                if self.radius <= 0:
-                    self.alive = False
+            if self.radius_decrement != None:
+                self.decrement_counter -= 1
+                if self.decrement_counter <= 0:
+                    self.decrement_counter = self.frames_between_decrement
+                    self.radius -= self.radius_decrement
+                    if self.radius <= 0:
+                        self.alive = False
+
+class ParticleSystem: #forward declaration
+    pass
 
-class Button:
-    '''A button in a pygame application'''
+class CircleRenderer:
+    '''
+    Draws many circles with a single Surface.fblits call
+    every (radius, color, width) combination is rasterized once into a cached sprite
+    when the cache is full, circles with new combinations are drawn directly
+    :example:
+
+        renderer = CircleRenderer()
+        class Example(GameScreen):
+            def update(self):
+                super().update()
+                renderer.draw(self.screen, particles) # particles is a list of Circle or a ParticleSystem
+    '''
+
+    def __init__(self, max_sprites: int = 1024):
+        '''
+        :max_sprites: Optional. defaults to 1024. the most sprites that will be cached
+        '''
+        self.max_sprites = max_sprites
+        self.sprites = {}
+        self.aliases = {}
+
+    def get_sprite(self, radius: int, color: Color, width: int = 0) -> Optional[pygame.Surface]:
+        '''
+        get the cached sprite for a circle, creating it if there is room in the cache
+        :radius: the radius of the circle
+        :color: the color of the circle
+        :width: Optional. defaults to 0. the width of the circle outline, 0 fills the circle
+        :returns: the sprite or None if it is not cached and the cache is full
+        '''
+        if not isinstance(color, (str, tuple, int)): # pygame.Color, lists, and arrays can not be dict keys
+            color = tuple(color)
+        key = (radius, color, width)
+        sprite = self.aliases.get(key)
+        if sprite is not None:
+            return sprite
+        rgba = tuple(pygame.Color(color))
+        sprite = self.sprites.get((radius, rgba, width))
+        if sprite is None:
+            if len(self.sprites) >= self.max_sprites:
+                return None
+            diameter = radius * 2
+            colorkey = (0, 0, 0) if rgba[:3] != (0, 0, 0) else (255, 255, 255)
+            sprite = pygame.Surface((diameter, diameter))
+            sprite.fill(colorkey)
+            pygame.draw.rect(sprite, rgba, sprite.get_rect(), width, radius)
+            sprite.set_colorkey(colorkey, RLEACCEL)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert()
+            self.sprites[(radius, rgba, width)] = sprite
+        # remember how this color was spelled (e.g. 'white' or (255, 255, 255)) to skip converting it next time
+        self.aliases[key] = sprite
+        return sprite
+
+    def clear(self):
+        '''remove every cached sprite'''
+        self.sprites.clear()
+        self.aliases.clear()
+
+    def draw(self, screen: pygame.Surface, circles: list[Circle] | ParticleSystem):
+        '''
+        draw every circle
+        :screen: the screen to draw to
+        :circles: an iterable of Circle objects (e.g. Particle) or a ParticleSystem
+        '''
+        if isinstance(circles, ParticleSystem):
+            self._draw_particle_system(screen, circles)
+            return
+        aliases = self.aliases
+        blit_sequence = []
+        append = blit_sequence.append
+        for circle in circles:
+            radius, color, width = key = circle.radius, circle.color, circle.width
+            try:
+                append((aliases[key], circle.rect.topleft))
+                continue
+            except (KeyError, TypeError): # not cached yet or an unhashable color such as pygame.Color
+                pass
+            if radius <= 0:
+                continue
+            sprite = self.get_sprite(radius, color, width)
+            if sprite is None:
+                pygame.draw.rect(screen, color, circle.rect, width, radius)
+            else:
+                append((sprite, circle.rect.topleft))
+        self._blits(screen, blit_sequence)
+
+    def _draw_particle_system(self, screen: pygame.Surface, system: ParticleSystem):
+        '''
+        draw a ParticleSystem, grouping particles that share a sprite with numpy instead of looking each one up
+        :screen: the screen to draw to
+        :system: the particles to draw
+        '''
+        n = system.count
+        radii = system.radii[:n].astype(np.int64)
+        centers = system.centers[:n]
+        # round half away from zero like Rect.center does, np.rint would round .5 to even and be a pixel off from Particle
+        lefts = np.trunc(centers + np.copysign(0.5, centers)).astype(np.int64) - radii[:, None]
+        keys = (radii << 32) | system.colors[:n].view(np.uint32)[:, 0]
+        unique_keys, first, inverse = np.unique(keys, return_index = True, return_inverse = True)
+        order = np.argsort(inverse, kind = 'stable')
+        bounds = np.searchsorted(inverse[order], np.arange(len(unique_keys) + 1))
+        for group, index in enumerate(first.tolist()):
+            radius = int(radii[index])
+            if radius <= 0:
+                continue
+            members = order[bounds[group]:bounds[group + 1]]
+            color = tuple(system.colors[index].tolist())
+            sprite = self.get_sprite(radius, color)
+            if sprite is None:
+                for x, y in lefts[members].tolist():
+                    pygame.draw.rect(screen, color, (x, y, radius * 2, radius * 2), 0, radius)
+            else:
+                self._blits(screen, zip(repeat(sprite), lefts[members].tolist()))
+
+    @staticmethod
+    def _blits(screen: pygame.Surface, blit_sequence: list[tuple[pygame.Surface, Point]]):
+        '''blit everything in one call, using fblits when it is available'''
+        if hasattr(screen, 'fblits'):
+            screen.fblits(blit_sequence)
+        else:
+            screen.blits(blit_sequence, False)
+
+class ParticleSystem:
+    '''
+    A group of particles stored in contiguous numpy arrays (one array per attribute)
+    behaves like a list of Particle objects but updates all of them in one vectorized call
+    dead particles are removed by swapping the last living particles into their slots
+    :example:
+
+        system = ParticleSystem(gravity = (0, 9.8 / 50))
+        class Example(GameScreen):
+            def update(self):
+                super().update()
+                system.emit(100, self.window_size / 2, 4, 'white', np.random.uniform(-3, 3, (100, 2)), None, 1, 4)
+                system.update()
+                system.draw(self.screen)
+    '''
+
+    def __init__(self, capacity: int = 1024, gravity: Point = (0, 0), drag: float = 0, renderer: CircleRenderer = None):
+        '''
+        :capacity: Optional. defaults to 1024. the number of particles to allocate room for, grows as needed
+        :gravity: Optional. defaults to (0, 0). added to the velocity of every particle after it moves
+        :drag: Optional. defaults to 0. the fraction of velocity lost every update
+        :renderer: Optional. defaults to a new CircleRenderer. the renderer used by {self.draw}
+        '''
+        self.count = 0
+        self.gravity = Point._make(gravity)
+        self.drag = drag
+        self.renderer = renderer if renderer is not None else CircleRenderer()
+        self._allocate(capacity)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _allocate(self, capacity: int):
+        '''
+        resize every array to hold {capacity} particles keeping the living ones
+        :capacity: the new capacity
+        '''
+        arrays = {
+            'centers': np.zeros((capacity, 2)),
+            'velocities': np.zeros((capacity, 2)),
+            'radii': np.zeros(capacity),
+            'colors': np.zeros((capacity, 4), np.uint8),
+            'lifetimes': np.zeros(capacity),
+            'radius_decrements': np.zeros(capacity),
+            'frames_between_decrements': np.zeros(capacity, np.int64),
+            'decrement_counters': np.zeros(capacity, np.int64),
+        }
+        for name, array in arrays.items():
+            if self.count:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def emit(
+            self,
+            n: int,
+            center: Point,
+            radius: int,
+            color: Color,
+            velocity: Point,
+            lifetime: int = None,
+            radius_decrement: int = None,
+            frames_between_decrement: int = 1
+        ):
+        '''
+        add {n} particles with the same meaning as the arguments of Particle
+        every argument can be a single value shared by all new particles or an array with one value per particle
+        :n: the number of particles to add
+        :center: the starting position
+        :radius: the starting radius
+        :color: the color, a single pygame color or an array of shape (n, 3) or (n, 4)
+        :velocity: how far the particle moves every update
+        :lifetime: Optional. defaults to None. number of updates the particle lives for, None lives forever
+        :radius_decrement: Optional. defaults to None. how much the radius shrinks, None never shrinks
+        :frames_between_decrement: Optional. defaults to 1. how many updates between radius shrinks
+        '''
+        if n <= 0:
+            return
+        if self.count + n > self.capacity:
+            self._allocate(max(self.count + n, self.capacity * 2))
+        new = slice(self.count, self.count + n)
+        self.centers[new] = center
+        self.velocities[new] = velocity
+        self.radii[new] = radius
+        if np.ndim(color) == 2:
+            color = np.asarray(color)
+            self.colors[new, :color.shape[1]] = color
+            if color.shape[1] == 3:
+                self.colors[new, 3] = 255
+        else:
+            self.colors[new] = tuple(pygame.Color(color))
+        self.lifetimes[new] = np.inf if lifetime is None else lifetime
+        self.radius_decrements[new] = 0 if radius_decrement is None else radius_decrement
+        self.frames_between_decrements[new] = frames_between_decrement
+        self.decrement_counters[new] = 0
+        self.count += n
+
+    def update(self):
+        '''
+        move every particle, apply gravity and drag, shrink radii, and remove dead particles
+        '''
+        n = self.count
+        if n == 0:
+            return
+        centers = self.centers[:n]
+        velocities = self.velocities[:n]
+        radii = self.radii[:n]
+        lifetimes = self.lifetimes[:n]
+        counters = self.decrement_counters[:n]
+        decrements = self.radius_decrements[:n]
+        centers += velocities
+        velocities += self.gravity
+        if self.drag:
+            velocities *= 1 - self.drag
+        lifetimes -= 1
+        # same schedule as TrueEvery: shrink on the first update then every frames_between_decrement updates
+        counters -= 1
+        shrink = counters <= 0
+        counters[shrink] = self.frames_between_decrements[:n][shrink]
+        radii -= np.where(shrink, decrements, 0)
+        alive = (lifetimes > 0) & ((radii > 0) | (decrements == 0))
+        self._compact(alive)
+
+    def _compact(self, alive: np.ndarray):
+        '''
+        remove dead particles by moving living particles from the end into their slots
+        :alive: bool array with one value for every current particle
+        '''
+        new_count = int(np.count_nonzero(alive))
+        if new_count == self.count:
+            return
+        holes = np.flatnonzero(~alive[:new_count])
+        movers = np.flatnonzero(alive[new_count:]) + new_count
+        if len(holes):
+            for array in (
+                    self.centers,
+                    self.velocities,
+                    self.radii,
+                    self.colors,
+                    self.lifetimes,
+                    self.radius_decrements,
+                    self.frames_between_decrements,
+                    self.decrement_counters,
+                ):
+                array[holes] = array[movers]
+        self.count = new_count
+
+    def clear(self):
+        '''remove every particle'''
+        self.count = 0
+
+    def draw(self, screen: pygame.Surface):
+        '''
+        draw every particle the same way Circle.draw would
+        :screen: the screen to draw to
+        '''
+        self.renderer.draw(screen, self)
+
+class ParticlePool:
+    '''
+    Keeps Particles to reuse, so emitting particles every frame does not allocate any
+    the first {self.count} particles in {self.particles} are in use, a particle whose alive becomes False
+    is swapped with the last one in use and reused by a later acquire, so nothing is removed from the middle of a list
+    :example:
+
+        pool = ParticlePool(500)
+        # every frame
+        pool.acquire(center = emitter, radius = 6, color = (255, 255, 255), velocity = (randint(-3, 3), -4), lifetime = 60)
+        for particle in pool: # dead particles are released and skipped
+            particle.update()
+            particle.draw(self.screen)
+    '''
+
+    def __init__(self, capacity: int = 256, cls: Type[Particle] = Particle):
+        '''
+        :capacity: Optional. defaults to 256. how many particles to create up front, the pool grows if more are in use at once
+        :cls: Optional. defaults to Particle. the particle class, it needs the same reset method as Particle
+        '''
+        self.cls = cls
+        self.particles = [self._create() for _ in range(capacity)]
+        self.count = 0
+        self.high_water_mark = 0
+        self.allocations = 0 # particles created after the first capacity because the pool was full
+        self.acquired = 0
+
+    def _create(self) -> Particle:
+        particle = self.cls((0, 0), 0, (0, 0, 0), (0, 0))
+        particle.alive = False
+        return particle
+
+    def acquire(self, **init) -> Particle:
+        '''
+        get an unused particle and set it up
+        :init: the arguments of Particle's constructor by name
+        :returns: the particle, it is used until its alive is False
+        '''
+        if self.count == len(self.particles):
+            self.particles.append(self._create())
+            self.allocations += 1
+        particle = self.particles[self.count]
+        particle.reset(**init)
+        self.count += 1
+        self.acquired += 1
+        if self.count > self.high_water_mark:
+            self.high_water_mark = self.count
+        return particle
+
+    def _release(self, index: int):
+        '''swap the particle at index with the last one in use and stop using it'''
+        last = self.count - 1
+        particles = self.particles
+        particles[index], particles[last] = particles[last], particles[index]
+        self.count = last
+
+    def __iter__(self):
+        '''iterate over the particles in use, releasing any that are no longer alive'''
+        particles = self.particles
+        i = 0
+        while i < self.count:
+            particle = particles[i]
+            if not particle.alive:
+                self._release(i) # the particle swapped in is checked next
+                continue
+            yield particle
+            i += 1
+
+    def __len__(self) -> int:
+        return self.count
+
+    def update(self):
+        '''update every particle in use, ones that die are released on the next update or iteration'''
+        particles = self.particles
+        i = 0
+        while i < self.count: # the same as iterating, without the generator
+            particle = particles[i]
+            if particle.alive:
+                particle.update()
+                i += 1
+            else:
+                self._release(i)
+
+    def draw(self, screen: pygame.Surface, renderer: CircleRenderer = None):
+        '''
+        draw every particle in use
+        :screen: the screen to draw to
+        :renderer: Optional. defaults to None. a CircleRenderer to draw with, each particle draws itself if None
+        '''
+        if renderer is not None:
+            particles = self.particles
+            i = 0
+            while i < self.count: # release the dead particles first so the ones in use are the start of the list
+                if particles[i].alive:
+                    i += 1
+                else:
+                    self._release(i)
+            renderer.draw(screen, islice(particles, self.count))
+        else:
+            for particle in self:
+                particle.draw(screen)
+
+    def clear(self):
+        '''release every particle'''
+        for particle in self.particles[:self.count]:
+            particle.alive = False
+        self.count = 0
+
+    def get_stats(self) -> dict[str, int]:
+        '''
+        :returns: a dict with how many particles are in use ("active"), created ("capacity"), the most in use at once
+            ("high_water_mark"), created because the pool was full ("allocations"), and acquired in total ("acquired")
+        '''
+        return {
+            'active': self.count,
+            'capacity': len(self.particles),
+            'high_water_mark': self.high_water_mark,
+            'allocations': self.allocations,
+            'acquired': self.acquired,
+        }
+
+class SpatialHash:
+    '''
+    A uniform grid that indexes objects by the cells their rect touches
+    works with Circle, Particle, Button, or any object with a rect attribute
+    Circle and Particle move themselves in the grid whenever their center or radius is set,
+    other objects must call {self.update} after their rect changes
+    :example:
+
+        grid = SpatialHash(32)
+        for particle in particles:
+            grid.insert(particle)
+        hovered = grid.query_point(self.get_scaled_mouse_pos())
+        for a, b in grid.pairs():
+            ... # a.rect and b.rect overlap
+    '''
+
+    def __init__(self, cell_size: int = 64):
+        '''
+        :cell_size: Optional. defaults to 64. the width and height of a cell, around the size of a typical object works best
+        '''
+        self.cell_size = cell_size
+        self.cells = {}
+        self.objects = {}
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+    def __contains__(self, obj: object) -> bool:
+        return obj in self.objects
+
+    def __iter__(self):
+        return iter(self.objects)
+
+    def _cell_range(self, rect: Rect) -> tuple[int, int, int, int]:
+        '''
+        :rect: the area to look up
+        :returns: the first and last column and row touched by rect, inclusive
+        '''
+        cell_size = self.cell_size
+        return (
+            rect.left // cell_size,
+            rect.top // cell_size,
+            (rect.left + max(rect.w, 1) - 1) // cell_size,
+            (rect.top + max(rect.h, 1) - 1) // cell_size,
+        )
+
+    def _cells_in(self, cell_range: tuple[int, int, int, int]):
+        '''yield every cell key in a range'''
+        x0, y0, x1, y1 = cell_range
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                yield x, y
+
+    def insert(self, obj: object):
+        '''
+        add an object to the grid
+        :obj: an object with a rect attribute, a Circle can only be in one grid at a time
+        '''
+        if obj in self.objects:
+            self.update(obj)
+            return
+        if isinstance(obj, Circle) and obj._spatial_hash is not None:
+            raise ValueError(f'{obj!r} is already in another SpatialHash, remove it from that one first')
+        cell_range = self._cell_range(obj.rect)
+        self.objects[obj] = cell_range
+        for key in self._cells_in(cell_range):
+            self.cells.setdefault(key, set()).add(obj)
+        if isinstance(obj, Circle):
+            obj._spatial_hash = self
+
+    def remove(self, obj: object):
+        '''
+        remove an object from the grid
+        :obj: an object that was inserted
+        '''
+        cell_range = self.objects.pop(obj)
+        for key in self._cells_in(cell_range):
+            cell = self.cells[key]
+            cell.discard(obj)
+            if not cell:
+                del self.cells[key]
+        if isinstance(obj, Circle) and obj._spatial_hash is self:
+            obj._spatial_hash = None
+
+    def update(self, obj: object):
+        '''
+        move an object to the cells its rect touches now, cheap when it has not left its cells
+        :obj: an object that was inserted
+        '''
+        old_range = self.objects[obj]
+        new_range = self._cell_range(obj.rect)
+        if new_range == old_range:
+            return
+        self.objects[obj] = new_range
+        cells = self.cells
+        for key in self._cells_in(old_range):
+            cell = cells[key]
+            cell.discard(obj)
+            if not cell:
+                del cells[key]
+        for key in self._cells_in(new_range):
+            cells.setdefault(key, set()).add(obj)
+
+    def clear(self):
+        '''remove every object'''
+        for obj in list(self.objects):
+            self.remove(obj)
+
+    def _candidates(self, rect: Rect) -> set:
+        '''every object in a cell touched by rect'''
+        result = set()
+        cells = self.cells
+        for key in self._cells_in(self._cell_range(rect)):
+            cell = cells.get(key)
+            if cell:
+                result |= cell
+        return result
+
+    def query_point(self, point: Point) -> list:
+        '''
+        :point: the position to check
+        :returns: the objects under point, using collide_point for circles and the rect for everything else
+        '''
+        x, y = point
+        cell = self.cells.get((int(x // self.cell_size), int(y // self.cell_size)), ())
+        return [
+            obj for obj in cell
+            if (obj.collide_point(point) if isinstance(obj, Circle) else obj.rect.collidepoint(x, y))
+        ]
+
+    def query_rect(self, rect: Rect) -> list:
+        '''
+        :rect: the area to check
+        :returns: the objects whose rect overlaps rect
+        '''
+        if not isinstance(rect, Rect):
+            rect = Rect(rect)
+        return [obj for obj in self._candidates(rect) if rect.colliderect(obj.rect)]
+
+    def query_radius(self, center: Point, radius: float) -> list:
+        '''
+        :center: the center of the area to check
+        :radius: the radius of the area to check
+        :returns: circles that overlap the area and other objects whose rect overlaps it
+        '''
+        cx, cy = center
+        area = Rect(math.floor(cx - radius), math.floor(cy - radius), math.ceil(radius * 2) + 1, math.ceil(radius * 2) + 1)
+        result = []
+        for obj in self._candidates(area):
+            if isinstance(obj, Circle):
+                if Point.distance(obj.center, center) <= radius + obj.radius:
+                    result.append(obj)
+                continue
+            rect = obj.rect
+            dx = cx - min(max(cx, rect.left), rect.right)
+            dy = cy - min(max(cy, rect.top), rect.bottom)
+            if dx * dx + dy * dy <= radius * radius:
+                result.append(obj)
+        return result
+
+    def pairs(self) -> list[tuple]:
+        '''
+        broad phase collision detection
+        :returns: every pair of objects whose rects overlap, each pair once
+        '''
+        seen = set()
+        result = []
+        for cell in self.cells.values():
+            if len(cell) < 2:
+                continue
+            cell = list(cell)
+            for i, a in enumerate(cell):
+                for b in cell[i + 1:]:
+                    key = (id(a), id(b)) if id(a) < id(b) else (id(b), id(a))
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    if a.rect.colliderect(b.rect):
+                        result.append((a, b))
+        return result
+
+def _compose_button_surface(
+        size: tuple[int, int],
+        rect_color: Color,
+        rect_line_width: int,
+        border_radius: int,
+        border_size: int,
+        border_color: Color,
+        text_obj: pygame.Surface
+    ) -> tuple[pygame.Surface, tuple[int, int]]:
+    '''
+    draw a button's rect, border, and text onto one surface
+    :size: the size of the button's rect
+    :text_obj: the rendered text, centered on the rect
+    :returns: the surface and where its top left is relative to the rect, the surface grows to fit text wider than the rect
+    '''
+    rect = Rect((0, 0), size)
+    text_size = text_obj.get_size()
+    text_pos = (int(rect.centerx - text_size[0] / 2), int(rect.centery - text_size[1] / 2))
+    bounds = rect.union(Rect(text_pos, text_size))
+    if bounds == rect and rect_line_width == 0 and border_radius <= 0 and pygame.Color(rect_color).a == 255:
+        surface = pygame.Surface(bounds.size) # nothing is see through, so skip per pixel alpha which is much slower to blit
+    else:
+        surface = pygame.Surface(bounds.size, SRCALPHA)
+    rect.topleft = (-bounds.x, -bounds.y)
+    pygame.draw.rect(surface, rect_color, rect, rect_line_width, border_radius)
+    if border_size > 0:
+        pygame.draw.rect(surface, border_color, rect, border_size, border_radius)
+    surface.blit(text_obj, (text_pos[0] - bounds.x, text_pos[1] - bounds.y))
+    return surface, bounds.topleft
+
+class Button:
+    '''
+    A button in a pygame application
+    each look of the button (normal, highlighted, clicked) is drawn once and cached,
+    setting any attribute that changes how it looks clears the cache
+    '''
+    __slots__ = (
+        'action',
+        'text',
+        'rect',
+        'font',
+        'rect_color',
+        'font_color',
+        'highlight_color',
+        'rect_line_width',
+        'border_radius',
+        'border_size',
+        'border_color',
+        'clicked_color',
+        'antialias',
+        'clicked',
+        'highlight',
+        'dirty',
+        '_surfaces',
+        '_surface_size',
+    )
+    _style_attributes = frozenset((
+        'text',
+        'font',
+        'rect_color',
+        'font_color',
+        'highlight_color',
+        'rect_line_width',
+        'border_radius',
+        'border_size',
+        'border_color',
+        'clicked_color',
+        'antialias',
+    ))
 
     def __init__(
             self,
@@ -490,15 +2033,49 @@ class Button:
         self.antialias = antialias
         self.clicked = False
         self.highlight = False
+        self._surfaces = {}
+        self._surface_size = None
+
+    def __setattr__(self, name: str, value: any):
+        object.__setattr__(self, name, value)
+        if name in self._style_attributes:
+            object.__setattr__(self, 'dirty', True)
+
+    def get_surface(self, clicked: bool, highlight: bool) -> tuple[pygame.Surface, tuple[int, int]]:
+        '''
+        get the cached look of the button, drawing it if needed
+        :clicked: whether to get the clicked look, this takes priority over highlight
+        :highlight: whether to get the highlighted look
+        :returns: the surface and where its top left is relative to {self.rect}
+        '''
+        if self.dirty or self.rect.size != self._surface_size:
+            self._surfaces.clear()
+            self._surface_size = self.rect.size
+            self.dirty = False
+        key = 'clicked' if clicked else 'highlight' if highlight else 'normal'
+        cached = self._surfaces.get(key)
+        if cached is None:
+            cached = self._surfaces[key] = _compose_button_surface(
+                self.rect.size,
+                self.clicked_color if clicked else self.highlight_color if highlight else self.rect_color,
+                self.rect_line_width,
+                self.border_radius,
+                self.border_size,
+                self.border_color,
+                self.font.render(self.text, self.antialias, self.font_color)
+            )
+        return cached
 
-    def draw(self, screen: pygame.Surface, override_highlight: bool = None):
-        pygame.draw.rect(screen, self.clicked_color if self.clicked else self.highlight_color if (override_highlight == None and self.highlight) or override_highlight else self.rect_color, self.rect, self.rect_line_width, self.border_radius)
+    def draw(self, screen: pygame.Surface, override_highlight: bool = None) -> Rect:
+        '''
+        draw the button to the screen
+        :screen: the screen to draw to
+        :override_highlight: Optional. defaults to None. draw highlighted if True, or not highlighted if False, instead of using {self.highlight}
+        :returns: the area drawn to
+        '''
+        surface, (x, y) = self.get_surface(self.clicked, bool((override_highlight == None and self.highlight) or override_highlight))
         self.clicked = False
-        if self.border_size > 0:
-            pygame.draw.rect(screen, self.border_color, self.rect, self.border_size, self.border_radius)
-        text_obj = self.font.render(self.text, self.antialias, self.font_color)
-        text_size = text_obj.get_size()
-        screen.blit(text_obj, (self.rect.centerx - text_size[0] / 2, self.rect.centery - text_size[1] / 2))
+        return screen.blit(surface, (self.rect.x + x, self.rect.y + y))
 
     def __call__(self):
         '''Overwrite the () operator on the button object'''
@@ -507,7 +2084,50 @@ class Button:
         self.clicked = True
 
 class ToggleButton:
-    '''When clickd this button will change its color, text, and also call target'''
+    '''
+    When clickd this button will change its color, text, and also call target
+    each look of the button (on or off, highlighted or not) is drawn once and cached,
+    setting any attribute that changes how it looks clears the cache
+    '''
+    __slots__ = (
+        'action',
+        'on_text',
+        'off_text',
+        'rect',
+        'font',
+        'on_rect_color',
+        'off_rect_color',
+        'on_highlight_color',
+        'off_highlight_color',
+        'on_font_color',
+        'off_font_color',
+        'rect_line_width',
+        'border_radius',
+        'border_size',
+        'on_border_color',
+        'off_border_color',
+        'highlight',
+        'toggled',
+        'dirty',
+        '_surfaces',
+        '_surface_size',
+    )
+    _style_attributes = frozenset((
+        'on_text',
+        'off_text',
+        'font',
+        'on_rect_color',
+        'off_rect_color',
+        'on_highlight_color',
+        'off_highlight_color',
+        'on_font_color',
+        'off_font_color',
+        'rect_line_width',
+        'border_radius',
+        'border_size',
+        'on_border_color',
+        'off_border_color',
+    ))
 
     def __init__(
             self,
@@ -532,7 +2152,7 @@ class ToggleButton:
         self.action = action
         self.on_text = on_text
         self.off_text = off_text
-        self.rect = rect
+        self.rect = rect if isinstance(rect, Rect) else Rect(rect)
         self.font = font
         self.on_rect_color = on_rect_color
         self.off_rect_color = off_rect_color if off_rect_color else on_rect_color
@@ -547,22 +2167,60 @@ class ToggleButton:
         self.off_border_color = off_border_color if off_border_color else on_border_color
         self.highlight = False
         self.toggled = toggled
+        self._surfaces = {}
+        self._surface_size = None
 
-    def draw(self, screen: pygame.Surface, override_highlight: bool = None):
-        if self.toggled:
-            pygame.draw.rect(screen, self.on_highlight_color if (override_highlight == None and self.highlight) or override_highlight else self.on_rect_color, self.rect, self.rect_line_width, self.border_radius)
-            if self.border_size > 0:
-                pygame.draw.rect(screen, self.on_border_color, self.rect, self.border_size, self.border_radius)
-            text_obj = self.font.render(self.on_text, True, self.on_font_color)
-            text_size = text_obj.get_size()
-            screen.blit(text_obj, (self.rect.centerx - text_size[0] / 2, self.rect.centery - text_size[1] / 2))
-        else:
-            pygame.draw.rect(screen, self.off_highlight_color if (override_highlight == None and self.highlight) or override_highlight else self.off_rect_color, self.rect, self.rect_line_width, self.border_radius)
-            if self.border_size > 0:
-                pygame.draw.rect(screen, self.off_border_color, self.rect, self.border_size, self.border_radius)
-            text_obj = self.font.render(self.off_text, True, self.off_font_color)
-            text_size = text_obj.get_size()
-            screen.blit(text_obj, (self.rect.centerx - text_size[0] / 2, self.rect.centery - text_size[1] / 2))
+    def __setattr__(self, name: str, value: any):
+        object.__setattr__(self, name, value)
+        if name in self._style_attributes:
+            object.__setattr__(self, 'dirty', True)
+
+    def get_surface(self, toggled: bool, highlight: bool) -> tuple[pygame.Surface, tuple[int, int]]:
+        '''
+        get the cached look of the button, drawing it if needed
+        :toggled: whether to get the on or off look
+        :highlight: whether to get the highlighted look
+        :returns: the surface and where its top left is relative to {self.rect}
+        '''
+        if self.dirty or self.rect.size != self._surface_size:
+            self._surfaces.clear()
+            self._surface_size = self.rect.size
+            self.dirty = False
+        key = (toggled, highlight)
+        cached = self._surfaces.get(key)
+        if cached is None:
+            if toggled:
+                cached = _compose_button_surface(
+                    self.rect.size,
+                    self.on_highlight_color if highlight else self.on_rect_color,
+                    self.rect_line_width,
+                    self.border_radius,
+                    self.border_size,
+                    self.on_border_color,
+                    self.font.render(self.on_text, True, self.on_font_color)
+                )
+            else:
+                cached = _compose_button_surface(
+                    self.rect.size,
+                    self.off_highlight_color if highlight else self.off_rect_color,
+                    self.rect_line_width,
+                    self.border_radius,
+                    self.border_size,
+                    self.off_border_color,
+                    self.font.render(self.off_text, True, self.off_font_color)
+                )
+            self._surfaces[key] = cached
+        return cached
+
+    def draw(self, screen: pygame.Surface, override_highlight: bool = None) -> Rect:
+        '''
+        draw the button to the screen
+        :screen: the screen to draw to
+        :override_highlight: Optional. defaults to None. draw highlighted if True, or not highlighted if False, instead of using {self.highlight}
+        :returns: the area drawn to
+        '''
+        surface, (x, y) = self.get_surface(self.toggled, bool((override_highlight == None and self.highlight) or override_highlight))
+        return screen.blit(surface, (self.rect.x + x, self.rect.y + y))
 
     def __call__(self):
         '''override the ()'''
@@ -570,6 +2228,163 @@ class ToggleButton:
             self.action()
         self.toggled = not self.toggled
 
+class _ProfileSection:
+    '''
+    A reusable context manager that adds the time spent inside it to a section of a FrameProfiler
+    it can be entered again while it is already open, e.g.: by a recursive function, only the outermost one is counted
+    '''
+
+    def __init__(self, profiler: 'FrameProfiler', name: str):
+        self.profiler = profiler
+        self.name = name
+        self.starts = [] # one for every time it is open, the first is the outermost
+
+    def __enter__(self):
+        self.starts.append(_perf_counter())
+        return self
+
+    def __exit__(self, *exc_info):
+        start = self.starts.pop()
+        if self.starts: # the outer one already counts this time
+            return
+        sections = self.profiler.current_sections
+        sections[self.name] = sections.get(self.name, 0) + (_perf_counter() - start) * 1000
+
+class FrameProfiler:
+    '''
+    Times whole frames and named sections of frames, keeping the last few frames in ring buffers
+    sections can be nested, a nested section's time is also counted in the section around it
+    a section nested in one with the same name is only counted once
+    '''
+
+    def __init__(self, history: int = 120, overlay_interval: float = 0.5):
+        '''
+        :history: Optional. defaults to 120. how many frames to keep timings for
+        :overlay_interval: Optional. defaults to 0.5. seconds between re-rendering the overlay text
+        '''
+        self.history = history
+        self.overlay_interval = overlay_interval
+        self.frame_times = np.zeros(history)
+        self.section_times = {}
+        self.current_sections = {}
+        self.count = 0 # frames recorded in total, the buffers hold the last min(count, history)
+        self._section_managers = {}
+        self._frame_start = None
+        self._overlay = None
+        self._overlay_time = -math.inf
+
+    def section(self, name: str) -> _ProfileSection:
+        '''
+        :name: the name of the section
+        :returns: a context manager that times the code inside it as part of the section
+        '''
+        manager = self._section_managers.get(name)
+        if manager is None:
+            manager = self._section_managers[name] = _ProfileSection(self, name)
+        return manager
+
+    def start_frame(self):
+        '''start timing a frame'''
+        self._frame_start = _perf_counter()
+        self.current_sections = {}
+
+    def end_frame(self):
+        '''stop timing the frame and store it and its sections in the ring buffers'''
+        if self._frame_start is None:
+            return
+        index = self.count % self.history
+        self.frame_times[index] = (_perf_counter() - self._frame_start) * 1000
+        for name, time in self.current_sections.items():
+            if name not in self.section_times:
+                self.section_times[name] = np.zeros(self.history)
+        for name, times in self.section_times.items():
+            times[index] = self.current_sections.get(name, 0)
+        self.count += 1
+        self._frame_start = None
+
+    def _recorded(self, times: np.ndarray) -> np.ndarray:
+        return times[:min(self.count, self.history)]
+
+    def get_fps(self) -> float:
+        '''
+        :returns: the average frames per second over the frames in the buffer
+        '''
+        mean = self._recorded(self.frame_times).mean() if self.count else 0
+        return 1000 / mean if mean else 0
+
+    def get_stats(self) -> dict:
+        '''
+        :returns: a dict with the fps, stats for the whole frame, and stats for every section in milliseconds
+            stats are from percentile_stats
+        '''
+        return {
+            'fps': self.get_fps(),
+            'frame': percentile_stats(self._recorded(self.frame_times)),
+            'sections': {name: percentile_stats(self._recorded(times)) for name, times in self.section_times.items()},
+        }
+
+    def get_overlay(self, font: pygame.font.Font, color: pygame.Color = (255, 255, 255), background: pygame.Color = (0, 0, 0)) -> pygame.Surface:
+        '''
+        get a surface showing the fps and the mean and p95 of every section
+        the text is only re-rendered every {self.overlay_interval} seconds, otherwise the last surface is returned
+        :font: the font to render with
+        :color: Optional. defaults to (255, 255, 255). the text color
+        :background: Optional. defaults to (0, 0, 0). the background color
+        :returns: the overlay surface
+        '''
+        now = _perf_counter()
+        if self._overlay is not None and now - self._overlay_time < self.overlay_interval:
+            return self._overlay
+        self._overlay_time = now
+        stats = self.get_stats()
+        lines = [f"{stats['fps']:.1f} fps  {stats['frame']['mean']:.2f}ms  p95 {stats['frame']['p95']:.2f}ms"]
+        lines.extend(f"{name}: {section['mean']:.2f}ms  p95 {section['p95']:.2f}ms" for name, section in stats['sections'].items())
+        rendered = [font.render(line, True, color, background) for line in lines]
+        line_height = font.get_linesize()
+        self._overlay = pygame.Surface((max(line.get_width() for line in rendered), line_height * len(rendered)))
+        self._overlay.fill(background)
+        self._overlay.blits([(line, (0, i * line_height)) for i, line in enumerate(rendered)], False)
+        return self._overlay
+
+_NO_PROFILE = _nullcontext()
+
+TASK_DONE = pygame.event.custom_type() # posted when a coroutine started with GameScreen.spawn finishes
+
+def handles(*event_types: int) -> Callable[[Callable], Callable]:
+    '''
+    decorator that registers a GameScreen method as a handler for event types when the screen is created
+    :example:
+
+        class Example(GameScreen):
+            @handles(MOUSEWHEEL)
+            def scroll(self, event: pygame.event.Event):
+                self.zoom += event.y
+
+    :event_types: the pygame event types
+    :returns: the decorator
+    '''
+    def decorator(method: Callable) -> Callable:
+        method._event_types = getattr(method, '_event_types', ()) + event_types
+        return method
+    return decorator
+
+def coalesce_mouse_motion(events: list[pygame.event.Event]) -> list[pygame.event.Event]:
+    '''
+    merge every run of back to back MOUSEMOTION events into one event, keeping the order of the other events
+    the merged event has the last event's position and buttons and the sum of the relative motion
+    :events: the events
+    :returns: a new list of events
+    '''
+    coalesced = []
+    for event in events:
+        if event.type == MOUSEMOTION and coalesced and coalesced[-1].type == MOUSEMOTION:
+            last = coalesced[-1]
+            rel = (last.rel[0] + event.rel[0], last.rel[1] + event.rel[1])
+            coalesced[-1] = pygame.event.Event(MOUSEMOTION, {**event.dict, 'rel': rel})
+        else:
+            coalesced.append(event)
+    return coalesced
+
 class GameScreen:
     '''
     A class to reperesent a screen inside a pygame application
@@ -591,7 +2406,22 @@ class GameScreen:
         example.run()
     '''
 
-    def __init__(self, screen: pygame.Surface, real_window_size: Point, window_size: Point = None, frame_rate: int = 30):
+    def __init__(
+            self,
+            screen: pygame.Surface,
+            real_window_size: Point,
+            window_size: Point = None,
+            frame_rate: int = 30,
+            dirty_rects: bool = False,
+            dirty_threshold: float = 0.5,
+            scale_into_display: bool = True,
+            fixed_timestep: float = None,
+            max_simulation_steps: int = 5,
+            max_frame_skip: int = 0,
+            profiling: bool = False,
+            block_unhandled_events: bool = False,
+            coalesce_motion: bool = False,
+        ):
         '''
         :screen: The pygame surface that will be drawn onto
         :real_window_size: The height and width of the screen in real computer pixels
@@ -599,25 +2429,89 @@ class GameScreen:
             if this is smaller than real_window_size the pixels become larger
             if this is larger than real_window_size the pixels become smaller
         :frame_rate: The desired frame rate of the current screen
+        :dirty_rects: Optional. defaults to False. only push the areas passed to {self.mark_dirty} to the display each frame
+            instead of the whole window. draw methods of Button, ToggleButton, TextBox, and Circle return the area they drew
+        :dirty_threshold: Optional. defaults to 0.5. when the dirty areas cover more than this fraction of the screen
+            the whole window is pushed instead
+        :scale_into_display: Optional. defaults to True. when the window is scaled, scale straight into {screen}
+            instead of into a separate surface that is then copied onto it
+        :fixed_timestep: Optional. defaults to None. seconds per simulation step. when set, {self.simulate} is called
+            as many times as needed to keep up with real time and {self.render} is called once per frame,
+            instead of calling {self.update} once per frame
+        :max_simulation_steps: Optional. defaults to 5. the most times {self.simulate} is called in one frame,
+            time that could not be simulated is dropped so a slow frame can not make the next one slower
+        :max_frame_skip: Optional. defaults to 0. when behind, how many frames in a row can skip rendering to catch up
+        :profiling: Optional. defaults to False. time every frame and every section passed to {self.profile} in {self.profiler}
+            and draw an overlay with the timings while {self.show_profile_overlay} is True
+        :block_unhandled_events: Optional. defaults to False. block every event type without a handler with
+            pygame.event.set_blocked, so pygame drops them before they reach python. the filter is global
+            and is set again by {self.run} and {self.on}
+        :coalesce_motion: Optional. defaults to False. merge back to back MOUSEMOTION events into one each frame
         '''
         self.window_scaled = bool(window_size) and window_size != real_window_size
         self.real_screen = screen
-        self.screen = screen if not self.window_scaled else pygame.Surface(window_size)
+        self.screen = screen if not self.window_scaled else pygame.Surface(window_size, 0, screen)
         self.real_window_size = Point._make(real_window_size)
         self.window_size = Point._make(window_size if self.window_scaled else real_window_size)
         self.window_scale = self.real_window_size // self.window_size
+        self.integer_scale = self.window_size * self.window_scale == self.real_window_size
+        # transform.scale can only write into a surface of the requested size and the same format
+        self.scale_into_display = scale_into_display \
+            and screen.get_size() == tuple(self.real_window_size) \
+            and screen.get_bitsize() == self.screen.get_bitsize()
+        self.scaled_screen = None
+        if self.window_scaled and not self.scale_into_display:
+            self.scaled_screen = pygame.Surface(self.real_window_size, 0, self.screen)
         self.frame_rate = frame_rate
         self.running = False
         self.rect = self.screen.get_rect()
         self.clock = pygame.time.Clock()
         self.game_ticks = 0
+        self.frame_time = 0
+        self.fixed_timestep = fixed_timestep
+        self.max_simulation_steps = max_simulation_steps
+        self.max_frame_skip = max_frame_skip
+        self.accumulator = 0
+        self.simulation_ticks = 0
+        self.skipped_frames = 0
+        self.use_dirty_rects = dirty_rects
+        self.dirty_threshold = dirty_threshold
+        self.dirty_rects = []
+        self._last_dirty_rects = []
+        self._full_update = True
+        self.profiler = FrameProfiler() if profiling else None
+        self.show_profile_overlay = profiling
+        self.profile_font = None
+        self.backdrop = None
+        self.scene_manager = None
+        self.tasks = set()
+        self.event_recorder = None
+        self.block_unhandled_events = block_unhandled_events
+        self.coalesce_motion = coalesce_motion
+        self.event_handlers = {}
+        # the defaults look the method up when called so subclasses and instances can replace it
+        for event_type, name in ((QUIT, 'quit'), (KEYDOWN, 'key_down'), (KEYUP, 'key_up'), (MOUSEBUTTONDOWN, 'mouse_button_down'), (MOUSEBUTTONUP, 'mouse_button_up'), (TASK_DONE, 'task_done')):
+            self.event_handlers[event_type] = [lambda event, name = name: getattr(self, name)(event)]
+        for cls in reversed(type(self).__mro__):
+            for name, method in vars(cls).items():
+                for event_type in getattr(method, '_event_types', ()):
+                    handler = getattr(self, name)
+                    if handler not in self.event_handlers.setdefault(event_type, []):
+                        self.event_handlers[event_type].append(handler)
+        # a screen built by SceneManager.prewarm is on a worker thread, it gets its filter from resume when it is pushed
+        if block_unhandled_events and threading.current_thread() is threading.main_thread():
+            self.apply_event_filter()
 
     def get_scaled_mouse_pos(self) -> Point:
         pos = pygame.mouse.get_pos()
         return pos // self.window_scale
 
-    def tick(self):
-        self.clock.tick(self.frame_rate)
+    def tick(self, wait: bool = True):
+        '''
+        count a frame and set {self.frame_time}
+        :wait: Optional. defaults to True. wait so there are at most {self.frame_rate} frames a second
+        '''
+        self.frame_time = (self.clock.tick(self.frame_rate) if wait else self.clock.tick()) / 1000
         self.game_ticks += 1
         if self.game_ticks > 999999999999999999999:
             self.game_ticks = 0
@@ -634,34 +2528,555 @@ class GameScreen:
     def mouse_button_up(self, event: pygame.event.Event):
         '''Function called when a pygame key_down MOUSEBUTTONDOWN is triggered'''
 
+    def quit(self, event: pygame.event.Event):
+        '''Function called when a pygame QUIT event is triggered, exits the program'''
+        sys.exit()
+
+    def task_done(self, event: pygame.event.Event):
+        '''
+        Function called when a TASK_DONE event is triggered, calls the callback passed to {self.spawn} with the finished task
+        :raises Exception: the exception the coroutine raised, if it raised one and has no callback
+        '''
+        if event.callback is not None:
+            event.callback(event.task)
+        elif event.exception is not None:
+            raise event.exception
+
+    def spawn(self, coroutine: Coroutine, callback: Callable[[asyncio.Task], None] = None) -> asyncio.Task:
+        '''
+        start a coroutine on the asyncio event loop, so waiting on files, sockets, or other processes happens between frames
+        when it finishes a TASK_DONE event with task, result, exception, and callback is posted and handled like other events
+        can only be called while {self.run_async} is running
+        :example:
+
+            def update(self):
+                if self.save_requested:
+                    self.spawn(self.save(), lambda task: print('saved'))
+
+        :coroutine: the coroutine
+        :callback: Optional. defaults to None. called with the finished task from {self.task_done}
+        :returns: the task
+        '''
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self.tasks.add(task)
+        def done(task: asyncio.Task):
+            self.tasks.discard(task)
+            exception = None if task.cancelled() else task.exception()
+            result = None if task.cancelled() or exception is not None else task.result()
+            pygame.event.post(pygame.event.Event(TASK_DONE, task = task, result = result, exception = exception, callback = callback))
+        task.add_done_callback(done)
+        return task
+
+    def on(self, event_type: int, handler: Callable[[pygame.event.Event], None] = None) -> Callable:
+        '''
+        add a handler for an event type, can be used as a decorator
+        :example:
+
+            @screen.on(MOUSEMOTION)
+            def motion(event):
+                print(event.pos)
+
+        :event_type: the pygame event type
+        :handler: Optional. defaults to None. the function to call with the event, if None a decorator is returned
+        :returns: the handler, or a decorator that adds the handler
+        '''
+        if handler is None:
+            return lambda handler: self.on(event_type, handler)
+        self.event_handlers.setdefault(event_type, []).append(handler)
+        if self.block_unhandled_events:
+            pygame.event.set_allowed(event_type)
+        return handler
+
+    def remove_handler(self, event_type: int, handler: Callable[[pygame.event.Event], None]):
+        '''
+        remove a handler added with {self.on} or {handles}
+        :event_type: the pygame event type
+        :handler: the handler to remove
+        :raises ValueError: if the handler was not added for the event type
+        '''
+        handlers = self.event_handlers.get(event_type, [])
+        handlers.remove(handler)
+        if not handlers:
+            del self.event_handlers[event_type]
+
+    def apply_event_filter(self):
+        '''only allow the event types that have handlers into pygame's event queue'''
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(self.event_handlers))
+
+    def get_events(self) -> list[pygame.event.Event]:
+        '''
+        get this frame's events from pygame
+        :returns: the events, with mouse motion merged if {self.coalesce_motion} is True
+            they are also saved to {self.event_recorder} if it is set
+        '''
+        events = pygame.event.get()
+        if self.coalesce_motion:
+            events = coalesce_mouse_motion(events)
+        if self.event_recorder is not None:
+            self.event_recorder.record(events, self.frame_time)
+        return events
+
     def handle_event(self, event: pygame.event.Event):
-        '''Handle a pygame events'''
-        if event.type == QUIT:
-            sys.exit()
-        elif event.type == KEYDOWN:
-            self.key_down(event)
-        elif event.type == KEYUP:
-            self.key_up(event)
-        elif event.type == MOUSEBUTTONDOWN:
-            self.mouse_button_down(event)
-        elif event.type == MOUSEBUTTONUP:
-            self.mouse_button_up(event)
+        '''Call every handler for the event's type'''
+        handlers = self.event_handlers.get(event.type)
+        if handlers:
+            for handler in handlers:
+                handler(event)
 
     def update(self):
         '''Run every frame, meant for drawing and update logic'''
         self.screen.fill((0, 0, 100))
+        self.mark_dirty(self.rect)
+
+    def simulate(self, dt: float):
+        '''
+        Run every fixed step when fixed_timestep is set, meant for update logic
+        :dt: the length of the step in seconds, always {self.fixed_timestep}
+        '''
+
+    def render(self, alpha: float):
+        '''
+        Run every frame when fixed_timestep is set, meant for drawing
+        calls {self.update} unless overridden
+        :alpha: how far real time is between the last simulation step and the next one, from 0 to 1
+            e.g.: draw at previous_position + (position - previous_position) * alpha for smooth movement
+        '''
+        self.update()
+
+    def advance(self) -> bool:
+        '''
+        Run the logic and drawing for one frame
+        :returns: False if drawing was skipped to catch up, and the frame should not be presented
+        '''
+        if self.fixed_timestep is None:
+            self.draw_backdrop()
+            self.update()
+            return True
+        dt = self.fixed_timestep
+        self.accumulator += self.frame_time
+        steps = 0
+        while self.accumulator >= dt and steps < self.max_simulation_steps:
+            self.simulate(dt)
+            self.accumulator -= dt
+            self.simulation_ticks += 1
+            steps += 1
+        behind = self.accumulator >= dt
+        if behind and self.skipped_frames < self.max_frame_skip:
+            self.skipped_frames += 1
+            return False
+        if behind: # drop the time that can not be caught up on instead of falling further behind every frame
+            self.accumulator %= dt
+        self.skipped_frames = 0
+        self.draw_backdrop()
+        self.render(self.accumulator / dt)
+        return True
+
+    def draw_backdrop(self):
+        '''
+        copy {self.backdrop} onto the screen before each update, if it is set
+        it is not marked dirty, pushing the whole window once when it is set is enough since it does not change
+        '''
+        if self.backdrop is not None:
+            self.screen.blit(self.backdrop, (0, 0))
+
+    def set_backdrop(self, screen: Optional['GameScreen']):
+        '''
+        freeze another screen's last frame as this screen's backdrop, so it can be drawn over without updating the other screen
+        the backdrop surface is reused when the size does not change
+        :screen: the screen to copy, or None to remove the backdrop
+        '''
+        if screen is None:
+            self.backdrop = None
+        else:
+            if self.backdrop is None or self.backdrop.get_size() != self.screen.get_size():
+                self.backdrop = pygame.Surface(self.screen.get_size(), 0, self.screen)
+            if screen.screen.get_size() == self.backdrop.get_size():
+                self.backdrop.blit(screen.screen, (0, 0))
+            else:
+                pygame.transform.scale(screen.screen, self.backdrop.get_size(), self.backdrop)
+        self.invalidate()
+
+    def suspend(self):
+        '''Function called when a SceneManager puts another screen over this one'''
+        self.running = False
+
+    def resume(self):
+        '''Function called when this screen becomes a SceneManager's top screen again'''
+        self.running = True
+        self.clock.tick() # so the time spent suspended is not counted as one long frame
+        self.frame_time = 0
+        self.invalidate()
+        if self.block_unhandled_events: # the filter is global, the last screen created or resumed may have replaced it
+            self.apply_event_filter()
+
+    def profile(self, name: str) -> _ProfileSection | _nullcontext:
+        '''
+        time a section of a frame when profiling is turned on
+        :example:
+
+            with self.profile('physics'):
+                self.step_physics()
+
+        :name: the name of the section, the same name can be used more than once in a frame and the times are added
+        :returns: a context manager, a shared one that does nothing when profiling is off
+        '''
+        if self.profiler is None:
+            return _NO_PROFILE
+        return self.profiler.section(name)
+
+    def draw_profile_overlay(self) -> Optional[Rect]:
+        '''
+        draw the profiler's overlay in the top left corner of the window in real pixels
+        :returns: the area drawn to in real pixels, or None if nothing was drawn
+        '''
+        if self.profiler is None or not self.show_profile_overlay:
+            return None
+        if self.profile_font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            self.profile_font = pygame.font.Font(None, 18)
+        return self.real_screen.blit(self.profiler.get_overlay(self.profile_font), (0, 0))
+
+    def mark_dirty(self, *rects: Rect):
+        '''
+        mark areas of the screen as changed this frame, only used when dirty rects are turned on
+        :rects: the areas in game pixels, None is ignored so the result of a draw method can be passed directly
+        '''
+        if self.use_dirty_rects:
+            self.dirty_rects.extend(rect for rect in rects if rect is not None)
+
+    def invalidate(self):
+        '''push the whole window to the display next frame, even when dirty rects are turned on'''
+        self._full_update = True
+
+    def get_dirty_rects(self) -> Optional[list[Rect]]:
+        '''
+        merge the areas marked this frame and last frame, last frame's areas are included so things that moved are erased
+        :returns: the merged areas in game pixels, or None if the whole window should be pushed
+        '''
+        rects = self.dirty_rects + self._last_dirty_rects
+        self._last_dirty_rects = self.dirty_rects
+        self.dirty_rects = []
+        if self._full_update:
+            self._full_update = False
+            return None
+        merged = []
+        for rect in rects:
+            rect = Rect(rect).clip(self.rect)
+            if not rect:
+                continue
+            i = 0
+            while i < len(merged):
+                if merged[i].colliderect(rect):
+                    rect.union_ip(merged.pop(i))
+                    i = 0
+                else:
+                    i += 1
+            merged.append(rect)
+        if sum(rect.w * rect.h for rect in merged) > self.dirty_threshold * self.rect.w * self.rect.h:
+            return None
+        return merged
+
+    def scale_screen(self):
+        '''
+        copy the game pixels in {self.screen} onto the window in real pixels without allocating a new surface
+        transform.scale is nearest neighbor, so with an integer scale every game pixel becomes an exact block of real pixels
+        '''
+        if self.scale_into_display:
+            pygame.transform.scale(self.screen, self.real_window_size, self.real_screen)
+        else:
+            pygame.transform.scale(self.screen, self.real_window_size, self.scaled_screen)
+            self.real_screen.blit(self.scaled_screen, (0, 0))
+
+    def present(self):
+        '''Copy the screen to the window, scaling it if needed, and push it to the display'''
+        rects = self.get_dirty_rects() if self.use_dirty_rects else None
+        if rects is None:
+            if self.window_scaled:
+                with self.profile('scale'):
+                    self.scale_screen()
+            self.draw_profile_overlay()
+            with self.profile('display'):
+                pygame.display.update()
+            return
+        if self.window_scaled:
+            with self.profile('scale'):
+                scale_x = self.real_window_size.x / self.window_size.x
+                scale_y = self.real_window_size.y / self.window_size.y
+                if not self.integer_scale:
+                    self.scale_screen()
+                real_rects = []
+                for rect in rects:
+                    left, top = math.floor(rect.x * scale_x), math.floor(rect.y * scale_y)
+                    real_rect = Rect(left, top, math.ceil(rect.right * scale_x) - left, math.ceil(rect.bottom * scale_y) - top)
+                    if self.integer_scale:
+                        pygame.transform.scale(self.screen.subsurface(rect), real_rect.size, self.real_screen.subsurface(real_rect))
+                    real_rects.append(real_rect)
+                rects = real_rects
+        overlay_rect = self.draw_profile_overlay()
+        if overlay_rect is not None:
+            rects.append(overlay_rect)
+        with self.profile('display'):
+            pygame.display.update(rects)
+
+    def _run_frame_body(self):
+        '''the part of a frame that {self.run_frame} and {self.run_async} share: everything before waiting for the next frame'''
+        if self.profiler is not None:
+            self.profiler.start_frame()
+        with self.profile('events'):
+            for event in self.get_events():
+                self.handle_event(event)
+        with self.profile('update'):
+            presenting = self.advance()
+        if presenting:
+            self.present()
+
+    def run_frame(self):
+        '''Run one frame of the main loop, timing each part of it when profiling is turned on'''
+        self._run_frame_body()
+        with self.profile('tick'):
+            self.tick()
+        if self.profiler is not None:
+            self.profiler.end_frame()
 
     def run(self):
         '''Run the main loop'''
         self.running = True
+        if self.block_unhandled_events:
+            self.apply_event_filter()
         while self.running:
-            for event in pygame.event.get():
-                self.handle_event(event)
-            self.update()
-            if self.window_scaled:
-                self.real_screen.blit(pygame.transform.scale(self.screen, self.real_window_size), (0, 0))
-            pygame.display.update()
-            self.tick()
+            self.run_frame()
+
+    async def run_async(self):
+        '''
+        Run the main loop as a coroutine, waiting for the next frame with asyncio.sleep instead of blocking
+        so other tasks, like ones started with {self.spawn}, run while the screen waits
+        :example:
+
+            asyncio.run(Example().run_async())
+        '''
+        self.running = True
+        if self.block_unhandled_events:
+            self.apply_event_filter()
+        next_frame = _perf_counter()
+        while self.running:
+            self._run_frame_body()
+            with self.profile('tick'):
+                now = _perf_counter()
+                next_frame = max(next_frame + 1 / self.frame_rate, now) if self.frame_rate else now
+                await asyncio.sleep(next_frame - now) # always sleeps, even for 0, so other tasks get a turn
+                self.tick(False)
+            if self.profiler is not None:
+                self.profiler.end_frame()
+
+def _encode_event_value(value: any) -> any:
+    '''turn an event attribute into something JSON can save, or raise TypeError'''
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (tuple, list, Point)):
+        return [_encode_event_value(item) for item in value]
+    raise TypeError(f'{type(value).__name__} can not be saved')
+
+def _decode_event_value(value: any) -> any:
+    if isinstance(value, list):
+        return tuple(_decode_event_value(item) for item in value)
+    return value
+
+class EventRecorder:
+    '''
+    Saves the events a GameScreen handles every frame, one JSON line per frame, to be replayed with EventReplayer
+    each line is [frame time in milliseconds, [[event type, {attributes}], ...]]
+    attributes JSON can not save, like the window, are left out, and TASK_DONE events are not saved
+    :example:
+
+        with EventRecorder('session.jsonl') as recorder:
+            screen.event_recorder = recorder
+            screen.run()
+    '''
+
+    def __init__(self, file: str | TextIO):
+        '''
+        :file: the path to write to, or an open text file
+        '''
+        self.owns_file = isinstance(file, str)
+        self.file = open(file, 'w') if self.owns_file else file
+        self.frames = 0
+
+    @staticmethod
+    def encode_event(event: pygame.event.Event) -> list:
+        '''
+        :event: the event
+        :returns: [event type, {attributes}]
+        '''
+        attributes = {}
+        for name, value in event.dict.items():
+            try:
+                attributes[name] = _encode_event_value(value)
+            except TypeError:
+                pass
+        return [event.type, attributes]
+
+    def record(self, events: list[pygame.event.Event], frame_time: float):
+        '''
+        save a frame
+        :events: the frame's events
+        :frame_time: the frame's {GameScreen.frame_time} in seconds
+        '''
+        encoded = [self.encode_event(event) for event in events if event.type != TASK_DONE]
+        self.file.write(json.dumps([round(frame_time * 1000, 3), encoded], separators = (',', ':')))
+        self.file.write('\n')
+        self.frames += 1
+
+    def close(self):
+        if self.owns_file:
+            self.file.close()
+        else:
+            self.file.flush()
+
+    def __enter__(self) -> 'EventRecorder':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class EventReplayer:
+    '''
+    Reads events saved by EventRecorder to feed them back to a GameScreen the same way every time
+    calling it with a frame number returns that frame's events, so it can be passed as benchmark_screen's events
+    and {self.get_frame_time} can be passed as its frame_time to replay the recorded clock
+    :example:
+
+        replayer = EventReplayer('session.jsonl')
+        result = benchmark_screen(Example(), len(replayer), replayer, warmup = 0, frame_time = replayer.get_frame_time, per_frame = True)
+    '''
+
+    def __init__(self, file: str | TextIO):
+        '''
+        :file: the path to read, or an open text file
+        '''
+        if isinstance(file, str):
+            with open(file) as f:
+                lines = f.readlines()
+        else:
+            lines = file.readlines()
+        self.frame_times = []
+        self.events = []
+        for line in lines:
+            if not line.strip():
+                continue
+            frame_time, events = json.loads(line)
+            self.frame_times.append(frame_time / 1000)
+            self.events.append([
+                pygame.event.Event(event_type, {name: _decode_event_value(value) for name, value in attributes.items()})
+                for event_type, attributes in events
+            ])
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def __call__(self, frame: int) -> list[pygame.event.Event]:
+        '''
+        :frame: the frame number
+        :returns: the events of the frame, none after the recording ends
+        '''
+        return self.events[frame] if frame < len(self.events) else []
+
+    def get_frame_time(self, frame: int) -> float:
+        '''
+        :frame: the frame number
+        :returns: the recorded frame time in seconds, the last one after the recording ends
+        '''
+        if not self.frame_times:
+            return 0
+        return self.frame_times[min(frame, len(self.frame_times) - 1)]
+
+def percentile_stats(values: list[float], percentiles: tuple[int] = (50, 95, 99)) -> dict[str, float]:
+    '''
+    summarize a list of timings
+    :values: the timings
+    :percentiles: Optional. defaults to (50, 95, 99). the percentiles to include
+    :returns: a dict with mean, max, and p{n} for every percentile, all 0 when values is empty
+    '''
+    if len(values) == 0:
+        return {'mean': 0, 'max': 0, **{f'p{p}': 0 for p in percentiles}}
+    values = np.asarray(values, dtype = np.float64)
+    return {
+        'mean': float(values.mean()),
+        'max': float(values.max()),
+        **{f'p{p}': float(np.percentile(values, p)) for p in percentiles},
+    }
+
+def benchmark_screen(
+        screen: GameScreen,
+        frames: int,
+        events: list[list[pygame.event.Event]] | Callable[[int], list[pygame.event.Event]] = None,
+        warmup: int = 10,
+        frame_time: float | Callable[[int], float] = None,
+        per_frame: bool = False
+    ) -> dict:
+    '''
+    run a GameScreen for a number of frames as fast as possible and time every frame
+    run under SDL's dummy video driver (SDL_VIDEODRIVER=dummy) to benchmark without a window
+    real events are thrown away and scripted ones are passed to {screen.handle_event} instead, so every run gets the same input
+    :screen: the screen to run, it is not run with {screen.run} so it never blocks
+    :frames: the number of frames to time
+    :events: Optional. defaults to None. the events for each frame, a list indexed by frame or a function taking the frame number
+    :warmup: Optional. defaults to 10. frames to run before timing starts, they also get events
+    :frame_time: Optional. defaults to None. seconds to set {screen.frame_time} to before each frame instead of the measured time,
+        or a function taking the frame number, e.g.: an EventReplayer's get_frame_time, so time based logic runs the same every time
+    :per_frame: Optional. defaults to False. also include "frame_times", every timed frame's milliseconds, to compare runs frame by frame
+    :returns: a dict that can be saved as JSON, with the number of frames that ran and p50, p95, p99, mean, and max
+        milliseconds for the whole frame, {screen.handle_event} and {screen.advance} ("update"), and {screen.present}
+    '''
+    if frame_time is not None and not callable(frame_time):
+        fixed_frame_time = frame_time
+        frame_time = lambda frame: fixed_frame_time
+    if events is None:
+        get_events = lambda frame: ()
+    elif callable(events):
+        get_events = events
+    else:
+        get_events = lambda frame: events[frame] if frame < len(events) else ()
+    frame_rate = screen.frame_rate
+    screen.frame_rate = 0 # uncapped
+    screen.running = True
+    update_times = []
+    present_times = []
+    frame = 0
+    try:
+        while frame < warmup + frames and screen.running:
+            pygame.event.get()
+            if frame_time is not None:
+                screen.frame_time = frame_time(frame)
+            start = _perf_counter()
+            for event in get_events(frame):
+                screen.handle_event(event)
+            presenting = screen.advance()
+            updated = _perf_counter()
+            if presenting:
+                screen.present()
+            presented = _perf_counter()
+            screen.tick()
+            if frame >= warmup:
+                update_times.append((updated - start) * 1000)
+                present_times.append((presented - updated) * 1000)
+            frame += 1
+    except SystemExit: # a QUIT event or the screen exiting ends the benchmark early
+        pass
+    finally:
+        screen.frame_rate = frame_rate
+        screen.running = False
+    frame_times = [u + p for u, p in zip(update_times, present_times)]
+    result = {
+        'frames': len(update_times),
+        'frame': percentile_stats(frame_times),
+        'update': percentile_stats(update_times),
+        'present': percentile_stats(present_times),
+    }
+    if per_frame:
+        result['frame_times'] = frame_times
+    return result
 
 class MenuScreen(GameScreen):
     '''
@@ -669,8 +3084,11 @@ class MenuScreen(GameScreen):
     e.g.: Main menu, Pause menu, Options
     '''
 
-    def __init__(self, screen: pygame.Surface, real_window_size: Point, window_size: Point = None, frame_rate: int = 30):
-        super().__init__(screen, real_window_size, window_size, frame_rate)
+    def __init__(self, screen: pygame.Surface, real_window_size: Point, window_size: Point = None, frame_rate: int = 30, **kwargs):
+        '''
+        takes the same arguments as GameScreen
+        '''
+        super().__init__(screen, real_window_size, window_size, frame_rate, **kwargs)
         self.buttons = []
         self.button_index = 0
 
@@ -695,27 +3113,172 @@ class MenuScreen(GameScreen):
         if not screen:
             screen = self.screen
         for i, button in enumerate(self.buttons):
-            button.draw(screen, True if i == self.button_index and highlight else None)
+            self.mark_dirty(button.draw(screen, True if i == self.button_index and highlight else None))
 
     def update(self):
         self.draw_buttons()
 
     def mouse_button_down(self, event: pygame.event.Event):
         if event.button == 1:
+            mouse_pos = Point._make(event.pos) # the event's position instead of the current one, so replayed clicks land
             if self.window_scaled:
-                mouse_pos = self.get_scaled_mouse_pos()
-            else:
-                mouse_pos = Point._make(pygame.mouse.get_pos())
+                mouse_pos //= self.window_scale
             for i, button in enumerate(self.buttons):
                 if button.rect.collidepoint(mouse_pos):
                     self.button_index = i
                     button()
 
+class SceneManager:
+    '''
+    Runs one main loop for a stack of screens, only the top screen gets events and is updated
+    screens under it keep their surfaces and caches while they wait, so going back to them does not rebuild anything
+    :example:
+
+        class Game(GameScreen):
+            def key_down(self, event: pygame.event.Event):
+                if event.key == K_ESCAPE:
+                    self.scene_manager.push('pause', overlay = True) # the game's last frame stays behind the menu
+
+        manager = SceneManager()
+        manager.prewarm('pause', lambda: PauseMenu(screen, real_size)) # built in the background
+        manager.push(Game(screen, real_size))
+        manager.run()
+    '''
+
+    def __init__(self, workers: int = 1):
+        '''
+        :workers: Optional. defaults to 1. threads used to build screens passed to {self.prewarm}
+        '''
+        self.stack = []
+        self.screens = {}
+        self.workers = workers
+        self.running = False
+        self._executor = None
+
+    def get_screen(self, screen: GameScreen | str) -> GameScreen:
+        '''
+        :screen: a screen, or the name of one passed to {self.add} or {self.prewarm}, waiting for it to finish being built
+        :returns: the screen
+        '''
+        if not isinstance(screen, str):
+            return screen
+        found = self.screens[screen]
+        if isinstance(found, Future):
+            found = self.screens[screen] = found.result()
+            found.scene_manager = self
+        return found
+
+    def add(self, name: str, screen: GameScreen):
+        '''
+        keep a screen to push by name later
+        :name: the name
+        :screen: the screen
+        '''
+        screen.scene_manager = self
+        self.screens[name] = screen
+
+    def prewarm(self, name: str, factory: Callable[[], GameScreen]) -> Future:
+        '''
+        build a screen on a background thread, so its surfaces, fonts, and caches are ready before it is pushed
+        :name: the name to push it by
+        :factory: a function that builds the screen, it must not draw to the display
+        :returns: the future of the screen
+        '''
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.workers, 'SceneManager')
+        self.screens[name] = future = self._executor.submit(factory)
+        return future
+
+    def get_top(self) -> Optional[GameScreen]:
+        '''
+        :returns: the screen being run, or None if the stack is empty
+        '''
+        return self.stack[-1] if self.stack else None
+
+    def push(self, screen: GameScreen | str, overlay: bool = False) -> GameScreen:
+        '''
+        suspend the top screen and run another one over it
+        :screen: the screen, or its name
+        :overlay: Optional. defaults to False. use the top screen's last frame as the new screen's backdrop,
+            instead of updating the screen under it every frame
+        :returns: the screen
+        '''
+        top = self.get_top()
+        if top is not None:
+            top.suspend()
+        return self._enter(screen, top if overlay else None)
+
+    def _enter(self, screen: GameScreen | str, backdrop: Optional[GameScreen]) -> GameScreen:
+        screen = self.get_screen(screen)
+        screen.scene_manager = self
+        screen.set_backdrop(backdrop)
+        self.stack.append(screen)
+        screen.resume()
+        return screen
+
+    def pop(self) -> GameScreen:
+        '''
+        stop running the top screen and go back to the one under it, the manager stops when the stack is empty
+        :returns: the screen that was removed
+        :raises IndexError: if the stack is empty
+        '''
+        screen = self.stack.pop()
+        screen.suspend()
+        if self.stack:
+            self.stack[-1].resume()
+        return screen
+
+    def replace(self, screen: GameScreen | str, overlay: bool = False) -> GameScreen:
+        '''
+        pop the top screen and push another one
+        :screen: the screen, or its name
+        :overlay: Optional. defaults to False. same as {self.push}
+        :returns: the screen that was removed
+        '''
+        removed = self.stack.pop()
+        removed.suspend()
+        self._enter(screen, removed if overlay else None)
+        return removed
+
+    def run_frame(self):
+        '''
+        Run one frame of the top screen
+        a top screen that sets its running to False is popped
+        '''
+        top = self.stack[-1]
+        top.run_frame()
+        if not top.running and self.get_top() is top:
+            self.pop()
+
+    def run(self):
+        '''Run the main loop until the stack is empty or {self.running} is set to False'''
+        self.running = True
+        while self.running and self.stack:
+            self.run_frame()
+        self.running = False
+
 class TextBox:
     '''
     A text box that displays text for the user
     ... in a box
     '''
+    __slots__ = (
+        'text',
+        'rect',
+        'bg_color',
+        'text_color',
+        'border_radius',
+        'padding',
+        'font',
+        'center_text',
+        'text_arr_size',
+        'text_index',
+        'done',
+        'font_height',
+        'center',
+        '_layouts',
+    )
+
     def __init__(
             self,
             text: list[str],
@@ -739,51 +3302,120 @@ class TextBox:
         self.text_index = 0
         self.done = False
         self.font_height = self.font.size('Tg')[1]
+        self._layouts = {}
         self.center = Point(
             self.rect.x + self.padding.x + (self.rect.w - self.padding.x * 2) / 2,
             self.rect.y + self.padding.y + (self.rect.h - self.padding.y * 2) / 2
         )
 
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface) -> Optional[Rect]:
         '''
         draw the text box to the screen
         :screen: the screen to draw to
+        :returns: the area drawn to, or None if nothing was drawn
         '''
         if self.done:
-            return
-        pygame.draw.rect(screen, self.bg_color, self.rect, 0, self.border_radius)
+            return None
+        rect = pygame.draw.rect(screen, self.bg_color, self.rect, 0, self.border_radius)
         self.draw_text(screen)
+        return rect
 
     def draw_text(self, screen: pygame.Surface):
         '''
         draw text with wrapping
-        https://www.pygame.org/wiki/TextWrap
-        above link heavily referenced
+        the wrapped and rendered lines are cached, so drawing the same slide again is only blits
         :screen: the screen to draw to
         '''
-        y = 0
-        text = self.text[self.text_index]
-        while text:
-            text_len = len(text)
-            i = 1
-            while self.font.size(text[:i])[0] < self.rect.w - self.padding.x * 2 and i < text_len and text[i] != '\n':
-                i += 1
-            if i < text_len and text[i] != '\n':
-                new_i = text.rfind(' ', 0, i) + 1 # attempt to find the farthest space
-                if new_i: # space is found
-                    i = new_i # use found index for word wrapping
-            elif i < text_len and text[i] == '\n':
-                text = text.replace('\n', '', 1)
-            size = Point(*self.font.size(text[:i]))
-            screen.blit(
-                self.font.render(text[:i], True, self.text_color),
+        screen.blits(self.get_layout(), False)
+
+    def _layout_key(self) -> tuple:
+        '''everything the layout of the current slide depends on'''
+        return (
+            self.text[self.text_index],
+            self.font,
+            tuple(self.rect),
+            tuple(self.padding),
+            tuple(self.center),
+            self.text_color,
+            self.center_text,
+        )
+
+    def get_layout(self) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        '''
+        get the rendered lines of the current slide and where they go,
+        only wrapping and rendering again when the text, rect, or font changed
+        :returns: a list of (surface, position) that can be passed to Surface.blits
+        '''
+        key = self._layout_key()
+        cached = self._layouts.get(self.text_index)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        layout = self.render_lines(self.wrap_text(self.text[self.text_index]))
+        self._layouts[self.text_index] = (key, layout)
+        return layout
+
+    def render_lines(self, lines: list[str], start: int = 0) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        '''
+        render wrapped lines
+        :lines: the lines to render
+        :start: Optional. defaults to 0. the line number of the first line, used to place it
+        :returns: a list of (surface, position) that can be passed to Surface.blits
+        '''
+        result = []
+        for y, line in enumerate(lines, start):
+            surface = self.font.render(line, True, self.text_color)
+            result.append((
+                surface,
                 (
-                    self.center.x - size.x // 2 if self.center_text else self.rect.x + self.padding.x,
-                    self.rect.y + self.padding.y + y
+                    self.center.x - surface.get_width() // 2 if self.center_text else self.rect.x + self.padding.x,
+                    self.rect.y + self.padding.y + y * self.font_height
                 )
-            )
+            ))
+        return result
+
+    def wrap_text(self, text: str) -> list[str]:
+        '''
+        split text into lines that fit in the box
+        https://www.pygame.org/wiki/TextWrap
+        above link heavily referenced
+        :text: the text to wrap
+        :returns: the lines
+        '''
+        lines = []
+        while text:
+            i, text, _ = self._wrap_line(text)
+            lines.append(text[:i])
             text = text[i:]
-            y += self.font_height
+        return lines
+
+    def _wrap_line(self, text: str) -> tuple[int, str, int]:
+        '''
+        find where the first line of text ends
+        :text: the text left to wrap
+        :returns: the length of the first line, the text with the newline that ended the line removed,
+            and how much of the text was looked at to decide where the line ends
+        '''
+        text_size = self.font.size
+        width = self.rect.w - self.padding.x * 2
+        text_len = len(text)
+        newline = text.find('\n', 1)
+        limit = text_len if newline == -1 else newline
+        # binary search for the shortest prefix that is too wide, prefixes only get wider as they get longer
+        low, high = 1, limit
+        while low < high:
+            middle = (low + high) // 2
+            if text_size(text[:middle])[0] < width:
+                low = middle + 1
+            else:
+                high = middle
+        i = low
+        if i < text_len and text[i] != '\n':
+            new_i = text.rfind(' ', 0, i) + 1 # attempt to find the farthest space
+            if new_i: # space is found
+                i = new_i # use found index for word wrapping
+        elif i < text_len and text[i] == '\n':
+            text = text.replace('\n', '', 1)
+        return i, text, low
 
     def update(self):
         '''
@@ -797,6 +3429,8 @@ class InputBox(TextBox):
     '''
     A TextBox that updates with input taken
     '''
+    __slots__ = ('_lines', '_line_starts', '_line_reaches')
+
     def __init__(
             self,
             rect: pygame.Rect,
@@ -817,6 +3451,57 @@ class InputBox(TextBox):
             font,
             center_text,
         )
+        self._lines = []
+        self._line_starts = []
+        self._line_reaches = [] # the end of the text each line looked at to decide where it breaks
+
+    def get_layout(self) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        '''
+        get the rendered lines of the text and where they go
+        when the text was only added to or removed from the end, only the lines whose break looked at the changed part are wrapped again
+        and only lines that changed are rendered again
+        :returns: a list of (surface, position) that can be passed to Surface.blits
+        '''
+        key = self._layout_key()
+        cached = self._layouts.get(self.text_index)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        text = key[0]
+        first = 0
+        incremental = cached is not None and cached[0][1:] == key[1:] and '\n' not in text and '\n' not in cached[0][0]
+        if incremental:
+            old_text = cached[0][0]
+            if text.startswith(old_text):
+                edit = len(old_text)
+            elif old_text.startswith(text):
+                edit = len(text)
+            else:
+                edit = 0
+            # a line that reached the end of the text, or looked past the edit, can break somewhere else now
+            first = next((n for n, reach in enumerate(self._line_reaches) if reach >= edit), len(self._line_reaches))
+        start = self._line_starts[first] if first < len(self._line_starts) else 0
+        lines = self._lines[:first]
+        starts = self._line_starts[:first]
+        reaches = self._line_reaches[:first]
+        rest = text[start:]
+        while rest:
+            i, rest, reach = self._wrap_line(rest)
+            lines.append(rest[:i])
+            starts.append(start)
+            reaches.append(start + reach)
+            start += i
+            rest = rest[i:]
+        layout = cached[1][:first] if incremental else []
+        for n in range(first, len(lines)):
+            if incremental and n < len(self._lines) and self._lines[n] == lines[n]:
+                layout.append(cached[1][n])
+            else:
+                layout += self.render_lines(lines[n:n + 1], n)
+        self._lines = lines
+        self._line_starts = starts
+        self._line_reaches = reaches
+        self._layouts[self.text_index] = (key, layout)
+        return layout
 
     def update(self, event: pygame.event.Event):
         '''
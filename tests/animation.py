@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+
+import os, gc, json, tempfile
+import pygame
+from pygame_tools import *
+import unittest
+
+def save_frames(directory: str, count: int, size: tuple[int] = (8, 8)) -> list[str]:
+    paths = []
+    for i in range(count):
+        surface = pygame.Surface(size, SRCALPHA)
+        surface.fill((i * 10, 0, 0, 255))
+        paths.append(os.path.join(directory, f'{i}.png'))
+        pygame.image.save(surface, paths[-1])
+    return paths
+
+class TestAssetCache(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((10, 10))
+        self.directory = tempfile.TemporaryDirectory()
+        self.paths = save_frames(self.directory.name, 4)
+        self.frame_bytes = 8 * 8 * 4
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_shared_and_ref_counted(self):
+        cache = AssetCache()
+        a = cache.acquire(self.paths[0])
+        self.assertIs(cache.acquire(self.paths[0]), a)
+        self.assertEqual(cache.ref_counts[self.paths[0]], 2)
+        self.assertEqual(a.get_bitsize(), pygame.display.get_surface().get_bitsize())
+        cache.release(self.paths[0])
+        cache.release(self.paths[0])
+        self.assertEqual(cache.unused_bytes, self.frame_bytes)
+        self.assertIs(cache.acquire(self.paths[0]), a) # still cached
+        cache.release(self.paths[0])
+        with self.assertRaises(ValueError):
+            cache.release(self.paths[0])
+
+    def test_lru_cap(self):
+        cache = AssetCache(max_bytes = self.frame_bytes * 2)
+        for path in self.paths:
+            cache.acquire(path)
+        for path in self.paths:
+            cache.release(path)
+        self.assertEqual(list(cache.images), self.paths[2:])
+        cache.acquire(self.paths[2]) # held images are never dropped
+        cache.acquire(self.paths[0])
+        cache.acquire(self.paths[1])
+        self.assertEqual(set(cache.images), set(self.paths))
+        cache.clear()
+        self.assertEqual(set(cache.images), set(self.paths[:3]))
+        small = AssetCache(max_bytes = 0)
+        self.assertIsNotNone(small.acquire(self.paths[0]))
+        small.release(self.paths[0])
+        self.assertEqual(small.images, {})
+
+    def test_preload(self):
+        cache = AssetCache()
+        self.assertEqual(len(cache.preload(self.paths + self.paths[:1])), 4)
+        for future in cache.pending.values():
+            future.result()
+        self.assertEqual(cache.get_progress(), 1)
+        self.assertEqual(set(cache.images), set(self.paths))
+        self.assertEqual(cache.preload(self.paths), [])
+        cache.preload([os.path.join(self.directory.name, 'missing.png')])
+        with self.assertRaises(Exception):
+            cache.acquire(os.path.join(self.directory.name, 'missing.png'))
+
+    def test_animation_shares_frames(self):
+        cache = AssetCache()
+        glob_path = os.path.join(self.directory.name, '*.png')
+        a = Animation(glob_path, [1, 1, 1, 1], cache = cache)
+        b = Animation(glob_path, [2, 2, 2, 2], cache = cache)
+        self.assertIs(a.get_surface(), b.get_surface())
+        self.assertTrue(all(count == 2 for count in cache.ref_counts.values()))
+        a.release()
+        b.release()
+        self.assertEqual(cache.unused_bytes, self.frame_bytes * 4)
+
+    def test_dropped_animation_releases_frames(self):
+        cache = AssetCache()
+        glob_path = os.path.join(self.directory.name, '*.png')
+        animations = [Animation(glob_path, [1, 1, 1, 1], cache = cache) for _ in range(5)]
+        self.assertTrue(all(count == 5 for count in cache.ref_counts.values()))
+        del animations
+        gc.collect()
+        self.assertTrue(all(count == 0 for count in cache.ref_counts.values()))
+        with self.assertRaises(ValueError):
+            Animation(glob_path, [0, 0, 0, 0], cache = cache)
+        self.assertTrue(all(count == 0 for count in cache.ref_counts.values()))
+
+class TestSpriteSheets(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((10, 10))
+        self.directory = tempfile.TemporaryDirectory()
+        self.sheet_path = os.path.join(self.directory.name, 'sheet.png')
+        sheet = pygame.Surface((2 + 3 * 10 + 2 * 2, 2 + 2 * 10 + 2), SRCALPHA) # 1 margin, 2 spacing, 3x2 grid of 10x10
+        for i in range(6):
+            sheet.fill((i * 40, 0, 0, 255), Rect(1 + i % 3 * 12, 1 + i // 3 * 12, 10, 10))
+        pygame.image.save(sheet, self.sheet_path)
+        self.cache = AssetCache()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_sprite_sheet(self):
+        animation = Animation.from_sprite_sheet(self.sheet_path, (10, 10), [1] * 5, spacing = 2, margin = 1, cache = self.cache)
+        self.assertEqual(animation.frame_count, 5)
+        sheet = self.cache.images[self.sheet_path]
+        for i, (frame, _) in enumerate(animation.frames):
+            self.assertEqual(frame.get_size(), (10, 10))
+            self.assertIs(frame.get_parent(), sheet)
+            self.assertEqual(frame.get_at((5, 5)).r, i * 40)
+        self.assertEqual(self.cache.ref_counts[self.sheet_path], 1)
+        animation.release()
+        self.assertEqual(self.cache.ref_counts[self.sheet_path], 0)
+        with self.assertRaises(ValueError):
+            Animation.from_sprite_sheet(self.sheet_path, (10, 10), [1] * 7, spacing = 2, margin = 1, cache = self.cache)
+        self.assertEqual(self.cache.ref_counts[self.sheet_path], 0)
+
+    def test_atlas(self):
+        manifest_path = os.path.join(self.directory.name, 'atlas.json')
+        with open(manifest_path, 'w') as file:
+            json.dump({'image': 'sheet.png', 'frames': [{'x': 13, 'y': 1, 'w': 10, 'h': 10, 'duration': 4}, {'x': 1, 'y': 13, 'w': 10, 'h': 10, 'duration': 2}]}, file)
+        animation = Animation.from_atlas(manifest_path, cache = self.cache)
+        self.assertEqual(animation.frame_data, [4, 2])
+        self.assertEqual([frame.get_at((0, 0)).r for frame, _ in animation.frames], [40, 120])
+        with open(manifest_path, 'w') as file: # the format exported by aseprite
+            json.dump({'frames': {'a': {'frame': {'x': 25, 'y': 13, 'w': 10, 'h': 10}, 'duration': 100}}, 'meta': {'image': 'sheet.png'}}, file)
+        animation = Animation.from_atlas(manifest_path, [3], cache = self.cache)
+        self.assertEqual(animation.frames[0][0].get_at((0, 0)).r, 200)
+        self.assertEqual(animation.frame_data, [3])
+
+    def test_clip_subsurface(self):
+        surface = pygame.Surface((10, 10))
+        clipped = clip_subsurface(surface, Rect(5, 5, 10, 10))
+        self.assertEqual(clipped.get_size(), (5, 5))
+        clipped.fill('red')
+        self.assertEqual(surface.get_at((9, 9)), pygame.Color('red'))
+        self.assertEqual(surface.get_at((4, 4)), pygame.Color('black'))
+
+class TestPlayback(unittest.TestCase):
+    def setUp(self):
+        self.frames = [pygame.Surface((1, 1)) for _ in range(3)]
+
+    def animation(self, frame_data: list[float], repititions: int = None) -> Animation:
+        animation = Animation(None, frame_data, repititions)
+        animation.set_frames(self.frames, frame_data)
+        return animation
+
+    def test_game_frames(self):
+        animation = self.animation([2, 1, 1], 1)
+        indices = []
+        for _ in range(5):
+            indices.append(animation.frame_index)
+            animation.update()
+        self.assertEqual(indices, [0, 0, 1, 2, 0])
+        self.assertTrue(animation.finished)
+
+    def test_milliseconds(self):
+        animation = self.animation([100, 50, 50])
+        animation.update(120)
+        self.assertEqual((animation.frame_index, animation.frames_until_next), (1, 30))
+        animation.update(250) # skips over whole frames
+        self.assertEqual((animation.frame_index, animation.frames_until_next), (2, 30))
+        animation.seek(170)
+        self.assertEqual((animation.frame_index, animation.frames_until_next), (2, 30))
+        animation.seek(400)
+        self.assertEqual((animation.frame_index, animation.frames_until_next), (0, 100))
+
+    def test_player(self):
+        player = AnimationPlayer(self.animation([100, 50, 50]))
+        a = player.start()
+        b = player.start(offset = 100)
+        player.update(60)
+        self.assertEqual((player.get_frame_index(a), player.get_frame_index(b)), (0, 2))
+        self.assertIs(player.get_surface(b), self.frames[2])
+        player.update(60)
+        self.assertEqual(player.get_frame_indices([a, b]).tolist(), [1, 0])
+        starts = [player.start(offset) for offset in range(0, 400, 7)]
+        self.assertEqual(player.get_frame_indices(starts).tolist(), [player.get_frame_index(start) for start in starts])
+
+    def test_player_repititions(self):
+        player = AnimationPlayer(self.animation([1, 1, 1]), repititions = 2)
+        start = player.start()
+        player.update(5)
+        self.assertFalse(player.is_finished(start))
+        self.assertEqual(player.get_frame_index(start), 2)
+        player.update(1)
+        self.assertTrue(player.is_finished(start))
+        self.assertEqual(player.get_frame_index(start), 2)
+        self.assertEqual(player.get_frame_indices([start, player.start()]).tolist(), [2, 0])
+
+if __name__ == '__main__':
+    unittest.main()
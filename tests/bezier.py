@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-import pygame
+import pygame, unittest
 from pygame_tools import *
 from random import randint
 
@@ -21,5 +21,35 @@ class BezierTest(GameScreen):
             get_bezier_curve_points((0, self.window_size.y), (0, 0), self.get_scaled_mouse_pos(), 100)
         )
 
+class BezierUnitTest(unittest.TestCase):
+    def test_quadratic(self):
+        p0, p1, p2 = Point(0, 300), Point(0, 0), Point(120, 45)
+        points = get_bezier_curve_points(p0, p1, p2, 100)
+        self.assertEqual(len(points), 101)
+        for i, point in enumerate(points):
+            t = i / 100
+            self.assertAlmostEqual(point.x, (1 - t) ** 2 * p0.x + 2 * (1 - t) * t * p1.x + t ** 2 * p2.x)
+            self.assertAlmostEqual(point.y, (1 - t) ** 2 * p0.y + 2 * (1 - t) * t * p1.y + t ** 2 * p2.y)
+        self.assertEqual(get_bezier_curve_points(p0, p1, p2, 100, True), points)
+
+    def test_cubic(self):
+        p = [Point(0, 0), Point(10, 40), Point(50, -20), Point(60, 10)]
+        for i, point in enumerate(get_cubic_bezier_curve_points(*p, 10)):
+            t = i / 10
+            expected = (1 - t) ** 3 * p[0] + 3 * (1 - t) ** 2 * t * p[1] + 3 * (1 - t) * t ** 2 * p[2] + t ** 3 * p[3]
+            self.assertAlmostEqual(point.x, expected.x)
+            self.assertAlmostEqual(point.y, expected.y)
+
+    def test_flatten(self):
+        self.assertEqual(len(flatten_bezier([(0, 0), (5, 5), (10, 10)])), 2)
+        control_points = [(0, 300), (0, 0), (300, 300), (300, 0)]
+        flat = flatten_bezier(control_points, 0.5, as_array = True)
+        exact = get_bezier_points(control_points, 2000, True)
+        self.assertLess(len(flat), 100)
+        segments = [PointArray(exact[i * 2000 // (len(flat) - 1):(i + 1) * 2000 // (len(flat) - 1) + 1]) for i in range(len(flat) - 1)]
+        for i, segment in enumerate(segments):
+            self.assertLessEqual(segment.dist_from_line(flat[i], flat[i + 1]).max(), 0.5)
+
 if __name__ == '__main__':
+    unittest.main(exit = False)
     BezierTest().run()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+import pygame
+from pygame_tools import *
+import unittest
+
+def old_button_draw(button: Button, screen: pygame.Surface, override_highlight: bool = None):
+    '''the original Button.draw'''
+    pygame.draw.rect(screen, button.clicked_color if button.clicked else button.highlight_color if (override_highlight == None and button.highlight) or override_highlight else button.rect_color, button.rect, button.rect_line_width, button.border_radius)
+    if button.border_size > 0:
+        pygame.draw.rect(screen, button.border_color, button.rect, button.border_size, button.border_radius)
+    text_obj = button.font.render(button.text, button.antialias, button.font_color)
+    text_size = text_obj.get_size()
+    screen.blit(text_obj, (button.rect.centerx - text_size[0] / 2, button.rect.centery - text_size[1] / 2))
+
+class TestButton(unittest.TestCase):
+    def setUp(self):
+        pygame.font.init()
+        self.font = pygame.font.Font(None, 20)
+
+    def assertSameSurface(self, a: pygame.Surface, b: pygame.Surface):
+        self.assertEqual(pygame.image.tobytes(a, 'RGB'), pygame.image.tobytes(b, 'RGB'))
+
+    def assertDrawsLikeOriginal(self, button: Button, **kwargs):
+        expected = pygame.Surface((200, 100))
+        expected.fill((0, 0, 100))
+        clicked = button.clicked
+        old_button_draw(button, expected, **kwargs)
+        actual = pygame.Surface((200, 100))
+        actual.fill((0, 0, 100))
+        button.clicked = clicked
+        button.draw(actual, **kwargs)
+        self.assertSameSurface(actual, expected)
+
+    def test_matches_original(self):
+        for kwargs in (
+                {},
+                {'border_radius': 8, 'border_size': 2},
+                {'rect_line_width': 3, 'border_radius': 5},
+            ):
+            button = Button(None, 'Click me', Rect(20, 30, 121, 31), self.font, **kwargs)
+            self.assertDrawsLikeOriginal(button)
+            self.assertDrawsLikeOriginal(button, override_highlight = True)
+            button()
+            self.assertDrawsLikeOriginal(button)
+        self.assertDrawsLikeOriginal(Button(None, 'This text is much wider than its button', Rect(50, 30, 40, 20), self.font))
+
+    def test_cache_invalidation(self):
+        button = Button(None, 'Click me', Rect(20, 30, 120, 30), self.font)
+        screen = pygame.Surface((200, 100))
+        button.draw(screen)
+        surface = button.get_surface(False, False)
+        button.draw(screen)
+        self.assertIs(button.get_surface(False, False), surface)
+        button.text = 'Changed'
+        self.assertIsNot(button.get_surface(False, False), surface)
+        self.assertDrawsLikeOriginal(button)
+        surface = button.get_surface(False, False)
+        button.rect.w = 60
+        self.assertIsNot(button.get_surface(False, False), surface)
+        self.assertDrawsLikeOriginal(button)
+        button.rect_color = 'red'
+        self.assertDrawsLikeOriginal(button)
+
+    def test_toggle_button(self):
+        button = ToggleButton(None, 'On', 'Off', (10, 10, 80, 30), self.font, off_rect_color = 'red', border_size = 2)
+        screen = pygame.Surface((100, 50))
+        for toggled in (False, True):
+            for highlight in (False, True):
+                expected = pygame.Surface((100, 50))
+                text = button.on_text if toggled else button.off_text
+                pygame.draw.rect(expected, (button.on_highlight_color if highlight else button.on_rect_color) if toggled else (button.off_highlight_color if highlight else button.off_rect_color), button.rect)
+                pygame.draw.rect(expected, button.on_border_color if toggled else button.off_border_color, button.rect, 2)
+                text_obj = self.font.render(text, True, (0, 0, 0))
+                expected.blit(text_obj, (button.rect.centerx - text_obj.get_width() / 2, button.rect.centery - text_obj.get_height() / 2))
+                screen.fill((0, 0, 0))
+                button.toggled = toggled
+                button.draw(screen, highlight)
+                self.assertSameSurface(screen, expected)
+
+if __name__ == '__main__':
+    unittest.main()
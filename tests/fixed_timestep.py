@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+
+import pygame
+from pygame_tools import *
+
+class FixedTimestepTest(GameScreen):
+    '''a ball bouncing at a fixed 120 steps per second while drawing at 30 frames per second'''
+
+    def __init__(self):
+        pygame.init()
+        size = Point(600, 600)
+        super().__init__(pygame.display.set_mode(size), size, size // 2, fixed_timestep = 1 / 120)
+        self.position = Point(20, 20)
+        self.previous_position = Point(20, 20)
+        self.velocity = Point(90, 0)
+
+    def simulate(self, dt: float):
+        self.previous_position = Point(*self.position)
+        self.velocity.y += 300 * dt
+        self.position += self.velocity * dt
+        if self.position.y > self.window_size.y - 5:
+            self.position.y = self.window_size.y - 5
+            self.velocity.y *= -0.9
+        if not 5 <= self.position.x <= self.window_size.x - 5:
+            self.velocity.x *= -1
+
+    def render(self, alpha: float):
+        super().render(alpha)
+        position = self.previous_position + (self.position - self.previous_position) * alpha
+        pygame.draw.circle(self.screen, 'white', position, 5)
+
+if __name__ == '__main__':
+    FixedTimestepTest().run()
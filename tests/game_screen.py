@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+
+import pygame, asyncio, io, json
+from pygame_tools import *
+from unittest import mock
+import unittest
+
+class Screen(GameScreen):
+    def __init__(self, real_size: Point = (100, 100), size: Point = None, **kwargs):
+        pygame.init()
+        super().__init__(pygame.display.set_mode(real_size), real_size, size, **kwargs)
+
+    def update(self):
+        pass
+
+class TestDirtyRects(unittest.TestCase):
+    def present(self, screen: GameScreen) -> tuple:
+        with mock.patch('pygame.display.update') as update:
+            screen.present()
+        return update.call_args.args
+
+    def test_disabled(self):
+        screen = Screen()
+        screen.mark_dirty(Rect(0, 0, 5, 5))
+        self.assertEqual(self.present(screen), ())
+        self.assertEqual(screen.dirty_rects, [])
+
+    def test_merges_and_keeps_last_frame(self):
+        screen = Screen(dirty_rects = True)
+        self.assertEqual(self.present(screen), ()) # first frame is always full
+        screen.mark_dirty(Rect(0, 0, 10, 10), Rect(5, 5, 10, 10), None, Rect(50, 50, 5, 5))
+        self.assertEqual(sorted(map(tuple, self.present(screen)[0])), [(0, 0, 15, 15), (50, 50, 5, 5)])
+        screen.mark_dirty(Rect(60, 60, 5, 5))
+        self.assertEqual(sorted(map(tuple, self.present(screen)[0])), [(0, 0, 15, 15), (50, 50, 5, 5), (60, 60, 5, 5)])
+        self.assertEqual(self.present(screen), ([(60, 60, 5, 5)],))
+        self.assertEqual(self.present(screen), ([],))
+
+    def test_threshold(self):
+        screen = Screen(dirty_rects = True, dirty_threshold = 0.5)
+        self.present(screen)
+        screen.mark_dirty(Rect(0, 0, 100, 60))
+        self.assertEqual(self.present(screen), ())
+        screen.invalidate()
+        self.assertEqual(self.present(screen), ())
+
+    def test_scaled(self):
+        screen = Screen((100, 100), (50, 50), dirty_rects = True)
+        self.present(screen)
+        screen.screen.fill('red', Rect(10, 10, 5, 5))
+        screen.mark_dirty(Rect(10, 10, 5, 5))
+        self.assertEqual(self.present(screen), ([Rect(20, 20, 10, 10)],))
+        self.assertEqual(tuple(screen.real_screen.get_at((25, 25))), (255, 0, 0, 255))
+        self.assertEqual(tuple(screen.real_screen.get_at((31, 31))), (0, 0, 0, 255))
+
+    def test_menu_screen_marks_buttons(self):
+        screen = Screen(dirty_rects = True)
+        menu = MenuScreen(screen.real_screen, (100, 100), dirty_rects = True)
+        menu.buttons = [Button(None, 'a', Rect(10, 10, 20, 10), pygame.font.Font(None, 12))]
+        menu.update()
+        self.assertEqual(menu.dirty_rects, [Rect(10, 10, 20, 10)])
+
+class TestScaling(unittest.TestCase):
+    def test_matches_transform_scale(self):
+        for real_size, size, scale_into_display in (
+                ((100, 100), (50, 50), True),
+                ((100, 100), (50, 50), False),
+                ((100, 90), (40, 30), True),
+                ((100, 90), (40, 30), False),
+            ):
+            screen = Screen(real_size, size, scale_into_display = scale_into_display)
+            self.assertEqual(screen.scale_into_display, scale_into_display)
+            for x in range(size[0]):
+                screen.screen.fill((x * 5, 255 - x * 5, 100), Rect(x, x % size[1], 1, 7))
+            expected = pygame.transform.scale(screen.screen, real_size)
+            with mock.patch('pygame.display.update'):
+                screen.present()
+            self.assertEqual(pygame.image.tobytes(screen.real_screen, 'RGB'), pygame.image.tobytes(expected, 'RGB'))
+
+class FixedScreen(Screen):
+    def __init__(self, **kwargs):
+        super().__init__(fixed_timestep = 0.125, **kwargs)
+        self.steps = []
+        self.alphas = []
+
+    def simulate(self, dt: float):
+        self.steps.append(dt)
+
+    def render(self, alpha: float):
+        self.alphas.append(alpha)
+
+class TestFixedTimestep(unittest.TestCase):
+    def run_frames(self, screen: GameScreen, frame_times: list[float]) -> list[bool]:
+        results = []
+        for frame_time in frame_times:
+            screen.frame_time = frame_time
+            results.append(screen.advance())
+        return results
+
+    def test_variable_update(self):
+        screen = Screen()
+        screen.update = mock.Mock()
+        self.assertEqual(self.run_frames(screen, [0.1, 0.2]), [True, True])
+        self.assertEqual(screen.update.call_count, 2)
+
+    def test_steps_and_alpha(self):
+        screen = FixedScreen()
+        self.run_frames(screen, [0.3125, 0.1875, 0.0])
+        self.assertEqual(screen.steps, [0.125] * 4)
+        self.assertEqual(screen.simulation_ticks, 4)
+        self.assertEqual(screen.alphas, [0.5, 0, 0])
+
+    def test_spiral_cap(self):
+        screen = FixedScreen(max_simulation_steps = 3)
+        self.run_frames(screen, [1.0, 0.0])
+        self.assertEqual(len(screen.steps), 3)
+        self.assertEqual(screen.accumulator, 0)
+
+    def test_frame_skip(self):
+        screen = FixedScreen(max_simulation_steps = 2, max_frame_skip = 2)
+        self.assertEqual(self.run_frames(screen, [0.625, 0.0, 0.0, 0.0]), [False, False, True, True])
+        self.assertEqual(len(screen.steps), 5)
+        self.assertEqual(self.run_frames(screen, [2.0, 0.0, 0.0, 0.0]), [False, False, True, True])
+        self.assertEqual(len(screen.steps), 11)
+
+class TestBenchmark(unittest.TestCase):
+    def test_benchmark_screen(self):
+        screen = Screen()
+        screen.key_down = mock.Mock()
+        events = [[pygame.event.Event(KEYDOWN, key = K_a, unicode = 'a')] for _ in range(8)]
+        result = benchmark_screen(screen, 5, events, warmup = 2)
+        self.assertEqual(result['frames'], 5)
+        self.assertEqual(screen.key_down.call_count, 7)
+        self.assertEqual(screen.frame_rate, 30)
+        self.assertEqual(set(result['frame']), {'mean', 'max', 'p50', 'p95', 'p99'})
+        self.assertGreaterEqual(result['frame']['p99'], result['frame']['p50'])
+
+    def test_quit_ends_early(self):
+        screen = Screen()
+        result = benchmark_screen(screen, 10, lambda frame: [pygame.event.Event(QUIT)] if frame == 3 else [], warmup = 0)
+        self.assertEqual(result['frames'], 3)
+
+class TestProfiling(unittest.TestCase):
+    def test_disabled(self):
+        screen = Screen()
+        self.assertIsNone(screen.profiler)
+        self.assertIs(screen.profile('a'), screen.profile('b'))
+        with screen.profile('a'):
+            pass
+        self.assertIsNone(screen.draw_profile_overlay())
+
+    def test_sections(self):
+        screen = Screen(profiling = True)
+        profiler = screen.profiler
+        for frame in range(3):
+            profiler.start_frame()
+            with screen.profile('physics'):
+                with screen.profile('collisions'):
+                    pass
+            if frame == 0:
+                with screen.profile('once'):
+                    pass
+            profiler.end_frame()
+        self.assertEqual(profiler.count, 3)
+        stats = profiler.get_stats()
+        self.assertEqual(set(stats['sections']), {'physics', 'collisions', 'once'})
+        self.assertGreaterEqual(stats['sections']['physics']['mean'], stats['sections']['collisions']['mean'])
+        self.assertEqual(profiler.section_times['once'][1], 0)
+        self.assertGreaterEqual(stats['frame']['max'], stats['sections']['physics']['max'])
+
+    def test_same_section_nested(self):
+        profiler = FrameProfiler()
+        profiler.start_frame()
+        with mock.patch('pygame_tools._perf_counter', side_effect = [0, 1, 10, 20, 21]):
+            with profiler.section('physics'):
+                with profiler.section('physics'):
+                    pass
+            with profiler.section('physics'):
+                pass
+        self.assertEqual(profiler.current_sections, {'physics': 11000})
+
+    def test_ring_buffer(self):
+        profiler = FrameProfiler(history = 4)
+        for _ in range(10):
+            profiler.start_frame()
+            profiler.end_frame()
+        self.assertEqual(profiler.count, 10)
+        self.assertEqual(len(profiler._recorded(profiler.frame_times)), 4)
+        self.assertGreater(profiler.get_fps(), 0)
+
+    def test_run_and_overlay(self):
+        class OneFrame(Screen):
+            def update(self):
+                self.running = False
+        screen = OneFrame(profiling = True)
+        with mock.patch('pygame.display.update'):
+            screen.run()
+        self.assertEqual(set(screen.profiler.section_times), {'events', 'update', 'display', 'tick'})
+        overlay = screen.profiler.get_overlay(screen.profile_font)
+        self.assertIs(screen.profiler.get_overlay(screen.profile_font), overlay) # cached
+        screen.profiler.overlay_interval = 0
+        self.assertIsNot(screen.profiler.get_overlay(screen.profile_font), overlay)
+
+class TestEventDispatch(unittest.TestCase):
+    def test_defaults(self):
+        screen = Screen()
+        screen.key_down = mock.Mock()
+        screen.mouse_button_up = mock.Mock()
+        screen.handle_event(pygame.event.Event(KEYDOWN, key = K_a))
+        screen.handle_event(pygame.event.Event(MOUSEBUTTONUP, button = 1, pos = (0, 0)))
+        screen.handle_event(pygame.event.Event(MOUSEWHEEL, x = 0, y = 1))
+        screen.key_down.assert_called_once()
+        screen.mouse_button_up.assert_called_once()
+        with self.assertRaises(SystemExit):
+            screen.handle_event(pygame.event.Event(QUIT))
+
+    def test_registration(self):
+        class Wheel(Screen):
+            def __init__(self, **kwargs):
+                self.scrolled = []
+                super().__init__(**kwargs)
+
+            @handles(MOUSEWHEEL, MOUSEMOTION)
+            def scroll(self, event: pygame.event.Event):
+                self.scrolled.append(event.type)
+
+        screen = Wheel()
+        seen = []
+        @screen.on(MOUSEWHEEL)
+        def wheel(event):
+            seen.append(event.y)
+        screen.handle_event(pygame.event.Event(MOUSEWHEEL, x = 0, y = 2))
+        screen.handle_event(pygame.event.Event(MOUSEMOTION, pos = (1, 1), rel = (1, 1), buttons = (0, 0, 0)))
+        self.assertEqual(screen.scrolled, [MOUSEWHEEL, MOUSEMOTION])
+        self.assertEqual(seen, [2])
+        screen.remove_handler(MOUSEWHEEL, wheel)
+        screen.handle_event(pygame.event.Event(MOUSEWHEEL, x = 0, y = 3))
+        self.assertEqual(seen, [2])
+
+    def test_block_unhandled(self):
+        try:
+            screen = Screen(block_unhandled_events = True)
+            self.assertTrue(pygame.event.get_blocked(MOUSEMOTION))
+            self.assertFalse(pygame.event.get_blocked(KEYDOWN))
+            screen.on(MOUSEMOTION, lambda event: None)
+            self.assertFalse(pygame.event.get_blocked(MOUSEMOTION))
+        finally:
+            pygame.event.set_allowed(None)
+
+    def test_coalesce_mouse_motion(self):
+        motion = lambda x, rel: pygame.event.Event(MOUSEMOTION, pos = (x, 0), rel = (rel, 0), buttons = (0, 0, 0))
+        events = [motion(1, 1), motion(3, 2), motion(6, 3), pygame.event.Event(MOUSEBUTTONDOWN, button = 1, pos = (6, 0)), motion(7, 1)]
+        coalesced = coalesce_mouse_motion(events)
+        self.assertEqual([event.type for event in coalesced], [MOUSEMOTION, MOUSEBUTTONDOWN, MOUSEMOTION])
+        self.assertEqual((coalesced[0].pos, coalesced[0].rel), ((6, 0), (6, 0)))
+        self.assertEqual(coalesced[2].pos, (7, 0))
+
+class TestRecordReplay(unittest.TestCase):
+    def test_round_trip(self):
+        screen = Screen()
+        file = io.StringIO()
+        screen.event_recorder = EventRecorder(file)
+        pygame.event.get()
+        pygame.event.post(pygame.event.Event(KEYDOWN, key = K_a, unicode = 'a', mod = 0, window = None))
+        pygame.event.post(pygame.event.Event(MOUSEBUTTONDOWN, button = 1, pos = (3, 4), window = screen))
+        pygame.event.post(pygame.event.Event(TASK_DONE, task = None))
+        screen.frame_time = 0.0165
+        screen.get_events()
+        screen.frame_time = 0.02
+        screen.get_events()
+        screen.event_recorder.close()
+        self.assertEqual(len(file.getvalue().splitlines()), 2)
+        file.seek(0)
+        replayer = EventReplayer(file)
+        self.assertEqual(len(replayer), 2)
+        self.assertEqual(replayer.frame_times, [0.0165, 0.02])
+        key, click = replayer(0)
+        self.assertEqual((key.type, key.key, key.unicode), (KEYDOWN, K_a, 'a'))
+        self.assertEqual((click.type, click.pos, click.button), (MOUSEBUTTONDOWN, (3, 4), 1))
+        self.assertFalse(hasattr(click, 'window')) # not JSON
+        self.assertEqual(replayer(1), [])
+        self.assertEqual(replayer(5), [])
+        self.assertEqual(replayer.get_frame_time(5), 0.02)
+
+    def test_replay_benchmark(self):
+        lines = [json.dumps([100, [[KEYDOWN, {'key': K_a}]] if frame % 2 else []]) for frame in range(6)]
+        replayer = EventReplayer(io.StringIO('\n'.join(lines)))
+        runs = []
+        for _ in range(2):
+            screen = FixedScreen()
+            screen.key_down = mock.Mock()
+            result = benchmark_screen(screen, 6, replayer, warmup = 0, frame_time = replayer.get_frame_time, per_frame = True)
+            self.assertEqual(len(result['frame_times']), 6)
+            self.assertEqual(screen.key_down.call_count, 3)
+            runs.append((screen.simulation_ticks, screen.steps))
+        self.assertEqual(runs[0], runs[1])
+        self.assertEqual(runs[0][0], 4) # 0.6s at 0.125s steps, the first frame's time is set before its update
+
+    def test_menu_clicks_use_event_position(self):
+        menu = MenuScreen(Screen().real_screen, (100, 100), (50, 50))
+        button = mock.Mock(rect = Rect(10, 10, 5, 5))
+        menu.buttons = [button]
+        menu.handle_event(pygame.event.Event(MOUSEBUTTONDOWN, button = 1, pos = (24, 24)))
+        button.assert_called_once()
+
+class TestAsync(unittest.TestCase):
+    def test_run_async(self):
+        class Saving(Screen):
+            def __init__(self):
+                super().__init__(frame_rate = 200)
+                self.results = []
+                self.frames = 0
+
+            async def save(self, value: int) -> int:
+                await asyncio.sleep(0.01)
+                return value * 2
+
+            async def fail(self):
+                raise KeyError('missing')
+
+            def update(self):
+                if self.frames == 0:
+                    self.spawn(self.save(4), lambda task: self.results.append(task.result()))
+                    self.spawn(self.fail(), lambda task: self.results.append(type(task.exception())))
+                self.frames += 1
+                if len(self.results) == 2:
+                    self.running = False
+
+        screen = Saving()
+        with mock.patch('pygame.display.update'):
+            asyncio.run(asyncio.wait_for(screen.run_async(), 2))
+        self.assertEqual(sorted(map(str, screen.results)), sorted(['8', str(KeyError)]))
+        self.assertEqual(screen.tasks, set())
+        self.assertGreater(screen.frames, 1)
+
+    def test_uncaught_task_exception(self):
+        screen = Screen()
+        with self.assertRaises(KeyError):
+            screen.handle_event(pygame.event.Event(TASK_DONE, task = None, result = None, exception = KeyError(), callback = None))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 
-import pygame
+import pygame, unittest
 from pygame_tools import *
-from random import randint
+from random import randint, choice, seed
 
 class InputBoxTest(GameScreen):
 
@@ -34,5 +34,50 @@ class InputBoxTest(GameScreen):
         if self.getting_input:
             self.input_box.draw(self.screen)
 
+def key_event(unicode: str) -> pygame.event.Event:
+    return pygame.event.Event(KEYDOWN, unicode = unicode, key = 0, mod = 0)
+
+class InputBoxUnitTest(unittest.TestCase):
+    def setUp(self):
+        pygame.font.init()
+        seed(3)
+
+    def assertLayoutMatches(self, input_box: InputBox):
+        layout = input_box.get_layout()
+        lines = input_box.wrap_text(input_box.get_value())
+        self.assertEqual(input_box._lines, lines)
+        self.assertEqual(len(layout), len(lines))
+        for n, ((surface, pos), line) in enumerate(zip(layout, lines)):
+            self.assertEqual(surface.get_size(), input_box.font.size(line))
+            self.assertEqual(pos[1], input_box.rect.y + input_box.padding.y + n * input_box.font_height)
+
+    def test_typing(self):
+        for center_text in (False, True):
+            input_box = InputBox(Rect(0, 0, 120, 300), center_text = center_text)
+            for _ in range(400):
+                input_box.update(key_event(choice('abc de  fghij\x08\x08')))
+                self.assertLayoutMatches(input_box)
+            input_box.reset()
+            self.assertEqual(input_box.get_layout(), [])
+
+    def test_removing_the_last_line(self):
+        # the last line can be wider than the box, so removing a line can change how the ones before it wrap
+        input_box = InputBox(Rect(0, 0, 90, 500), font = pygame.font.Font(None, 20))
+        for c in ' WWWhjWWe\x08':
+            input_box.update(key_event(c))
+            self.assertLayoutMatches(input_box)
+        self.assertEqual(input_box._lines, [' WWWhjWW'])
+
+    def test_reuses_unchanged_lines(self):
+        input_box = InputBox(Rect(0, 0, 120, 300))
+        for c in 'the quick brown fox jumps over the lazy dog':
+            input_box.update(key_event(c))
+        before = [surface for surface, _ in input_box.get_layout()]
+        input_box.update(key_event('s'))
+        after = [surface for surface, _ in input_box.get_layout()]
+        self.assertEqual(before[:-1], after[:-1])
+        self.assertIsNot(before[-1], after[-1])
+
 if __name__ == '__main__':
+    unittest.main(exit = False)
     InputBoxTest().run()
@@ -46,6 +46,13 @@ class A:
     def __str__(self):
         return 'This is an A object'
 
+class Job:
+    def results(self) -> list[int]:
+        return [1, 2]
+
+    def executor(self) -> str:
+        return 'local'
+
 class ManyOfUnitTest(unittest.TestCase):
     m = ManyOf(A, A(), A(), A())
     def test_return(self):
@@ -55,6 +62,36 @@ class ManyOfUnitTest(unittest.TestCase):
         str(self.m)
         repr(self.m)
 
+    def test_shared_methods(self):
+        other = ManyOf(A, A())
+        self.assertIs(type(other), type(self.m))
+        self.assertIsInstance(other, ManyOf)
+        self.assertEqual(other.add(1, 2).obj_list, (3,))
+        self.assertIn('add', type(self.m).__dict__)
+        with self.assertRaises(AttributeError):
+            self.m.subtract
+        with self.assertRaises(AttributeError):
+            self.m.__len__
+
+    def test_tuple_results(self):
+        m = ManyOf(A, A(), A(), results = 'tuple')
+        self.assertEqual(m.add(1, 2), (3, 3))
+        with self.assertRaises(ValueError):
+            ManyOf(A, A(), results = 'list')
+        with self.assertRaises(ValueError):
+            ManyOf(A)
+
+    def test_executor(self):
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(2) as executor:
+            m = ManyOf(A, *(A() for _ in range(5)), executor = executor)
+            self.assertEqual(m.add(2, 2).obj_list, (4,) * 5)
+
+    def test_method_names_not_hidden(self):
+        m = ManyOf(Job, Job(), Job(), results = 'tuple')
+        self.assertEqual(m.results(), ([1, 2], [1, 2]))
+        self.assertEqual(m.executor(), ('local', 'local'))
+
 if __name__ == '__main__':
     unittest.main()
     ManyOfTest().run()
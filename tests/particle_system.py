@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+
+import pygame, unittest
+from pygame_tools import *
+from random import randint
+
+class ParticleSystemTest(GameScreen):
+
+    def __init__(self):
+        pygame.init()
+        size = Point(600, 600)
+        super().__init__(pygame.display.set_mode(size), size, (size.x // 2, size.y // 2))
+        self.center = Point(self.window_size.x // 2, self.window_size.y // 2)
+        self.particles = ParticleSystem(gravity = (0, 9.8 / 50))
+
+    def update(self):
+        super().update()
+        self.particles.update()
+        self.particles.draw(self.screen)
+        n = 50
+        color_val = np.random.randint(150, 256, n)
+        self.particles.emit(
+            n,
+            self.center,
+            np.random.randint(4, 13, n),
+            np.stack([color_val] * 3, axis = 1),
+            np.random.randint(-3, 4, (n, 2)),
+            None,
+            1,
+            np.random.randint(2, 7, n)
+        )
+
+class ParticleSystemUnitTest(unittest.TestCase):
+    def test_matches_particle(self):
+        args = [
+            ((10, 10), 6, 'white', (1, -2), None, 1, 3),
+            ((0, 5), 3, 'red', (0.5, 0), 4, None, 1),
+            ((7, 2), 10, 'blue', (-1, 1), 20, 2, 1),
+        ]
+        particles = [Particle(*arg) for arg in args]
+        system = ParticleSystem()
+        for arg in args:
+            system.emit(1, *arg)
+        for _ in range(12):
+            for particle in particles:
+                particle.update()
+            system.update()
+            particles = [particle for particle in particles if particle.alive]
+            self.assertEqual(len(system), len(particles))
+            self.assertEqual(
+                sorted(tuple(particle.center) + (particle.radius,) for particle in particles),
+                sorted(tuple(system.centers[i]) + (system.radii[i],) for i in range(len(system)))
+            )
+
+    def test_compaction(self):
+        system = ParticleSystem(capacity = 2)
+        system.emit(5, (0, 0), 1, 'white', (0, 0), np.arange(1, 6))
+        self.assertEqual(system.capacity, 5)
+        system.update()
+        self.assertEqual(len(system), 4)
+        self.assertEqual(sorted(system.lifetimes[:len(system)]), [1, 2, 3, 4])
+        system.update()
+        self.assertEqual(sorted(system.lifetimes[:len(system)]), [1, 2, 3])
+
+    def test_gravity_and_drag(self):
+        system = ParticleSystem(gravity = (0, 1), drag = 0.5)
+        system.emit(1, (0, 0), 1, 'white', (2, 0))
+        system.update()
+        self.assertEqual(tuple(system.centers[0]), (2, 0))
+        self.assertEqual(tuple(system.velocities[0]), (1, 0.5))
+
+class ParticleUnitTest(unittest.TestCase):
+    def test_slots(self):
+        particle = Particle((0, 0), 5, 'white', (1, 1), 10, 1, 2)
+        for obj in (particle, Circle((0, 0), 1, 'white'), TrueEvery(3), Button(None, 'a', Rect(0, 0, 5, 5), None)):
+            self.assertFalse(hasattr(obj, '__dict__'), type(obj).__name__)
+        with self.assertRaises(AttributeError):
+            particle.radius_decrement_timer = None
+        particle.center = (3, 4) # properties still work
+        self.assertEqual(particle.rect.center, (3, 4))
+
+    def test_center_not_shared(self):
+        emitter = Point(5, 5)
+        particle = Particle(emitter, 3, 'white', (1, 2))
+        particle.center = emitter
+        center, previous = particle.center, Point._make(particle.center)
+        particle.update()
+        self.assertIs(particle.center, center) # moved in place
+        self.assertEqual((emitter, previous, particle.center), ((5, 5), (5, 5), (6, 7)))
+        self.assertEqual(particle.rect.center, (6, 7))
+
+    def test_decay_matches_true_every(self):
+        for frames_between_decrement in (1, 2, 3):
+            particle = Particle((0, 0), 20, 'white', (0, 0), None, 1, frames_between_decrement)
+            timer = TrueEvery(frames_between_decrement)
+            radius = 20
+            for _ in range(10):
+                particle.update()
+                radius -= bool(timer())
+                self.assertEqual(particle.radius, radius)
+
+class ParticlePoolUnitTest(unittest.TestCase):
+    def test_matches_particles(self):
+        args = [dict(center = (i, 0), radius = 5, color = 'white', velocity = (1, i), lifetime = i + 1) for i in range(6)]
+        particles = [Particle(**kwargs) for kwargs in args]
+        pool = ParticlePool(4)
+        for kwargs in args:
+            pool.acquire(**kwargs)
+        for _ in range(8):
+            pool.update()
+            for particle in particles:
+                particle.update()
+            particles = [particle for particle in particles if particle.alive]
+            self.assertEqual(sorted(tuple(particle.center) for particle in pool), sorted(tuple(particle.center) for particle in particles))
+        self.assertEqual(len(pool), 0)
+        self.assertEqual(pool.get_stats(), {'active': 0, 'capacity': 6, 'high_water_mark': 6, 'allocations': 2, 'acquired': 6})
+
+    def test_reuse(self):
+        pool = ParticlePool(2)
+        center = Point(5, 5)
+        a = pool.acquire(center = center, radius = 3, color = 'red', velocity = (1, 0), lifetime = 1)
+        b = pool.acquire(center = center, radius = 4, color = 'blue', velocity = (0, 1), radius_decrement = 1)
+        self.assertIsNot(a.center, center)
+        a.update()
+        self.assertEqual(center, (5, 5))
+        self.assertEqual(list(pool), [b])
+        reused, velocity = (a.rect, a.center, a.velocity), Point(3, 3)
+        c = pool.acquire(center = (1, 2), radius = 2, color = 'green', velocity = velocity)
+        self.assertIs(c, a)
+        for new, old in zip((c.rect, c.center, c.velocity), reused):
+            self.assertIs(new, old)
+        self.assertEqual((tuple(c.center), tuple(c.rect), c.lifetime, c.alive), ((1, 2), (-1, 0, 4, 4), None, True))
+        velocity.x = 0
+        self.assertEqual(c.velocity, (3, 3))
+        self.assertEqual(pool.get_stats()['allocations'], 0)
+        pool.clear()
+        self.assertEqual(list(pool), [])
+
+class CircleRendererUnitTest(unittest.TestCase):
+    def assertSameSurface(self, a: pygame.Surface, b: pygame.Surface):
+        self.assertEqual(pygame.image.tobytes(a, 'RGB'), pygame.image.tobytes(b, 'RGB'))
+
+    def test_matches_circle_draw(self):
+        circles = [
+            Circle((20, 20), 8, 'white'),
+            Circle((40.6, 25.2), 5, (255, 0, 0), 2),
+            Circle((10, 45), 3, pygame.Color(0, 255, 0)),
+            Particle((50, 50), 6, 'white', (0, 0)),
+            Circle((30, 10), 4, [0, 0, 255]),
+        ]
+        expected = pygame.Surface((64, 64))
+        for circle in circles:
+            circle.draw(expected)
+        actual = pygame.Surface((64, 64))
+        renderer = CircleRenderer()
+        renderer.draw(actual, circles)
+        self.assertSameSurface(actual, expected)
+        self.assertEqual(len(renderer.sprites), 5)
+
+    def test_falls_back_when_full(self):
+        circles = [Circle((10 + i * 20, 10), 4 + i, 'white') for i in range(3)]
+        expected = pygame.Surface((64, 32))
+        for circle in circles:
+            circle.draw(expected)
+        actual = pygame.Surface((64, 32))
+        renderer = CircleRenderer(1)
+        renderer.draw(actual, circles)
+        self.assertSameSurface(actual, expected)
+        self.assertEqual(len(renderer.sprites), 1)
+
+    def test_particle_pool(self):
+        pool = ParticlePool(3)
+        pool.acquire(center = (10, 10), radius = 4, color = 'white', velocity = (0, 0))
+        pool.acquire(center = (30, 10), radius = 5, color = 'red', velocity = (0, 0)).alive = False
+        pool.acquire(center = (50, 20), radius = 6, color = 'blue', velocity = (0, 0))
+        expected = pygame.Surface((64, 32))
+        Circle((10, 10), 4, 'white').draw(expected)
+        Circle((50, 20), 6, 'blue').draw(expected)
+        actual = pygame.Surface((64, 32))
+        pool.draw(actual, CircleRenderer())
+        self.assertSameSurface(actual, expected)
+        self.assertEqual(len(pool), 2)
+
+    def test_particle_system(self):
+        system = ParticleSystem()
+        system.emit(2, ((10.4, 10), (30, 20.6)), (4, 7), ((255, 0, 0), (0, 0, 255)), (0, 0))
+        expected = pygame.Surface((64, 32))
+        Circle((10.4, 10), 4, (255, 0, 0)).draw(expected)
+        Circle((30, 20.6), 7, (0, 0, 255)).draw(expected)
+        actual = pygame.Surface((64, 32))
+        system.draw(actual)
+        self.assertSameSurface(actual, expected)
+
+    def test_particle_system_rounding(self):
+        centers = ((10.5, 12.5), (31.5, 20.5), (-2.5, 4.5), (60.5, -1.5))
+        system = ParticleSystem()
+        system.emit(len(centers), centers, 5, 'white', (0, 0))
+        expected = pygame.Surface((64, 32))
+        for center in centers:
+            Circle(center, 5, 'white').draw(expected)
+        actual = pygame.Surface((64, 32))
+        system.draw(actual)
+        self.assertSameSurface(actual, expected)
+
+if __name__ == '__main__':
+    unittest.main(exit = False)
+    ParticleSystemTest().run()
@@ -11,33 +11,28 @@ class ParticleTest(GameScreen):
         size = Point(600, 600)
         super().__init__(pygame.display.set_mode(size), size, (size.x // 2, size.y // 2))
         self.center = Point(self.window_size.x // 2, self.window_size.y // 2)
-        self.particles = []
+        self.particles = ParticlePool(512)
 
     def update(self):
         super().update()
-        i = 0
-        while i < len(self.particles):
-            if not self.particles[i].alive:
-                self.particles.remove(self.particles[i])
-            else:
-                self.particles[i].update()
-                # gravity
-                self.particles[i].velocity.y += 9.8 / 50
-                self.particles[i].draw(self.screen)
-                i += 1
+        for particle in self.particles:
+            particle.update()
+            # gravity
+            particle.velocity.y += 9.8 / 50
+            particle.draw(self.screen)
         self.add_particle()
 
     def add_particle(self):
         color_val = randint(150, 255)
-        self.particles.append(Particle(
-            self.center,
-            randint(4, 12),
-            (color_val, color_val, color_val),
-            (randint(-3, 3), randint(-3, 3)),
-            None,
-            1,
-            randint(2, 6)
-        ))
+        self.particles.acquire(
+            center = self.center,
+            radius = randint(4, 12),
+            color = (color_val, color_val, color_val),
+            velocity = (randint(-3, 3), randint(-3, 3)),
+            lifetime = None,
+            radius_decrement = 1,
+            frames_between_decrement = randint(2, 6)
+        )
 
 if __name__ == '__main__':
     ParticleTest().run()
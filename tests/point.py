@@ -37,6 +37,22 @@ class TestPoint(unittest.TestCase):
         self.assertEqual(Point(3, 2) // (2, 3), (3 // 2, 2 // 3))
         self.assertEqual((3, 1) // Point(4, 3), (3 // 4, 1 // 3))
 
+    def test_inplace(self):
+        p = Point(1, 2)
+        q = p
+        p += Point(1, 1)
+        self.assertIs(p, q)
+        self.assertEqual(p, (2, 3))
+        p -= (1, 2)
+        self.assertEqual(p, (1, 1))
+        p *= 3
+        self.assertEqual(p, (3, 3))
+        p /= (2, 3)
+        self.assertEqual(p, (1.5, 1))
+        self.assertIs(p, q)
+        p += PointArray([(1, 1)])
+        self.assertIsInstance(p, PointArray)
+
     def test_floor_ceil(self):
         p = Point(1.5, 2.5)
         self.assertEqual(math.floor(p), (1, 2))
@@ -55,6 +71,25 @@ class TestPoint(unittest.TestCase):
     def test_rotate(self):
         self.assertEqual(math.floor(Point(4, 4).rotate(math.pi / 2)), (-4, 4))
 
+    def test_rotation(self):
+        points = [Point(i, j) for i in range(-3, 4) for j in range(-3, 4)]
+        for center in (None, (2, -1)):
+            rotation = Rotation(0.7, center)
+            expected = [point.rotate(0.7, center) for point in points]
+            for a, b, c in zip(expected, rotate_many(points, 0.7, center), rotation.apply_many(PointArray(points))):
+                self.assertAlmostEqual(a.x, b.x)
+                self.assertAlmostEqual(a.y, b.y)
+                self.assertAlmostEqual(a.x, c.x)
+                self.assertAlmostEqual(a.y, c.y)
+            for point in points:
+                a = rotation.inverse()(rotation(point))
+                self.assertAlmostEqual(a.x, point.x)
+                self.assertAlmostEqual(a.y, point.y)
+                b = point.rotate_ccw(0.7, center)
+                c = rotation.inverse()(point)
+                self.assertAlmostEqual(b.x, c.x)
+                self.assertAlmostEqual(b.y, c.y)
+
     def test_dist(self):
         points = [
             Point(i, j)
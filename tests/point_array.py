@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+import pygame
+from pygame_tools import *
+import unittest
+
+POINTS = [(1, 2), (-3, 4.5), (0, 0), (7, -2)]
+
+class TestPointArray(unittest.TestCase):
+    def setUp(self):
+        self.array = PointArray(POINTS)
+        self.points = [Point(*point) for point in POINTS]
+
+    def assertMatches(self, array: PointArray, points: list[Point]):
+        self.assertEqual(len(array), len(points))
+        for a, b in zip(array, points):
+            self.assertAlmostEqual(a.x, b.x)
+            self.assertAlmostEqual(a.y, b.y)
+
+    def test_operators(self):
+        for other in (3, 2.5, Point(2, -1), (4, 2)):
+            self.assertMatches(self.array + other, [p + other for p in self.points])
+            self.assertMatches(other + self.array, [other + p for p in self.points])
+            self.assertMatches(self.array - other, [p - other for p in self.points])
+            self.assertMatches(other - self.array, [other - p for p in self.points])
+            self.assertMatches(self.array * other, [p * other for p in self.points])
+            self.assertMatches(other * self.array, [other * p for p in self.points])
+            self.assertMatches(self.array / other, [p / other for p in self.points])
+            self.assertMatches(self.array // other, [p // other for p in self.points])
+        self.assertMatches(-self.array, [-p for p in self.points])
+        self.assertMatches(self.array + self.array, [p + p for p in self.points])
+        self.assertMatches(self.array.array + self.array, [p + p for p in self.points])
+
+    def test_floor_ceil_abs(self):
+        self.assertMatches(math.floor(self.array), [math.floor(p) for p in self.points])
+        self.assertMatches(math.ceil(self.array), [math.ceil(p) for p in self.points])
+        self.assertMatches(abs(self.array), [abs(p) for p in self.points])
+
+    def test_eq(self):
+        self.assertEqual(self.array, PointArray(POINTS))
+        self.assertEqual(self.array, POINTS)
+        self.assertNotEqual(self.array, PointArray(POINTS[:-1]))
+        self.assertNotEqual(self.array, self.array + 1)
+        same = PointArray([(2, 3)] * 3)
+        self.assertEqual(same, Point(2, 3))
+        self.assertEqual(Point(2, 3), same)
+        self.assertEqual(same, (2, 3))
+        self.assertNotEqual(self.array, Point(1, 2))
+        self.assertNotEqual(PointArray([(2, 3)]), [(2, 3), (2, 3)])
+        self.assertNotEqual(self.array, [(1, 2), (3, 4), (5, 6)])
+
+    def test_rotate(self):
+        for center in (None, Point(2, 3)):
+            self.assertMatches(self.array.rotate(1.2, center), [p.rotate(1.2, center) for p in self.points])
+            self.assertMatches(self.array.rotate_ccw(1.2, center), [p.rotate_ccw(1.2, center) for p in self.points])
+
+    def test_dist(self):
+        for a, b in zip(self.array.dist((2, 3)), self.points):
+            self.assertAlmostEqual(a, b.dist((2, 3)))
+        for a, b in zip(self.array.dist_from_line((0, 1), (5, 4)), self.points):
+            self.assertAlmostEqual(a, b.dist_from_line((0, 1), (5, 4)))
+        for a, b in zip(self.array.dist_from_line((1, 1), (1, 1)), self.points):
+            self.assertAlmostEqual(a, b.dist_from_line((1, 1), (1, 1)))
+
+    def test_indexing(self):
+        self.assertEqual(self.array[1], Point(-3, 4.5))
+        self.assertIsInstance(self.array[1:], PointArray)
+        self.assertEqual(self.array[np.int64(1)], Point(-3, 4.5))
+        self.assertIsInstance(self.array[np.argmax(self.array.y)], Point)
+        self.array[0] = (9, 9)
+        self.assertEqual(self.array[0], (9, 9))
+        self.assertEqual(self.array.x.tolist(), [9, -3, 0, 7])
+
+    def test_no_copy(self):
+        data = np.zeros((3, 2))
+        self.assertTrue(np.shares_memory(PointArray(data).array, data))
+
+    def test_draw(self):
+        surface = pygame.Surface((10, 10))
+        pygame.draw.lines(surface, 'white', False, PointArray([(0, 0), (5, 5), (9, 0)]))
+        pygame.draw.polygon(surface, 'white', PointArray([(0, 0), (5, 5), (9, 0)]).array)
+
+if __name__ == '__main__':
+    unittest.main()
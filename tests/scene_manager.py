@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+import pygame
+from pygame_tools import *
+from unittest import mock
+import unittest
+
+class Screen(GameScreen):
+    def __init__(self, color: pygame.Color, size: Point = None, frames: int = None, surface: pygame.Surface = None, block_unhandled_events: bool = False):
+        if surface is None:
+            pygame.init()
+            surface = pygame.display.set_mode((100, 100))
+        super().__init__(surface, (100, 100), size, frame_rate = 0, block_unhandled_events = block_unhandled_events)
+        self.color = color
+        self.frames = frames
+        self.updates = 0
+
+    def update(self):
+        self.updates += 1
+        if self.color is not None:
+            self.screen.fill(self.color)
+        if self.updates == self.frames:
+            self.running = False
+
+class Overlay(Screen):
+    def update(self):
+        super().update()
+        self.screen.fill('white', Rect(0, 0, 10, 10))
+
+class MotionScreen(Screen):
+    @handles(MOUSEMOTION)
+    def motion(self, event: pygame.event.Event):
+        pass
+
+class TestSceneManager(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch('pygame.display.update')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_push_and_pop(self):
+        manager = SceneManager()
+        game = manager.push(Screen('red'))
+        manager.run_frame()
+        menu = manager.push(Screen('blue'))
+        self.assertFalse(game.running)
+        self.assertIs(menu.scene_manager, manager)
+        manager.run_frame()
+        manager.run_frame()
+        self.assertEqual((game.updates, menu.updates), (1, 2))
+        self.assertIs(manager.pop(), menu)
+        self.assertTrue(game.running)
+        self.assertEqual(game.frame_time, 0)
+        manager.run_frame()
+        self.assertEqual((game.updates, menu.updates), (2, 2))
+
+    def test_overlay_backdrop(self):
+        manager = SceneManager()
+        game = manager.push(Screen('red', (50, 50)))
+        manager.run_frame()
+        overlay = manager.push(Overlay(None), overlay = True)
+        manager.run_frame()
+        self.assertEqual(game.updates, 1)
+        self.assertEqual(overlay.screen.get_at((5, 5)), pygame.Color('white'))
+        self.assertEqual(overlay.screen.get_at((50, 50)), pygame.Color('red'))
+        backdrop = overlay.backdrop
+        manager.pop()
+        game.color = 'green'
+        manager.run_frame()
+        manager.push(overlay, overlay = True)
+        self.assertIs(overlay.backdrop, backdrop) # reused
+        manager.run_frame()
+        self.assertEqual(overlay.screen.get_at((50, 50)), pygame.Color('green'))
+
+    def test_run_until_empty(self):
+        manager = SceneManager()
+        game = manager.push(Screen('red', frames = 3))
+        menu = manager.push(Screen('blue', frames = 2))
+        manager.run()
+        self.assertEqual((game.updates, menu.updates), (3, 2))
+        self.assertEqual(manager.stack, [])
+
+    def test_prewarm_and_replace(self):
+        pygame.init()
+        manager = SceneManager()
+        # the factory runs on a worker thread, so it only builds an off-screen surface and never touches the display
+        future = manager.prewarm('menu', lambda: Screen('blue', surface = pygame.Surface((100, 100))))
+        manager.add('game', Screen('red'))
+        game = manager.push('game')
+        manager.run_frame()
+        menu = future.result()
+        self.assertIs(manager.replace('menu', overlay = True), game)
+        self.assertEqual(manager.stack, [menu])
+        self.assertIsNotNone(menu.backdrop)
+        self.assertIs(manager.get_screen('menu'), menu)
+
+    def test_event_filter_follows_top(self):
+        manager = SceneManager()
+        motion = MotionScreen('blue', block_unhandled_events = True)
+        game = Screen('red', block_unhandled_events = True) # built last, so its filter is the one pygame has
+        self.addCleanup(pygame.event.set_allowed, None)
+        self.assertTrue(pygame.event.get_blocked(MOUSEMOTION))
+        manager.push(game)
+        manager.push(motion)
+        self.assertFalse(pygame.event.get_blocked(MOUSEMOTION))
+        manager.pop()
+        self.assertTrue(pygame.event.get_blocked(MOUSEMOTION))
+
+    def test_prewarm_does_not_set_the_filter(self):
+        pygame.init()
+        manager = SceneManager()
+        with mock.patch('pygame.event.set_blocked') as set_blocked:
+            manager.prewarm('menu', lambda: MotionScreen('blue', surface = pygame.Surface((100, 100)), block_unhandled_events = True)).result()
+            set_blocked.assert_not_called()
+            manager.push('menu')
+            set_blocked.assert_called_once_with(None)
+
+if __name__ == '__main__':
+    unittest.main()
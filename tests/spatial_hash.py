@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+import pygame
+from pygame_tools import *
+from random import randint, seed
+import unittest
+
+class TestSpatialHash(unittest.TestCase):
+    def setUp(self):
+        seed(1)
+        self.circles = [Circle((randint(-50, 300), randint(-50, 300)), randint(1, 20), 'white') for _ in range(200)]
+        self.grid = SpatialHash(16)
+        for circle in self.circles:
+            self.grid.insert(circle)
+
+    def test_pairs(self):
+        expected = {
+            frozenset((a, b))
+            for i, a in enumerate(self.circles)
+            for b in self.circles[i + 1:]
+            if a.rect.colliderect(b.rect)
+        }
+        actual = [frozenset(pair) for pair in self.grid.pairs()]
+        self.assertEqual(len(actual), len(set(actual)))
+        self.assertEqual(set(actual), expected)
+
+    def test_queries(self):
+        for point in [(x, y) for x in range(-40, 300, 23) for y in range(-40, 300, 31)]:
+            self.assertEqual(
+                set(self.grid.query_point(point)),
+                {circle for circle in self.circles if circle.collide_point(point)}
+            )
+            self.assertEqual(
+                set(self.grid.query_radius(point, 12)),
+                {circle for circle in self.circles if Point.distance(circle.center, point) <= 12 + circle.radius}
+            )
+            rect = Rect(point, (25, 10))
+            self.assertEqual(
+                set(self.grid.query_rect(rect)),
+                {circle for circle in self.circles if rect.colliderect(circle.rect)}
+            )
+
+    def test_incremental_update(self):
+        circle = self.circles[0]
+        circle.center = (1000, 1000)
+        self.assertEqual(self.grid.query_point((1000, 1000)), [circle])
+        circle.radius = 100
+        self.assertIn(circle, self.grid.query_point((1090, 1000)))
+        particle = Particle((500, 500), 5, 'white', (20, 0))
+        self.grid.insert(particle)
+        particle.update()
+        self.assertEqual(self.grid.query_point((520, 500)), [particle])
+        self.grid.remove(particle)
+        particle.update()
+        self.assertNotIn(particle, self.grid)
+        self.assertEqual(self.grid.query_point((540, 500)), [])
+
+    def test_one_grid_per_circle(self):
+        circle = self.circles[0]
+        other = SpatialHash(50)
+        with self.assertRaises(ValueError):
+            other.insert(circle)
+        self.assertNotIn(circle, other)
+        self.grid.remove(circle)
+        other.insert(circle)
+        circle.center = (1000, 1000)
+        self.assertEqual(other.query_point((1000, 1000)), [circle])
+
+    def test_rect_objects(self):
+        grid = SpatialHash(10)
+        button = Button(None, 'text', Rect(5, 5, 30, 10), None)
+        grid.insert(button)
+        self.assertEqual(grid.query_point((34, 14)), [button])
+        self.assertEqual(grid.query_point((35, 14)), [])
+        self.assertEqual(grid.query_radius((40, 10), 5), [button])
+        button.rect.x = 100
+        grid.update(button)
+        self.assertEqual(grid.query_point((110, 10)), [button])
+        grid.clear()
+        self.assertEqual(len(grid), 0)
+        self.assertEqual(grid.cells, {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 
-import pygame
+import pygame, unittest
 from pygame_tools import *
-from random import randint
+from random import randint, choice, seed
 
 class TextBoxTest(GameScreen):
 
@@ -28,5 +28,48 @@ class TextBoxTest(GameScreen):
         super().update()
         self.text_box.draw(self.screen)
 
+def reference_wrap(text_box: TextBox, text: str) -> list[str]:
+    '''the original character by character wrapping loop'''
+    lines = []
+    while text:
+        text_len = len(text)
+        i = 1
+        while text_box.font.size(text[:i])[0] < text_box.rect.w - text_box.padding.x * 2 and i < text_len and text[i] != '\n':
+            i += 1
+        if i < text_len and text[i] != '\n':
+            new_i = text.rfind(' ', 0, i) + 1
+            if new_i:
+                i = new_i
+        elif i < text_len and text[i] == '\n':
+            text = text.replace('\n', '', 1)
+        lines.append(text[:i])
+        text = text[i:]
+    return lines
+
+class TextBoxUnitTest(unittest.TestCase):
+    def setUp(self):
+        pygame.font.init()
+        seed(2)
+
+    def test_wrap_matches_reference(self):
+        for width in (40, 120, 300):
+            text_box = TextBox([''], Rect(0, 0, width, 100))
+            for _ in range(30):
+                text = ''.join(choice('abcdefghij WXYZ\n.') for _ in range(randint(0, 200)))
+                self.assertEqual(text_box.wrap_text(text), reference_wrap(text_box, text))
+
+    def test_layout_cache(self):
+        text_box = TextBox(['first slide', 'second slide'], Rect(0, 0, 100, 100))
+        layout = text_box.get_layout()
+        self.assertIs(text_box.get_layout(), layout)
+        text_box.text[0] = 'changed'
+        self.assertIsNot(text_box.get_layout(), layout)
+        layout = text_box.get_layout()
+        text_box.rect.w = 50
+        self.assertIsNot(text_box.get_layout(), layout)
+        text_box.update()
+        self.assertEqual(len(text_box.get_layout()), len(text_box.wrap_text('second slide')))
+
 if __name__ == '__main__':
+    unittest.main(exit = False)
     TextBoxTest().run()